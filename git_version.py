@@ -0,0 +1,790 @@
+# This file helps to compute a version number in source trees obtained from
+# git-archive tarball (such as those provided by githubs download-from-tag
+# feature). Distribution tarballs (built by setup.py sdist) and build
+# directories (produced by setup.py build) will contain a much shorter file
+# that just contains the computed version number.
+
+# This file is released into the public domain. Generated by
+# versioneer-0.15+dev (https://github.com/warner/python-versioneer)
+
+"""Git implementation of _version.py."""
+
+# re and subprocess are only imported when needed, to keep importing
+# _version.py cheap
+import os
+# --BEGIN STRATEGY vcs
+import errno
+import sys
+import time
+# --END STRATEGY
+
+
+def get_keywords():
+    """Get the keywords needed to look up the version information."""
+    # these strings will be replaced by git during git-archive.
+    # setup.py/versioneer.py will grep for the variable names, so they must
+    # each be defined on a line of their own. _version.py will just call
+    # get_keywords().
+    git_refnames = "$Format:%d$"
+    git_full = "$Format:%H$"
+    git_describe = "$Format:%(describe:tags=true,match=tag-*)$"
+    keywords = {"refnames": git_refnames, "full": git_full,
+                "describe": git_describe}
+    return keywords
+
+
+class VersioneerConfig:
+
+    """Container for Versioneer configuration parameters."""
+
+
+def get_config():
+    """Create, populate and return the VersioneerConfig() object."""
+    # these strings are filled in when 'setup.py versioneer' creates
+    # _version.py
+    cfg = VersioneerConfig()
+    cfg.VCS = "git"
+    cfg.style = "pep440"
+    cfg.tag_prefix = "tag-"
+    cfg.parentdir_prefix = "parentdir_prefix"
+    cfg.versionfile_source = "versionfile_source"
+    cfg.first_parent = False
+    cfg.short_hash_length = None
+    cfg.strategies = ['keywords', 'file', 'vcs', 'parentdir']
+    cfg.verbose = False
+    return cfg
+
+
+class NotThisMethod(Exception):
+
+    """Exception raised if a method is not valid for the current scenario."""
+
+
+LONG_VERSION_PY = {}
+HANDLERS = {}
+
+
+def register_vcs_handler(vcs, method):  # decorator
+    """Decorator to mark a method as the handler for a particular VCS."""
+    def decorate(f):
+        """Store f in HANDLERS[vcs][method]."""
+        if vcs not in HANDLERS:
+            HANDLERS[vcs] = {}
+        HANDLERS[vcs][method] = f
+        return f
+    return decorate
+
+
+# --BEGIN STRATEGY vcs
+class CommandTimeoutError(Exception):
+
+    """Exception raised if a command was killed for running too long."""
+
+
+def run_command(commands, args, cwd=None, verbose=False, hide_stderr=False,
+                timeout=None, env=None):
+    """Call the given command(s).
+
+    If env is given, it replaces the environment of the child.
+
+    If timeout (in seconds) is given and the command is still running when
+    it expires, the child is killed and CommandTimeoutError is raised.
+    """
+    assert isinstance(commands, list)
+    if timeout is not None and timeout <= 0:
+        raise CommandTimeoutError("no time left to run %s"
+                                  % str(commands[:1] + args))
+    import subprocess
+    p = None
+    for c in commands:
+        try:
+            dispcmd = str([c] + args)
+            # remember shell=False, so use git.cmd on windows, not just git
+            p = subprocess.Popen([c] + args, cwd=cwd, env=env,
+                                 stdout=subprocess.PIPE,
+                                 stderr=(subprocess.PIPE if hide_stderr
+                                         else None))
+            break
+        except EnvironmentError:
+            e = sys.exc_info()[1]
+            if e.errno == errno.ENOENT:
+                continue
+            if verbose:
+                print("unable to run %s" % dispcmd)
+                print(e)
+            return None
+    else:
+        if verbose:
+            print("unable to find command, tried %s" % (commands,))
+        return None
+    expired = []
+    if timeout is not None:
+        import threading
+
+        def kill():
+            expired.append(True)
+            try:
+                p.kill()
+            except EnvironmentError:
+                pass  # it finished on its own in the meantime
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    try:
+        stdout = p.communicate()[0].strip()
+    finally:
+        if timeout is not None:
+            timer.cancel()
+    if expired:
+        if verbose:
+            print("killed %s after %ss" % (dispcmd, timeout))
+        raise CommandTimeoutError("%s timed out after %ss"
+                                  % (dispcmd, timeout))
+    if sys.version_info[0] >= 3:
+        stdout = stdout.decode()
+    if p.returncode != 0:
+        if verbose:
+            print("unable to run %s (error)" % dispcmd)
+        return None
+    return stdout
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY parentdir
+def versions_from_parentdir(parentdir_prefix, root, verbose):
+    """Try to determine the version from the parent directory name.
+
+    Source tarballs conventionally unpack into a directory that includes
+    both the project name and a version string.
+    """
+    dirname = os.path.basename(root)
+    if not dirname.startswith(parentdir_prefix):
+        if verbose:
+            print("guessing rootdir is '%s', but '%s' doesn't start with "
+                  "prefix '%s'" % (root, dirname, parentdir_prefix))
+        raise NotThisMethod("rootdir doesn't start with parentdir_prefix")
+    return {"version": dirname[len(parentdir_prefix):],
+            "full-revisionid": None,
+            "dirty": False, "error": None}
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY vcs
+def versions_from_metadata(package, verbose, versionfile=None):
+    """Get the version of the installed distribution that provides package.
+
+    This answers from installed metadata (a .dist-info or .egg-info found on
+    sys.path, including inside zipapps and PEX files) without running any
+    subprocess, for installs that have no source checkout next to them.
+
+    If versionfile is given, only a distribution that installed that very
+    file counts, so an older install of the same project somewhere on
+    sys.path cannot answer for a source tree.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            raise NotThisMethod("no importlib.metadata")
+
+    def owns(dist):
+        if versionfile is None:
+            return True
+        target = os.path.realpath(versionfile)
+        for path in dist.files or []:
+            if (os.path.basename(str(path)) == os.path.basename(target)
+                    and os.path.realpath(str(dist.locate_file(path)))
+                    == target):
+                return True
+        if verbose:
+            print("distribution '%s' did not install %s"
+                  % (dist.metadata["Name"], versionfile))
+        return False
+
+    def find(names):
+        for name in names:
+            try:
+                dist = metadata.distribution(name)
+            except metadata.PackageNotFoundError:
+                continue
+            if owns(dist):
+                return dist
+        return None
+
+    dist = find([package])
+    if dist is None:
+        # the distribution may be named differently than the package it
+        # provides. packages_distributions() is py3.10+, and has to look at
+        # every installed distribution, so only ask it if we must.
+        try:
+            names = metadata.packages_distributions().get(package, [])
+        except AttributeError:
+            names = []
+        dist = find(names)
+    if dist is None or not dist.version:
+        if verbose:
+            print("no installed distribution provides '%s'" % package)
+        raise NotThisMethod("no installed distribution metadata")
+    return {"version": dist.version, "full-revisionid": None,
+            "dirty": False, "error": None}
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY keywords
+def git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                     short_hash_length=None):
+    """Get version pieces from an expanded %(describe) keyword, if any.
+
+    git-2.35 and later expand $Format:%(describe:...)$ during git-archive
+    into TAG or TAG-NUM-gHEX, which tells us the distance that the %d
+    refnames cannot. Older versions of git leave the placeholder alone, and
+    commits with no matching tag expand it to an empty string. For those
+    this returns None, and the caller falls back to the refnames.
+    """
+    describe = keywords.get("describe", "").strip()
+    if not describe or describe.startswith(("$Format", "%(")):
+        if verbose:
+            print("no usable describe keyword")
+        return None
+    import re
+    full = keywords["full"].strip()
+    pieces = {"long": full, "short": full[:short_hash_length or 7],
+              "dirty": False, "error": None, "distance": 0}
+    mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', describe)
+    if mo:
+        full_tag = mo.group(1)
+        pieces["distance"] = int(mo.group(2))
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+    else:
+        full_tag = describe  # exactly on the tag
+    if not full_tag.startswith(tag_prefix):
+        if verbose:
+            print("tag '%s' doesn't start with prefix '%s'"
+                  % (full_tag, tag_prefix))
+        return None
+    pieces["closest-tag"] = full_tag[len(tag_prefix):]
+    if verbose:
+        print("got pieces from describe keyword: %s" % describe)
+    return pieces
+
+
+@register_vcs_handler("git", "keywords")
+def git_versions_from_keywords(keywords, tag_prefix, verbose, style=None,
+                               short_hash_length=None):
+    """Get version information from git keywords."""
+    if not keywords:
+        raise NotThisMethod("no keywords at all, weird")
+    refnames = keywords["refnames"].strip()
+    if refnames.startswith("$Format"):
+        if verbose:
+            print("keywords are unexpanded, not using")
+        raise NotThisMethod("unexpanded keywords, not a git-archive tarball")
+    pieces = git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                              short_hash_length)
+    if pieces:
+        return render(pieces, style)
+    import re
+    refs = set([r.strip() for r in refnames.strip("()").split(",")])
+    # starting in git-1.8.3, tags are listed as "tag: foo-1.0" instead of
+    # just "foo-1.0". If we see a "tag: " prefix, prefer those.
+    TAG = "tag: "
+    tags = set([r[len(TAG):] for r in refs if r.startswith(TAG)])
+    if not tags:
+        # Either we're using git < 1.8.3, or there really are no tags. We use
+        # a heuristic: assume all version tags have a digit. The old git %d
+        # expansion behaves like git log --decorate=short and strips out the
+        # refs/heads/ and refs/tags/ prefixes that would let us distinguish
+        # between branches and tags. By ignoring refnames without digits, we
+        # filter out many common branch names like "release" and
+        # "stabilization", as well as "HEAD" and "master".
+        tags = set([r for r in refs if re.search(r'\d', r)])
+        if verbose:
+            print("discarding '%s', no digits" % ",".join(refs-tags))
+    if verbose:
+        print("likely tags: %s" % ",".join(sorted(tags)))
+    for ref in sorted(tags):
+        # sorting will prefer e.g. "2.0" over "2.0rc1"
+        if ref.startswith(tag_prefix):
+            r = ref[len(tag_prefix):]
+            if verbose:
+                print("picking %s" % r)
+            return {"version": r,
+                    "full-revisionid": keywords["full"].strip(),
+                    "dirty": False, "error": None
+                    }
+    # no suitable tags, so version is "0+unknown", but full hex is still there
+    if verbose:
+        print("no suitable tags, using unknown + full revision id")
+    return {"version": "0+unknown",
+            "full-revisionid": keywords["full"].strip(),
+            "dirty": False, "error": "no suitable tags"}
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY vcs
+# variables that would point version queries at some other repository (or
+# another part of this one), and are dropped from the caller's environment
+GIT_ENV_REDIRECTS = ["GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE",
+                     "GIT_OBJECT_DIRECTORY",
+                     "GIT_ALTERNATE_OBJECT_DIRECTORIES", "GIT_COMMON_DIR",
+                     "GIT_NAMESPACE", "GIT_CEILING_DIRECTORIES",
+                     "GIT_DISCOVERY_ACROSS_FILESYSTEM", "GIT_PREFIX",
+                     "GIT_REPLACE_REF_BASE", "GIT_GRAFT_FILE",
+                     "GIT_SHALLOW_FILE"]
+
+# a copy of the source tree that leaves out .git can find the original
+# checkout through this file, see git_root_from_pointer()
+POINTER_FILE = ".versioneer-root"
+
+
+def git_root_from_pointer(root, verbose):
+    """Return the checkout that root's pointer file names, or None.
+
+    Builds that copy the source tree somewhere else (like pip's legacy
+    builds) can leave out .git, which may be huge, when the tree has a
+    pointer file written by 'versioneer.py pointer': git then runs in the
+    original checkout instead.
+    """
+    pointer = os.path.join(root, POINTER_FILE)
+    if not os.path.exists(pointer):
+        return None
+    import json
+    try:
+        with open(pointer, "r") as f:
+            target = json.load(f)["root"]
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        if verbose:
+            print("unable to read %s" % pointer)
+        return None
+    if not os.path.exists(os.path.join(target, ".git")):
+        if verbose:
+            print("%s points at %s, which has no .git" % (pointer, target))
+        return None
+    if verbose:
+        print("using the checkout in %s, named by %s" % (target, pointer))
+    return target
+
+
+def git_readonly_env():
+    """Build the environment for read-only git queries.
+
+    'git status' normally refreshes the index, which takes index.lock and
+    makes parallel builds of one checkout fight over it. GIT_OPTIONAL_LOCKS=0
+    (git-2.15) tells it to skip that optional write. ('git describe --dirty'
+    refreshes the index regardless, so we do not use it.)
+    Pagers, prompts and the fsmonitor hook are switched off too, and the
+    GIT_ENV_REDIRECTS variables (set e.g. inside git hooks) are dropped so
+    they cannot point the query at some other repository. Everything else
+    is passed through, since git itself may need it to run at all.
+    """
+    env = os.environ.copy()
+    for name in GIT_ENV_REDIRECTS:
+        env.pop(name, None)
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["GIT_PAGER"] = "cat"
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    # same as 'git -c core.fsmonitor=false' (git-2.31), after any such
+    # settings the caller made
+    try:
+        count = int(env.get("GIT_CONFIG_COUNT", "0"))
+    except ValueError:
+        count = 0
+    env["GIT_CONFIG_COUNT"] = str(count + 1)
+    env["GIT_CONFIG_KEY_%d" % count] = "core.fsmonitor"
+    env["GIT_CONFIG_VALUE_%d" % count] = "false"
+    return env
+
+
+@register_vcs_handler("git", "pieces_from_vcs")
+def git_pieces_from_vcs(tag_prefix, root, verbose, run_command=run_command,
+                        first_parent=False, short_hash_length=None,
+                        deadline=None):
+    """Get version from 'git describe' in the root of the source tree.
+
+    This only gets called if the git-archive 'subst' keywords were *not*
+    expanded, and _version.py hasn't already been rewritten with a short
+    version string, meaning we're inside a checked out source tree.
+
+    If first_parent is True, the closest tag and the distance are computed
+    along the first-parent (mainline) history only, ignoring any side
+    branches that were merged in.
+
+    If short_hash_length is set, the short revision id is always that many
+    characters of the full one, and git is told not to spend time looking
+    for a unique abbreviation.
+
+    If deadline (a time.time() value) is given, any git command still running
+    when it passes is killed, and CommandTimeoutError is raised.
+    """
+    if not os.path.exists(os.path.join(root, ".git")):
+        root = git_root_from_pointer(root, verbose) or root
+    if not os.path.exists(os.path.join(root, ".git")):
+        if verbose:
+            print("no .git in %s" % root)
+        raise NotThisMethod("no .git directory")
+    import re
+
+    GITS = ["git"]
+    if sys.platform == "win32":
+        GITS = ["git.cmd", "git.exe"]
+
+    env = git_readonly_env()
+
+    def run_git(args):
+        if deadline is None:
+            return run_command(GITS, args, cwd=root, env=env)
+        return run_command(GITS, args, cwd=root, env=env,
+                           timeout=deadline - time.time())
+
+    # if there is a tag matching tag_prefix, this yields TAG-NUM-gHEX
+    # if there isn't one, this yields HEX (no NUM)
+    describe_args = ["describe", "--tags", "--always", "--long",
+                     "--match", "%s*" % tag_prefix]
+    if first_parent:
+        # --first-parent was added in git-1.8.4
+        describe_args.append("--first-parent")
+    if short_hash_length:
+        # a full-length hash is unique by definition, so git can skip the
+        # object lookups it would do to disambiguate a shorter one
+        describe_args.append("--abbrev=40")
+    describe_out = run_git(describe_args)
+    # --long was added in git-1.5.5
+    if describe_out is None:
+        raise NotThisMethod("'git describe' failed")
+    describe_out = describe_out.strip()
+    full_out = run_git(["rev-parse", "HEAD"])
+    if full_out is None:
+        raise NotThisMethod("'git rev-parse' failed")
+    full_out = full_out.strip()
+    # 'git describe --dirty' would also tell us this, but it rewrites the
+    # index even with GIT_OPTIONAL_LOCKS=0. Untracked files do not count,
+    # just as they don't for --dirty.
+    status_out = run_git(["status", "--porcelain", "--untracked-files=no"])
+    if status_out is None:
+        raise NotThisMethod("'git status' failed")
+
+    pieces = {}
+    pieces["long"] = full_out
+    # maybe improved later, unless short_hash_length pins it
+    pieces["short"] = full_out[:short_hash_length or 7]
+    pieces["error"] = None
+    pieces["dirty"] = bool(status_out.strip())
+
+    # parse describe_out. It will be like TAG-NUM-gHEX or HEX.
+    # TAG might have hyphens.
+    git_describe = describe_out
+
+    if "-" in git_describe:
+        # TAG-NUM-gHEX
+        mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', git_describe)
+        if not mo:
+            # unparseable. Maybe git-describe is misbehaving?
+            pieces["error"] = ("unable to parse git-describe output: '%s'"
+                               % describe_out)
+            return pieces
+
+        # tag
+        full_tag = mo.group(1)
+        if not full_tag.startswith(tag_prefix):
+            if verbose:
+                fmt = "tag '%s' doesn't start with prefix '%s'"
+                print(fmt % (full_tag, tag_prefix))
+            pieces["error"] = ("tag '%s' doesn't start with prefix '%s'"
+                               % (full_tag, tag_prefix))
+            return pieces
+        pieces["closest-tag"] = full_tag[len(tag_prefix):]
+
+        # distance: number of commits since tag
+        pieces["distance"] = int(mo.group(2))
+
+        # commit: short hex revision ID
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+
+    else:
+        # HEX: no tags
+        pieces["closest-tag"] = None
+        count_args = ["rev-list", "HEAD", "--count"]
+        if first_parent:
+            count_args.append("--first-parent")
+        count_out = run_git(count_args)
+        pieces["distance"] = int(count_out)  # total number of commits
+
+    return pieces
+# --END STRATEGY
+
+
+# --BEGIN STYLE pep440 pep440-post
+def plus_or_dot(pieces):
+    """Return a + if we don't already have one, else return a ."""
+    if "+" in pieces.get("closest-tag", ""):
+        return "."
+    return "+"
+# --END STYLE
+
+
+# --BEGIN STYLE pep440
+def render_pep440(pieces):
+    """Build up version string, with post-release "local version identifier".
+
+    Our goal: TAG[+DISTANCE.gHEX[.dirty]] . Note that if you
+    get a tagged build and then dirty it, you'll get TAG+0.gHEX.dirty
+
+    Exceptions:
+    1: no tags. git_describe was just HEX. 0+untagged.DISTANCE.gHEX[.dirty]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += plus_or_dot(pieces)
+            rendered += "%d.g%s" % (pieces["distance"], pieces["short"])
+            if pieces["dirty"]:
+                rendered += ".dirty"
+    else:
+        # exception #1
+        rendered = "0+untagged.%d.g%s" % (pieces["distance"],
+                                          pieces["short"])
+        if pieces["dirty"]:
+            rendered += ".dirty"
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE pep440-pre
+def render_pep440_pre(pieces):
+    """TAG[.post.devDISTANCE] -- No -dirty.
+
+    Exceptions:
+    1: no tags. 0.post.devDISTANCE
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"]:
+            rendered += ".post.dev%d" % pieces["distance"]
+    else:
+        # exception #1
+        rendered = "0.post.dev%d" % pieces["distance"]
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE pep440-post
+def render_pep440_post(pieces):
+    """TAG[.postDISTANCE[.dev0]+gHEX] .
+
+    The ".dev0" means dirty. Note that .dev0 sorts backwards
+    (a dirty tree will appear "older" than the corresponding clean one),
+    but you shouldn't be releasing software with -dirty anyways.
+
+    Exceptions:
+    1: no tags. 0.postDISTANCE[.dev0]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += ".post%d" % pieces["distance"]
+            if pieces["dirty"]:
+                rendered += ".dev0"
+            rendered += plus_or_dot(pieces)
+            rendered += "g%s" % pieces["short"]
+    else:
+        # exception #1
+        rendered = "0.post%d" % pieces["distance"]
+        if pieces["dirty"]:
+            rendered += ".dev0"
+        rendered += "+g%s" % pieces["short"]
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE pep440-old
+def render_pep440_old(pieces):
+    """TAG[.postDISTANCE[.dev0]] .
+
+    The ".dev0" means dirty.
+
+    Eexceptions:
+    1: no tags. 0.postDISTANCE[.dev0]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += ".post%d" % pieces["distance"]
+            if pieces["dirty"]:
+                rendered += ".dev0"
+    else:
+        # exception #1
+        rendered = "0.post%d" % pieces["distance"]
+        if pieces["dirty"]:
+            rendered += ".dev0"
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE git-describe
+def render_git_describe(pieces):
+    """TAG[-DISTANCE-gHEX][-dirty].
+
+    Like 'git describe --tags --dirty --always'.
+
+    Exceptions:
+    1: no tags. HEX[-dirty]  (note: no 'g' prefix)
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"]:
+            rendered += "-%d-g%s" % (pieces["distance"], pieces["short"])
+    else:
+        # exception #1
+        rendered = pieces["short"]
+    if pieces["dirty"]:
+        rendered += "-dirty"
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE git-describe-long
+def render_git_describe_long(pieces):
+    """TAG-DISTANCE-gHEX[-dirty].
+
+    Like 'git describe --tags --dirty --always -long'.
+    The distance/hash is unconditional.
+
+    Exceptions:
+    1: no tags. HEX[-dirty]  (note: no 'g' prefix)
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        rendered += "-%d-g%s" % (pieces["distance"], pieces["short"])
+    else:
+        # exception #1
+        rendered = pieces["short"]
+    if pieces["dirty"]:
+        rendered += "-dirty"
+    return rendered
+# --END STYLE
+
+
+def render(pieces, style):
+    """Render the given version pieces into the requested style."""
+    if pieces["error"]:
+        return {"version": "unknown",
+                "full-revisionid": pieces.get("long"),
+                "dirty": None,
+                "error": pieces["error"]}
+
+    if not style or style == "default":
+        style = "pep440"  # the default
+
+    # each style is tested separately, so that 'versioneer.py setup' can
+    # leave out the ones a project doesn't use
+    rendered = None
+    # --BEGIN STYLE pep440
+    if style == "pep440":
+        rendered = render_pep440(pieces)
+    # --END STYLE
+    # --BEGIN STYLE pep440-pre
+    if style == "pep440-pre":
+        rendered = render_pep440_pre(pieces)
+    # --END STYLE
+    # --BEGIN STYLE pep440-post
+    if style == "pep440-post":
+        rendered = render_pep440_post(pieces)
+    # --END STYLE
+    # --BEGIN STYLE pep440-old
+    if style == "pep440-old":
+        rendered = render_pep440_old(pieces)
+    # --END STYLE
+    # --BEGIN STYLE git-describe
+    if style == "git-describe":
+        rendered = render_git_describe(pieces)
+    # --END STYLE
+    # --BEGIN STYLE git-describe-long
+    if style == "git-describe-long":
+        rendered = render_git_describe_long(pieces)
+    # --END STYLE
+    if rendered is None:
+        raise ValueError("unknown style '%s'" % style)
+
+    return {"version": rendered, "full-revisionid": pieces["long"],
+            "dirty": pieces["dirty"], "error": None}
+
+
+def get_versions():
+    """Get version information or return default if unable to do so."""
+    # I am in _version.py, which lives at ROOT/VERSIONFILE_SOURCE. If we have
+    # __file__, we can work backwards from there to the root. Some
+    # py2exe/bbfreeze/non-CPython implementations don't do __file__, in which
+    # case we can only use expanded keywords.
+
+    cfg = get_config()
+    # --BEGIN STRATEGY keywords vcs parentdir
+    verbose = cfg.verbose
+    # --END STRATEGY
+
+    # setup.cfg's strategies= may also name "file" and "env", which only
+    # setup.py can use: this file *is* the versionfile, and the environment
+    # of whoever imports it says nothing about how it was built
+    root = None
+    for strategy in cfg.strategies:
+        # --BEGIN STRATEGY keywords
+        if strategy == "keywords":
+            try:
+                return git_versions_from_keywords(
+                    get_keywords(), cfg.tag_prefix, verbose, style=cfg.style,
+                    short_hash_length=cfg.short_hash_length)
+            except NotThisMethod:
+                continue
+        # --END STRATEGY
+        if strategy not in ("vcs", "parentdir"):
+            continue
+
+        if root is None:
+            try:
+                root = os.path.realpath(__file__)
+                # versionfile_source is the relative path from the top of
+                # the source tree (where the .git directory might live) to
+                # this file. Invert this to find the root from __file__.
+                for i in cfg.versionfile_source.split('/'):
+                    root = os.path.dirname(root)
+            except NameError:
+                return {"version": "0+unknown", "full-revisionid": None,
+                        "dirty": None,
+                        "error": "unable to find root of source tree"}
+
+        # --BEGIN STRATEGY vcs
+        if strategy == "vcs":
+            try:
+                pieces = git_pieces_from_vcs(
+                    cfg.tag_prefix, root, verbose,
+                    first_parent=cfg.first_parent,
+                    short_hash_length=cfg.short_hash_length)
+                return render(pieces, cfg.style)
+            except NotThisMethod:
+                pass
+
+            # no checkout (git_pieces_from_vcs() gives up without running
+            # git if there is no .git), so maybe this file was installed:
+            # ask the metadata of the distribution that put it here
+            try:
+                return versions_from_metadata(__name__.split(".")[0],
+                                              verbose, versionfile=__file__)
+            except NotThisMethod:
+                pass
+        # --END STRATEGY
+
+        # --BEGIN STRATEGY parentdir
+        if strategy == "parentdir":
+            try:
+                if cfg.parentdir_prefix:
+                    return versions_from_parentdir(cfg.parentdir_prefix,
+                                                   root, verbose)
+            except NotThisMethod:
+                pass
+        # --END STRATEGY
+
+    return {"version": "0+unknown", "full-revisionid": None,
+            "dirty": None,
+            "error": "unable to compute version"}
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-import os, base64, tempfile, io
+import os, ast, base64, tempfile, io, zlib
 from os import path
 from setuptools import setup, Command
 from distutils.command.build_scripts import build_scripts
@@ -12,6 +12,12 @@ the conventional 'from PROJECT import _version' pattern) by asking your
 version-control system about the current tree.
 """
 
+SLIM_DOCSTRING = """
+This is the slim build of versioneer.py. For its documentation, see
+https://github.com/warner/python-versioneer or the README.md that ships with
+the full build.
+"""
+
 # as nice as it'd be to versioneer ourselves, that sounds messy.
 VERSION = "0.15+dev"
 
@@ -19,7 +25,8 @@ VERSION = "0.15+dev"
 def ver(s):
     return s.replace("@VERSIONEER-VERSION@", VERSION)
 
-def get(fn, add_ver=False, unquote=False, do_strip=False, do_readme=False):
+def get(fn, add_ver=False, unquote=False, do_strip=False, do_readme=False,
+        keep_sections=False):
     with open(fn) as f:
         text = f.read()
 
@@ -39,6 +46,12 @@ def get(fn, add_ver=False, unquote=False, do_strip=False, do_readme=False):
         lines = [line for line in text.split("\n")
                  if not line.endswith("# --STRIP DURING BUILD")]
         text = "\n".join(lines)
+    if not keep_sections:
+        # '# --BEGIN STYLE pep440'-type markers only matter in the
+        # _version.py template, which 'versioneer.py setup' trims with them
+        lines = [line for line in text.split("\n")
+                 if not line.strip().startswith(("# --BEGIN ", "# --END "))]
+        text = "\n".join(lines)
     if do_readme:
         text = text.replace("@README@", get("README.md"))
     return text
@@ -53,37 +66,85 @@ def get_vcs_list():
             in os.listdir(project_path)
             if path.isdir(path.join(project_path, filename))]
 
+def drop_sections(text, kind):
+    """Remove the '# --BEGIN KIND' .. '# --END KIND' sections from text."""
+    lines = []
+    depth = 0
+    for line in text.split("\n"):
+        if line.strip().startswith("# --BEGIN %s" % kind):
+            depth += 1
+        elif depth and line.strip().startswith("# --END %s" % kind):
+            depth -= 1
+        elif not depth:
+            lines.append(line)
+    return "\n".join(lines)
+
 def generate_long_version_py(VCS):
     s = io.StringIO()
-    s.write(get("src/%s/long_header.py" % VCS, add_ver=True, do_strip=True))
-    for piece in ["src/subprocess_helper.py",
-                  "src/from_parentdir.py",
-                  "src/%s/from_keywords.py" % VCS,
-                  "src/%s/from_vcs.py" % VCS,
-                  "src/render.py",
-                  "src/%s/long_get_versions.py" % VCS]:
-        s.write(get(piece, unquote=True, do_strip=True))
+    s.write(get("src/%s/long_header.py" % VCS, add_ver=True, do_strip=True,
+                keep_sections=True))
+    # each piece is marked with the strategies that need it, so that
+    # 'versioneer.py setup' can leave out the ones a project doesn't use
+    for piece, strategy in [("src/subprocess_helper.py", "vcs"),
+                            ("src/from_parentdir.py", "parentdir"),
+                            ("src/from_metadata.py", "vcs"),
+                            ("src/%s/from_keywords.py" % VCS, "keywords"),
+                            ("src/%s/from_vcs.py" % VCS, "vcs"),
+                            ("src/render.py", None),
+                            ("src/%s/long_get_versions.py" % VCS, None)]:
+        text = get(piece, unquote=True, do_strip=True, keep_sections=True)
+        # _version.py never needs the code that only versioneer.py uses,
+        # and the blank lines before it would pile up on the next piece
+        text = drop_sections(text, "SETUP").rstrip("\n") + "\n"
+        if strategy:
+            text = ("\n\n# --BEGIN STRATEGY %s\n%s\n# --END STRATEGY\n"
+                    % (strategy, text.strip("\n")))
+        s.write(text)
     return s.getvalue()
 
-def generate_versioneer_py():
+def generate_versioneer_py(slim=False):
     s = io.StringIO()
-    s.write(get("src/header.py", add_ver=True, do_readme=True))
+    if slim:
+        # the README makes up a third of versioneer.py, and would be
+        # compiled every time it is imported without a usable .pyc
+        header = get("src/header.py", add_ver=True)
+        s.write(header.replace("@README@", SLIM_DOCSTRING))
+    else:
+        s.write(get("src/header.py", add_ver=True, do_readme=True))
     s.write(get("src/subprocess_helper.py", do_strip=True))
 
     for VCS in get_vcs_list():
-        s.write(u("LONG_VERSION_PY['%s'] = '''\n" % VCS))
-        s.write(generate_long_version_py(VCS))
-        s.write(u("'''\n"))
+        if slim:
+            # compress the value the full build's string literal would have
+            template = ast.literal_eval(u("'''\n") +
+                                        generate_long_version_py(VCS) +
+                                        u("'''"))
+            z = zlib.compress(template.encode("utf-8"), 9)
+            z = base64.b64encode(z).decode("ascii")
+            lines = [z[i:i+76] for i in range(0, len(z), 76)]
+            s.write(u("LONG_VERSION_PY_COMPRESSED['%s'] = '''\n" % VCS))
+            s.write(u("\n".join(lines) + "\n"))
+            s.write(u("'''\n"))
+        else:
+            s.write(u("LONG_VERSION_PY['%s'] = '''\n" % VCS))
+            s.write(generate_long_version_py(VCS))
+            s.write(u("'''\n"))
 
         s.write(get("src/%s/from_keywords.py" % VCS, do_strip=True))
         s.write(get("src/%s/from_vcs.py" % VCS, do_strip=True))
 
         s.write(get("src/%s/install.py" % VCS, do_strip=True))
+        s.write(get("src/%s/fingerprint.py" % VCS, do_strip=True))
+        s.write(get("src/%s/from_cache.py" % VCS, do_strip=True))
 
     s.write(get("src/from_parentdir.py", do_strip=True))
+    s.write(get("src/from_env.py", do_strip=True))
+    s.write(get("src/manifest.py", do_strip=True))
     s.write(get("src/from_file.py", add_ver=True, do_strip=True))
+    s.write(get("src/from_archive.py", do_strip=True))
     s.write(get("src/render.py", do_strip=True))
     s.write(get("src/get_versions.py", do_strip=True))
+    s.write(get("src/fingerprint.py", do_strip=True))
     s.write(get("src/cmdclass.py", do_strip=True))
     s.write(get("src/setupfunc.py", do_strip=True))
 
@@ -92,15 +153,19 @@ def generate_versioneer_py():
 
 class make_versioneer(Command):
     description = "create standalone versioneer.py"
-    user_options = []
-    boolean_options = []
+    user_options = [("slim", None,
+                     "leave out the README and compress the templates"),
+                    ("output=", "o", "where to write it [versioneer.py]")]
+    boolean_options = ["slim"]
     def initialize_options(self):
-        pass
+        self.slim = False
+        self.output = None
     def finalize_options(self):
-        pass
+        if self.output is None:
+            self.output = "versioneer.py"
     def run(self):
-        with open("versioneer.py", "w") as f:
-            f.write(generate_versioneer_py().decode("utf8"))
+        with open(self.output, "w") as f:
+            f.write(generate_versioneer_py(slim=self.slim).decode("utf8"))
         return 0
 
 class make_long_version_py_git(Command):
@@ -119,21 +184,28 @@ class make_long_version_py_git(Command):
                     {"DOLLAR": "$",
                      "STYLE": "pep440",
                      "TAG_PREFIX": "tag-",
+                     "DESCRIBE": "%(describe:tags=true,match=tag-*)",
                      "PARENTDIR_PREFIX": "parentdir_prefix",
                      "VERSIONFILE_SOURCE": "versionfile_source",
+                     "FIRST_PARENT": False,
+                     "SHORT_HASH_LENGTH": None,
+                     "STRATEGIES": ["keywords", "file", "vcs", "parentdir"],
                      })
         return 0
 
 class my_build_scripts(build_scripts):
     def run(self):
-        v = generate_versioneer_py()
-        v_b64 = base64.b64encode(v).decode("ascii")
-        lines = [v_b64[i:i+60] for i in range(0, len(v_b64), 60)]
-        v_b64 = "\n".join(lines)+"\n"
+        def b64(v):
+            v_b64 = base64.b64encode(v).decode("ascii")
+            lines = [v_b64[i:i+60] for i in range(0, len(v_b64), 60)]
+            return "\n".join(lines)+"\n"
 
         with open("src/installer.py") as f:
             s = f.read()
-        s = ver(s.replace("@VERSIONEER-INSTALLER@", v_b64))
+        s = s.replace("@VERSIONEER-INSTALLER@", b64(generate_versioneer_py()))
+        s = s.replace("@VERSIONEER-INSTALLER-SLIM@",
+                      b64(generate_versioneer_py(slim=True)))
+        s = ver(s)
 
         tempdir = tempfile.mkdtemp()
         installer = os.path.join(tempdir, "versioneer")
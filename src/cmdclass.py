@@ -1,28 +1,48 @@
 import os, sys # --STRIP DURING BUILD
-LONG_VERSION_PY = {} # --STRIP DURING BUILD
 def get_version(): pass # --STRIP DURING BUILD
 def get_versions(): pass # --STRIP DURING BUILD
 def get_root(): pass # --STRIP DURING BUILD
+def get_versioneer_for_root(): pass # --STRIP DURING BUILD
 def get_config_from_root(): pass # --STRIP DURING BUILD
 def write_to_version_file(): pass # --STRIP DURING BUILD
+def write_depfile(): pass # --STRIP DURING BUILD
+class VersioneerBadRootError(Exception): pass # --STRIP DURING BUILD
+
+
+def copy_to_overlay(overlay, root, versionfile_source):
+    """Copy the package holding versionfile_source into the overlay dir.
+
+    The whole top-level package is copied, since that is what the module
+    finder will pick up once the overlay is first on the search path.
+    Returns the path of the copied versionfile.
+    """
+    import shutil
+    source = os.path.join(root, versionfile_source)
+    top = os.path.dirname(source)
+    if not os.path.exists(os.path.join(top, "__init__.py")):
+        # _version.py is a top-level module, not part of a package
+        shutil.copy(source, overlay)
+        return os.path.join(overlay, os.path.basename(source))
+    while os.path.exists(os.path.join(os.path.dirname(top), "__init__.py")):
+        top = os.path.dirname(top)
+    copy = os.path.join(overlay, os.path.basename(top))
+    shutil.copytree(top, copy,
+                    ignore=shutil.ignore_patterns("*.pyc", "__pycache__"))
+    return os.path.join(copy, os.path.relpath(source, top))
 
 
 def get_cmdclass():
     """Get the custom setuptools/distutils subclasses used by Versioneer."""
-    if "versioneer" in sys.modules:
-        del sys.modules["versioneer"]
-        # this fixes the "python setup.py develop" case (also 'install' and
-        # 'easy_install .'), in which subdependencies of the main project are
-        # built (using setup.py bdist_egg) in the same python process. Assume
-        # a main project A and a dependency B, which use different versions
-        # of Versioneer. A's setup.py imports A's Versioneer, leaving it in
-        # sys.modules by the time B's setup.py is executed, causing B to run
-        # with the wrong versioneer. Setuptools wraps the sub-dep builds in a
-        # sandbox that restores sys.modules to it's pre-build state, so the
-        # parent is protected against the child's "import versioneer". By
-        # removing ourselves from sys.modules here, before the child build
-        # happens, we protect the child from the parent's versioneer too.
-        # Also see https://github.com/warner/python-versioneer/issues/52
+    # this fixes the "python setup.py develop" case (also 'install' and
+    # 'easy_install .'), in which subdependencies of the main project are
+    # built (using setup.py bdist_egg) in the same python process, and a
+    # dependency's setup.py may get the main project's versioneer.
+    try:
+        other = get_versioneer_for_root(get_root())
+    except VersioneerBadRootError:
+        other = None  # get_versions() will complain later, if it is used
+    if other is not None:
+        return other.get_cmdclass()
 
     cmds = {}
 
@@ -31,14 +51,21 @@ def get_cmdclass():
 
     class cmd_version(Command):
         description = "report generated version string"
-        user_options = []
+        user_options = [("depfile=", None,
+                         "also write a make/ninja depfile of the files the "
+                         "version depends on"),
+                        ("depfile-target=", None,
+                         "the target named in the depfile "
+                         "[the depfile name without its extension]")]
         boolean_options = []
 
         def initialize_options(self):
-            pass
+            self.depfile = None
+            self.depfile_target = None
 
         def finalize_options(self):
-            pass
+            if self.depfile and self.depfile_target is None:
+                self.depfile_target = os.path.splitext(self.depfile)[0]
 
         def run(self):
             vers = get_versions(verbose=True)
@@ -47,6 +74,8 @@ def get_cmdclass():
             print(" dirty: %s" % vers.get("dirty"))
             if vers["error"]:
                 print(" error: %s" % vers["error"])
+            if self.depfile:
+                write_depfile(self.depfile, self.depfile_target, get_root())
     cmds["version"] = cmd_version
 
     # we override "build_py" in both distutils and setuptools
@@ -85,24 +114,25 @@ def get_cmdclass():
 
         class cmd_build_exe(_build_exe):
             def run(self):
+                import shutil
+                import tempfile
                 root = get_root()
                 cfg = get_config_from_root(root)
                 versions = get_versions()
-                target_versionfile = cfg.versionfile_source
-                print("UPDATING %s" % target_versionfile)
-                write_to_version_file(target_versionfile, versions)
-
-                _build_exe.run(self)
-                os.unlink(target_versionfile)
-                with open(cfg.versionfile_source, "w") as f:
-                    LONG = LONG_VERSION_PY[cfg.VCS]
-                    f.write(LONG %
-                            {"DOLLAR": "$",
-                             "STYLE": cfg.style,
-                             "TAG_PREFIX": cfg.tag_prefix,
-                             "PARENTDIR_PREFIX": cfg.parentdir_prefix,
-                             "VERSIONFILE_SOURCE": cfg.versionfile_source,
-                             })
+                # freeze a copy of the package, with a short _version.py,
+                # that sits ahead of the source tree on the module search
+                # path. The source tree itself is never modified, so its
+                # bytecode stays valid and parallel freezes cannot collide.
+                overlay = tempfile.mkdtemp(prefix="versioneer-build_exe-")
+                try:
+                    target_versionfile = copy_to_overlay(
+                        overlay, root, cfg.versionfile_source)
+                    print("UPDATING %s" % target_versionfile)
+                    write_to_version_file(target_versionfile, versions)
+                    self.path = [overlay] + list(self.path or sys.path)
+                    _build_exe.run(self)
+                finally:
+                    shutil.rmtree(overlay)
         cmds["build_exe"] = cmd_build_exe
         del cmds["build_py"]
 
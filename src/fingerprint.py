@@ -0,0 +1,99 @@
+import os # --STRIP DURING BUILD
+def get_config_from_root(): pass # --STRIP DURING BUILD
+def get_manifest_path(): pass # --STRIP DURING BUILD
+HANDLERS = {} # --STRIP DURING BUILD
+CI_ENV_VARIABLES = [] # --STRIP DURING BUILD
+def write_atomically(): pass # --STRIP DURING BUILD
+
+
+def version_inputs(root, cfg):
+    """List the files that get_versions() looks at, as (how, path) pairs.
+
+    'how' is "read" for files whose contents matter and "stat" for those
+    where a change of mtime or size is enough to notice.
+    """
+    inputs = [("read", os.path.join(root, "setup.cfg"))]
+    if cfg.versionfile_source:
+        inputs.append(("stat", os.path.join(root, cfg.versionfile_source)))
+    manifest = get_manifest_path(root, cfg)
+    if manifest:
+        inputs.append(("stat", manifest))
+    if "vcs" in cfg.strategies:
+        inputs_f = HANDLERS.get(cfg.VCS, {}).get("fingerprint_inputs")
+        if inputs_f:
+            inputs.extend(inputs_f(root))
+    return inputs
+
+
+def version_fingerprint(root):
+    """Return a digest of everything that can change the project's version.
+
+    This covers setup.cfg, _version.py, the manifest, the project directory
+    name, the CI environment variables (if the 'env' strategy is enabled)
+    and the VCS state that get_versions() would look at: for git that is
+    HEAD, the current branch, the tags, packed-refs, the index and config.
+    It only reads and stat()s files, and never runs the VCS, so a build
+    system can compute it cheaply and only call get_versions() (or
+    setup.py) when it changes.
+
+    Edits to tracked files only show up once git has refreshed its index
+    (which e.g. running 'git status' or 'git diff' yourself will do, but
+    Versioneer's own read-only queries do not), so a tree that has just
+    become dirty may keep its old fingerprint until then.
+    """
+    import hashlib
+    root = os.path.realpath(root)
+    cfg = get_config_from_root(root)
+    inputs = version_inputs(root, cfg)
+
+    h = hashlib.sha1()
+
+    def add(*values):
+        h.update(repr(values).encode("utf-8"))
+    add("root", root)
+    if "env" in cfg.strategies:
+        names = ["VERSIONEER_FULL_REVISIONID", "VERSIONEER_CLOSEST_TAG",
+                 "VERSIONEER_DISTANCE", "VERSIONEER_DIRTY"]
+        for commit_var, tag_var, tag_is_ref in CI_ENV_VARIABLES:
+            names.extend([commit_var, tag_var])
+        for name in names:
+            add("env", name, os.environ.get(name))
+    for how, path in inputs:
+        try:
+            if how == "read":
+                with open(path, "rb") as f:
+                    add(how, path, f.read())
+            else:
+                st = os.stat(path)
+                add(how, path, st.st_mtime, st.st_size, st.st_ino)
+        except EnvironmentError:
+            add(how, path, None)
+    return h.hexdigest()
+
+
+def depfile_escape(path):
+    """Quote a path for a Make (or Ninja) depfile."""
+    return path.replace(" ", "\\ ").replace("#", "\\#").replace("$", "$$")
+
+
+def write_depfile(filename, target, root):
+    """Write a depfile saying that target depends on the version inputs.
+
+    Only inputs that exist are listed, each with an empty rule of its own
+    (like 'gcc -MP'), so that make does not fail once git removes one, e.g.
+    a loose ref after 'git pack-refs'.
+    """
+    root = os.path.realpath(root)
+    cfg = get_config_from_root(root)
+    paths = []
+    for how, path in version_inputs(root, cfg):
+        if os.path.exists(path) and path not in paths:
+            paths.append(path)
+    lines = ["%s:%s" % (depfile_escape(target), " \\" if paths else "")]
+    for i, path in enumerate(paths):
+        last = (i == len(paths) - 1)
+        lines.append("  %s%s" % (depfile_escape(path), "" if last else " \\"))
+    for path in paths:
+        lines.append("")
+        lines.append("%s:" % depfile_escape(path))
+    write_atomically(filename, "\n".join(lines) + "\n")
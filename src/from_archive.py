@@ -0,0 +1,204 @@
+def get_config_from_file(): pass # --STRIP DURING BUILD
+def get_configparser(): pass # --STRIP DURING BUILD
+def scan_version_lines(): pass # --STRIP DURING BUILD
+def versions_from_scan(): pass # --STRIP DURING BUILD
+def versions_from_parentdir(): pass # --STRIP DURING BUILD
+HANDLERS = {} # --STRIP DURING BUILD
+class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+
+# _version.py files of at most this size are kept in memory while streaming
+# through a tarball, in case setup.cfg turns out to point at one of them
+ARCHIVE_BUFFER_LIMIT = 1024 * 1024
+
+
+def read_archive_members(path, verbose):
+    """Find and read setup.cfg and the versionfile inside an archive.
+
+    Returns (root, cfg, versionfile_text_or_None), where root is the
+    directory inside the archive that holds setup.cfg ("" if none), and cfg
+    is the VersioneerConfig parsed from it. Anything that is not a
+    readable tarball or zipfile raises NotThisMethod.
+    The project's setup.cfg is the one nearest the top that has a
+    [versioneer] section, so one in a subdirectory does not get in the way.
+    Nothing is unpacked to disk. Zipfiles are read through their index.
+    Tarballs (possibly compressed) are read as a stream: files named
+    _version.py are kept until setup.cfg has told us which one we want,
+    and if it was some other file that has already gone by, the archive is
+    streamed a second time to fetch it.
+    """
+    import tarfile
+    import zipfile
+    try:
+        if zipfile.is_zipfile(path):
+            return read_zipfile_members(path)
+        return read_tarball_members(path, verbose)
+    except (tarfile.TarError, zipfile.BadZipfile, EOFError) as e:
+        raise NotThisMethod("unable to read %s: %s" % (path, e))
+
+
+def read_zipfile_members(path):
+    """Like read_archive_members(), for a zipfile."""
+    import zipfile
+    z = zipfile.ZipFile(path)
+    try:
+        names = z.namelist()
+        root, cfg = find_archive_config(
+            dict((n, z.read(n)) for n in names
+                 if archive_depth(n) <= 1
+                 and n.rsplit("/", 1)[-1] == "setup.cfg"))
+        if cfg is None:
+            raise NotThisMethod("no setup.cfg in %s" % path)
+        versionfile = archive_join(root, cfg.versionfile_source)
+        contents = None
+        if versionfile in names:
+            contents = z.read(versionfile)
+    finally:
+        z.close()
+    return root, cfg, decode_member(contents)
+
+
+def read_tarball_members(path, verbose):
+    """Like read_archive_members(), for a (compressed) tarball."""
+    import tarfile
+    cfgs = {}
+    buffered = {}
+    versionfile = None
+    t = tarfile.open(path, "r|*")
+    try:
+        for member in t:
+            if not member.isfile():
+                continue
+            name = member.name
+            if name.startswith("./"):
+                name = name[2:]
+            basename = name.rsplit("/", 1)[-1]
+            if basename == "setup.cfg" and archive_depth(name) <= 1:
+                cfgs[name] = t.extractfile(member).read()
+                # 'git archive' without --prefix lists lib/setup.cfg before
+                # ./setup.cfg, so only a top-level one settles the question
+                # before the stream ends
+                if archive_depth(name) == 0:
+                    root, cfg = find_archive_config(cfgs)
+                    if root == "":
+                        versionfile = cfg.versionfile_source
+            elif (basename == "_version.py" and
+                  member.size <= ARCHIVE_BUFFER_LIMIT):
+                buffered[name] = t.extractfile(member).read()
+            # once a top-level setup.cfg and the file it names have gone
+            # by, we are done with the stream
+            if versionfile in buffered:
+                break
+    finally:
+        t.close()
+    if versionfile is None:
+        root, cfg = find_archive_config(cfgs)
+        if cfg is None:
+            raise NotThisMethod("no setup.cfg in %s" % path)
+        versionfile = archive_join(root, cfg.versionfile_source)
+    if versionfile not in buffered:
+        if verbose:
+            print("%s was not buffered, reading %s again"
+                  % (versionfile, path))
+        t = tarfile.open(path, "r|*")
+        try:
+            for member in t:
+                name = member.name
+                if name.startswith("./"):
+                    name = name[2:]
+                if name == versionfile and member.isfile():
+                    buffered[versionfile] = t.extractfile(member).read()
+                    break
+        finally:
+            t.close()
+    return root, cfg, decode_member(buffered.get(versionfile))
+
+
+def archive_depth(name):
+    """Count the directories above an archive member name."""
+    return name.strip("/").count("/")
+
+
+def archive_join(root, name):
+    """Join archive member names with '/', whatever the local os.sep is."""
+    if not root:
+        return name
+    return root + "/" + name
+
+
+def find_archive_config(setup_cfgs):
+    """Pick the project's config from {name: contents} of setup.cfg files.
+
+    The shallowest one with a [versioneer] section wins. Returns (root,
+    cfg), where root is the directory that holds it, or (None, None).
+    """
+    configparser = get_configparser()
+    for depth, name in sorted((archive_depth(n), n) for n in setup_cfgs):
+        try:
+            cfg = config_from_bytes(setup_cfgs[name])
+        except (configparser.NoSectionError,
+                configparser.MissingSectionHeaderError):
+            continue
+        return (name.rsplit("/", 1)[0] if "/" in name else ""), cfg
+    return None, None
+
+
+def decode_member(contents):
+    """Turn the bytes of an archive member into text."""
+    if contents is None:
+        return None
+    return contents.decode("utf-8", "replace")
+
+
+def config_from_bytes(contents):
+    """Parse Versioneer config from the bytes of a setup.cfg."""
+    import io
+    return get_config_from_file(io.StringIO(decode_member(contents)))
+
+
+def versions_from_archive(path, verbose=False):
+    """Get the version of the project in an sdist or git-archive tarball.
+
+    This reads setup.cfg and the versionfile straight out of the tarball or
+    zipfile, without unpacking it. It understands both a short _version.py
+    (as written by 'setup.py sdist') and a long one with expanded keywords
+    (as written by 'git archive'). If neither gives an answer, the name of
+    the archive's top-level directory is tried against parentdir_prefix.
+    """
+    root, cfg, contents = read_archive_members(path, verbose)
+    handlers = HANDLERS.get(cfg.VCS, {})
+
+    if contents is not None:
+        scan = scan_version_lines(contents.splitlines(True))
+        keywords_f = handlers.get("keywords_from_lines")
+        from_keywords_f = handlers.get("keywords")
+        if keywords_f and from_keywords_f and scan["kind"] != "short":
+            try:
+                keywords = keywords_f(scan["lines"])
+                ver = from_keywords_f(keywords, cfg.tag_prefix, verbose,
+                                      style=cfg.style,
+                                      short_hash_length=cfg.short_hash_length)
+                if verbose:
+                    print("got version from expanded keyword %s" % ver)
+                return ver
+            except NotThisMethod:
+                pass
+
+        try:
+            ver = versions_from_scan(scan)
+            if verbose:
+                print("got version from file %s" % ver)
+            return ver
+        except NotThisMethod:
+            pass
+
+    try:
+        if cfg.parentdir_prefix and root:
+            ver = versions_from_parentdir(cfg.parentdir_prefix, root, verbose)
+            if verbose:
+                print("got version from parentdir %s" % ver)
+            return ver
+    except NotThisMethod:
+        pass
+
+    return {"version": "0+unknown", "full-revisionid": None,
+            "dirty": None, "error": "unable to compute version"}
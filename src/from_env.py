@@ -0,0 +1,79 @@
+import os # --STRIP DURING BUILD
+class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+def get_boolean(): pass # --STRIP DURING BUILD
+
+# (commit variable, tag variable, tag variable holds a full ref) for each CI
+# system we know about. The tag variable is only set by builds of a tag.
+CI_ENV_VARIABLES = [
+    ("GITHUB_SHA", "GITHUB_REF", True),  # GitHub Actions
+    ("CI_COMMIT_SHA", "CI_COMMIT_TAG", False),  # GitLab CI
+    ("TRAVIS_COMMIT", "TRAVIS_TAG", False),  # Travis CI
+    ("CIRCLE_SHA1", "CIRCLE_TAG", False),  # CircleCI
+    ("BUILD_SOURCEVERSION", "BUILD_SOURCEBRANCH", True),  # Azure Pipelines
+    ("BITBUCKET_COMMIT", "BITBUCKET_TAG", False),  # Bitbucket Pipelines
+    ("APPVEYOR_REPO_COMMIT", "APPVEYOR_REPO_TAG_NAME", False),  # AppVeyor
+    ("GIT_COMMIT", "TAG_NAME", False),  # Jenkins
+    ]
+
+
+def pieces_from_env(tag_prefix, verbose, environ=None,
+                    short_hash_length=None):
+    """Get version pieces from CI environment variables, without the VCS.
+
+    The generic VERSIONEER_FULL_REVISIONID, VERSIONEER_CLOSEST_TAG,
+    VERSIONEER_DISTANCE and VERSIONEER_DIRTY variables win. Otherwise the
+    commit and tag exported by a known CI system are used. A CI system only
+    tells us about a tag when building exactly that tag, so for any other
+    commit we cannot know the distance, and give up.
+    """
+    if environ is None:
+        environ = os.environ
+
+    full = environ.get("VERSIONEER_FULL_REVISIONID")
+    tag = environ.get("VERSIONEER_CLOSEST_TAG")
+    if not full:
+        for commit_var, tag_var, tag_is_ref in CI_ENV_VARIABLES:
+            if environ.get(commit_var):
+                full = environ[commit_var]
+                if not tag:
+                    tag = environ.get(tag_var)
+                    if tag and tag_is_ref:
+                        if tag.startswith("refs/tags/"):
+                            tag = tag[len("refs/tags/"):]
+                        else:
+                            tag = None  # a branch build
+                if verbose:
+                    print("using commit from $%s" % commit_var)
+                break
+    if not full:
+        raise NotThisMethod("no commit id in the environment")
+    full = full.strip()
+
+    if tag:
+        if not tag.startswith(tag_prefix):
+            if verbose:
+                print("tag '%s' doesn't start with prefix '%s'"
+                      % (tag, tag_prefix))
+            raise NotThisMethod("tag doesn't start with tag_prefix")
+        tag = tag[len(tag_prefix):]
+    distance = environ.get("VERSIONEER_DISTANCE")
+    if distance is None:
+        if not tag:
+            raise NotThisMethod("distance from the closest tag is unknown")
+        distance = 0
+    try:
+        distance = int(distance)
+    except ValueError:
+        if verbose:
+            print("bad $VERSIONEER_DISTANCE '%s', it should be a number"
+                  % distance)
+        raise NotThisMethod("VERSIONEER_DISTANCE is not a number")
+
+    pieces = {}
+    pieces["long"] = full
+    pieces["short"] = full[:short_hash_length or 7]
+    pieces["closest-tag"] = tag or None
+    pieces["distance"] = distance
+    pieces["dirty"] = get_boolean(environ.get("VERSIONEER_DIRTY"))
+    pieces["error"] = None
+    return pieces
@@ -5,44 +5,162 @@ SHORT_VERSION_PY = """
 # unpacked source archive. Distribution tarballs contain a pre-generated copy
 # of this file.
 
-import json
-import sys
+versions = %s
 
-version_json = '''
-%s
-'''  # END VERSION_JSON
+__version__ = %r
+
+# the version, pre-parsed so that comparing it needs no imports. These are
+# like (1, 2, 'post3', 'dev0', 'gabc') and a tuple that sorts the way PEP 440
+# orders versions, or None if the version isn't PEP 440 (git-describe styles)
+version_tuple = %s
+version_sort_key = %s
 
 
 def get_versions():
-    return json.loads(version_json)
+    return dict(versions)
 """
 
-import os # --STRIP DURING BUILD
-import json # --STRIP DURING BUILD
+import os, sys # --STRIP DURING BUILD
 import re # --STRIP DURING BUILD
 class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+from render import version_tuple, version_sort_key # --STRIP DURING BUILD
 
-def versions_from_file(filename):
-    """Try to determine the version from _version.py if present."""
+# precompiled, since every setup.py command scans _version.py at least once
+VERSIONS_LITERAL = re.compile(r"^versions = (\{.*\})\s*$")
+# short files written by older versions of versioneer.py hold JSON instead
+VERSION_JSON_START = re.compile(r"version_json = '''\s*$")
+VERSION_JSON_END = re.compile(r"^'''  # END VERSION_JSON")
+KEYWORDS_END = re.compile(r"^\s*keywords = \{")
+
+
+def scan_version_file(filename):
+    """Read a _version.py once, and work out what kind of file it is.
+
+    See scan_version_lines(). A missing or unreadable file scans as empty.
+    """
     try:
-        with open(filename) as f:
-            contents = f.read()
+        f = open(filename)
     except EnvironmentError:
-        raise NotThisMethod("unable to read _version.py")
-    mo = re.search(r"version_json = '''\n(.*)'''  # END VERSION_JSON",
-                   contents, re.M | re.S)
-    if not mo:
-        raise NotThisMethod("no version_json in _version.py")
-    return json.loads(mo.group(1))
+        return scan_version_lines([])
+    with f:
+        return scan_version_lines(f)
+
+
+def scan_version_lines(lines):
+    """Classify a _version.py from its lines, reading no more than needed.
+
+    Returns a dict with 'kind' ("keywords" for a long _version.py, whose
+    git-archive keywords may or may not be expanded, "short" for one written
+    by write_to_version_file(), or None), 'lines' (the lines read, which
+    include every keyword assignment), and for a short file either
+    'versions' (the dict literal) or, if it came from an older versioneer,
+    'version_json'. Reading stops as soon as the kind is known: the keywords
+    all come before the end of get_keywords(), and nothing after the
+    versions matters.
+    """
+    scan = {"kind": None, "lines": [], "versions": None,
+            "version_json": None}
+    json_lines = None
+    for line in lines:
+        if json_lines is not None:
+            if VERSION_JSON_END.match(line):
+                scan["kind"] = "short"
+                scan["version_json"] = "".join(json_lines)
+                break
+            json_lines.append(line)
+            continue
+        scan["lines"].append(line)
+        mo = VERSIONS_LITERAL.match(line)
+        if mo:
+            scan["kind"] = "short"
+            scan["versions"] = mo.group(1)
+            break
+        if VERSION_JSON_START.search(line):
+            json_lines = []
+        elif KEYWORDS_END.match(line):
+            scan["kind"] = "keywords"
+            break
+    return scan
+
+
+def versions_from_file(filename):
+    """Try to determine the version from _version.py if present."""
+    return versions_from_scan(scan_version_file(filename))
+
+
+def versions_from_scan(scan):
+    """Parse the versions found by scan_version_lines(), if any.
+
+    The file is never imported or executed: the dict literal is read with
+    ast.literal_eval(), which accepts nothing but plain Python constants.
+    """
+    if scan["versions"] is not None:
+        import ast
+        try:
+            return ast.literal_eval(scan["versions"])
+        except (SyntaxError, ValueError):
+            raise NotThisMethod("unparseable versions in _version.py")
+    if scan["version_json"] is not None:
+        import json
+        return json.loads(scan["version_json"])
+    raise NotThisMethod("no versions in _version.py")
 
 
 def write_to_version_file(filename, versions):
-    """Write the given version number to the given _version.py file."""
-    os.unlink(filename)
-    contents = json.dumps(versions, sort_keys=True,
-                          indent=1, separators=(",", ": "))
-    with open(filename, "w") as f:
-        f.write(SHORT_VERSION_PY % contents)
+    """Write the given version number to the given _version.py file.
 
+    If the file already says exactly that, it is left alone, so that its
+    mtime only changes when the version does and no-op rebuilds stay no-op.
+    """
+    # sorted, so that the same versions always give the same file
+    literal = "{%s}" % ", ".join(["%r: %r" % (key, versions[key])
+                                  for key in sorted(versions)])
+    version = versions["version"]
+    contents = SHORT_VERSION_PY % (literal, version,
+                                   repr(version_tuple(version)),
+                                   repr(version_sort_key(version)))
+    try:
+        with open(filename, "r") as f:
+            unchanged = (f.read() == contents)
+    except EnvironmentError:
+        unchanged = False
+    if unchanged:
+        print("%s is already set to '%s'" % (filename, versions["version"]))
+        return
+
+    write_atomically(filename, contents)
     print("set %s to '%s'" % (filename, versions["version"]))
 
+
+def write_atomically(filename, contents):
+    """Replace a file so that readers only ever see it whole.
+
+    The contents go to a temporary file next to the target, which is then
+    renamed over it, keeping the old file's permissions. Parallel builds of
+    one tree can therefore never catch the file missing or half-written.
+    Renaming also replaces a hardlink rather than writing through it, which
+    matters in sdist release trees, whose files may be hardlinks to the
+    originals in the source tree.
+    """
+    import tempfile
+    dirname, basename = os.path.split(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(dir=dirname, prefix=".%s." % basename,
+                               suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(contents)
+        try:
+            mode = os.stat(filename).st_mode & 0o7777
+        except OSError:
+            mode = 0o644  # mkstemp() makes it 0600
+        os.chmod(tmp, mode)
+        if hasattr(os, "replace"):
+            os.replace(tmp, filename)
+        else:
+            # python2: os.rename() cannot replace an existing file on windows
+            if sys.platform == "win32" and os.path.exists(filename):
+                os.unlink(filename)
+            os.rename(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
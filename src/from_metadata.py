@@ -0,0 +1,63 @@
+import os # --STRIP DURING BUILD
+class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+
+
+def versions_from_metadata(package, verbose, versionfile=None):
+    """Get the version of the installed distribution that provides package.
+
+    This answers from installed metadata (a .dist-info or .egg-info found on
+    sys.path, including inside zipapps and PEX files) without running any
+    subprocess, for installs that have no source checkout next to them.
+
+    If versionfile is given, only a distribution that installed that very
+    file counts, so an older install of the same project somewhere on
+    sys.path cannot answer for a source tree.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            raise NotThisMethod("no importlib.metadata")
+
+    def owns(dist):
+        if versionfile is None:
+            return True
+        target = os.path.realpath(versionfile)
+        for path in dist.files or []:
+            if (os.path.basename(str(path)) == os.path.basename(target)
+                    and os.path.realpath(str(dist.locate_file(path)))
+                    == target):
+                return True
+        if verbose:
+            print("distribution '%s' did not install %s"
+                  % (dist.metadata["Name"], versionfile))
+        return False
+
+    def find(names):
+        for name in names:
+            try:
+                dist = metadata.distribution(name)
+            except metadata.PackageNotFoundError:
+                continue
+            if owns(dist):
+                return dist
+        return None
+
+    dist = find([package])
+    if dist is None:
+        # the distribution may be named differently than the package it
+        # provides. packages_distributions() is py3.10+, and has to look at
+        # every installed distribution, so only ask it if we must.
+        try:
+            names = metadata.packages_distributions().get(package, [])
+        except AttributeError:
+            names = []
+        dist = find(names)
+    if dist is None or not dist.version:
+        if verbose:
+            print("no installed distribution provides '%s'" % package)
+        raise NotThisMethod("no installed distribution metadata")
+    return {"version": dist.version, "full-revisionid": None,
+            "dirty": False, "error": None}
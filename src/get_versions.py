@@ -1,27 +1,47 @@
-import os, sys # --STRIP DURING BUILD
+import os, time # --STRIP DURING BUILD
 def get_root(): pass # --STRIP DURING BUILD
+def get_versioneer_for_root(): pass # --STRIP DURING BUILD
 def get_config_from_root(): pass # --STRIP DURING BUILD
-def versions_from_file(): pass # --STRIP DURING BUILD
+def scan_version_file(): pass # --STRIP DURING BUILD
+def versions_from_scan(): pass # --STRIP DURING BUILD
 def versions_from_parentdir(): pass # --STRIP DURING BUILD
+def pieces_from_env(): pass # --STRIP DURING BUILD
+def get_manifest_path(): pass # --STRIP DURING BUILD
+def versions_from_manifest(): pass # --STRIP DURING BUILD
 def render(): pass # --STRIP DURING BUILD
 HANDLERS = {} # --STRIP DURING BUILD
 class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+class CommandTimeoutError(Exception): pass  # --STRIP DURING BUILD
+
 
 class VersioneerBadRootError(Exception):
 
     """The project root directory is unknown or missing key files."""
 
 
-def get_versions(verbose=False):
+# the most recent version computed from the VCS for each project root, used
+# as a fallback if a later VCS query runs past the configured timeout
+LAST_VCS_VERSIONS = {}
+
+# a directory of 'git describe' results to share between checkouts, which
+# wins over [versioneer]cache_dir=
+CACHE_DIR_ENV = "VERSIONEER_CACHE_DIR"
+
+
+def get_versions(verbose=False, use_manifest=True):
     """Get the project version from whatever source is available.
 
     Returns dict with two keys: 'version' and 'full'.
-    """
-    if "versioneer" in sys.modules:
-        # see the discussion in cmdclass.py:get_cmdclass()
-        del sys.modules["versioneer"]
 
+    If a version manifest is configured and lists this project, its entry
+    is returned without looking anywhere else, unless use_manifest=False.
+    """
     root = get_root()
+    other = get_versioneer_for_root(root)
+    if other is not None:
+        if use_manifest:
+            return other.get_versions(verbose)
+        return other.get_versions(verbose, use_manifest=False)
     cfg = get_config_from_root(root)
 
     assert cfg.VCS is not None, "please set [versioneer]VCS= in setup.cfg"
@@ -34,57 +54,134 @@ def get_versions(verbose=False):
 
     versionfile_abs = os.path.join(root, cfg.versionfile_source)
 
-    # extract version from first of: _version.py, VCS command (e.g. 'git
-    # describe'), parentdir. This is meant to work for developers using a
-    # source checkout, for users of a tarball created by 'setup.py sdist',
-    # and for users of a tarball/zipball created by 'git archive' or github's
-    # download-from-tag feature or the equivalent in other VCSes.
+    # the whole lookup below must finish within cfg.timeout seconds. Only the
+    # VCS step runs external commands, so that is where the deadline bites.
+    deadline = None
+    if cfg.timeout is not None:
+        deadline = time.time() + cfg.timeout
+    timeout_error = None
 
-    get_keywords_f = handlers.get("get_keywords")
-    from_keywords_f = handlers.get("keywords")
-    if get_keywords_f and from_keywords_f:
+    manifest = get_manifest_path(root, cfg) if use_manifest else None
+    if manifest:
         try:
-            keywords = get_keywords_f(versionfile_abs)
-            ver = from_keywords_f(keywords, cfg.tag_prefix, verbose)
+            ver = versions_from_manifest(manifest, root, cfg.project_name,
+                                         verbose)
             if verbose:
-                print("got version from expanded keyword %s" % ver)
+                print("got version from manifest %s" % ver)
             return ver
         except NotThisMethod:
             pass
 
-    try:
-        ver = versions_from_file(versionfile_abs)
-        if verbose:
-            print("got version from file %s %s" % (versionfile_abs, ver))
-        return ver
-    except NotThisMethod:
-        pass
-
-    from_vcs_f = handlers.get("pieces_from_vcs")
-    if from_vcs_f:
-        try:
-            pieces = from_vcs_f(cfg.tag_prefix, root, verbose)
-            ver = render(pieces, cfg.style)
-            if verbose:
-                print("got version from VCS %s" % ver)
-            return ver
-        except NotThisMethod:
-            pass
-
-    try:
-        if cfg.parentdir_prefix:
-            ver = versions_from_parentdir(cfg.parentdir_prefix, root, verbose)
-            if verbose:
-                print("got version from parentdir %s" % ver)
-            return ver
-    except NotThisMethod:
-        pass
+    # extract version from the first strategy that works, in the order given
+    # by [versioneer]strategies=. By default that is _version.py (keywords
+    # expanded by 'git archive', then the short file written by 'setup.py
+    # sdist'), CI environment variables (if enabled), VCS command (e.g. 'git
+    # describe'), parentdir. This is meant to work for developers using a
+    # source checkout, for users of a tarball created by 'setup.py sdist', for
+    # CI jobs, and for users of a tarball/zipball created by 'git archive' or
+    # github's download-from-tag feature or the equivalent in other VCSes.
+
+    scan = None
+    for strategy in cfg.strategies:
+        if strategy in ("keywords", "file") and scan is None:
+            # both of these look at _version.py, so read it once
+            scan = scan_version_file(versionfile_abs)
+
+        if strategy == "keywords":
+            keywords_f = handlers.get("keywords_from_lines")
+            from_keywords_f = handlers.get("keywords")
+            if keywords_f and from_keywords_f and scan["kind"] != "short":
+                try:
+                    keywords = keywords_f(scan["lines"])
+                    ver = from_keywords_f(
+                        keywords, cfg.tag_prefix, verbose, style=cfg.style,
+                        short_hash_length=cfg.short_hash_length)
+                    if verbose:
+                        print("got version from expanded keyword %s" % ver)
+                    return ver
+                except NotThisMethod:
+                    pass
+
+        elif strategy == "file":
+            try:
+                ver = versions_from_scan(scan)
+                if verbose:
+                    print("got version from file %s %s"
+                          % (versionfile_abs, ver))
+                return ver
+            except NotThisMethod:
+                pass
+
+        elif strategy == "env":
+            try:
+                pieces = pieces_from_env(
+                    cfg.tag_prefix, verbose,
+                    short_hash_length=cfg.short_hash_length)
+                ver = render(pieces, cfg.style)
+                if verbose:
+                    print("got version from environment %s" % ver)
+                return ver
+            except NotThisMethod:
+                pass
+
+        elif strategy == "vcs":
+            from_vcs_f = handlers.get("pieces_from_vcs")
+            if not from_vcs_f:
+                continue
+            cache_dir = os.environ.get(CACHE_DIR_ENV) or cfg.cache_dir
+            from_cache_f = handlers.get("pieces_from_cache")
+            try:
+                if cache_dir and from_cache_f:
+                    pieces = from_cache_f(
+                        cfg.tag_prefix, root, verbose,
+                        os.path.expanduser(cache_dir), cfg.cache_size,
+                        first_parent=cfg.first_parent,
+                        short_hash_length=cfg.short_hash_length,
+                        deadline=deadline)
+                else:
+                    pieces = from_vcs_f(
+                        cfg.tag_prefix, root, verbose,
+                        first_parent=cfg.first_parent,
+                        short_hash_length=cfg.short_hash_length,
+                        deadline=deadline)
+                ver = render(pieces, cfg.style)
+                if verbose:
+                    print("got version from VCS %s" % ver)
+                LAST_VCS_VERSIONS[root] = ver
+                return ver
+            except NotThisMethod:
+                pass
+            except CommandTimeoutError as e:
+                timeout_error = ("VCS lookup exceeded the %ss timeout: %s"
+                                 % (cfg.timeout, e))
+                if verbose:
+                    print(timeout_error)
+                if root in LAST_VCS_VERSIONS:
+                    ver = dict(LAST_VCS_VERSIONS[root])
+                    ver["error"] = timeout_error
+                    if verbose:
+                        print("using previously computed version %s" % ver)
+                    return ver
+
+        elif strategy == "parentdir":
+            try:
+                if cfg.parentdir_prefix:
+                    ver = versions_from_parentdir(cfg.parentdir_prefix, root,
+                                                  verbose)
+                    if verbose:
+                        print("got version from parentdir %s" % ver)
+                    if timeout_error:
+                        ver["error"] = timeout_error
+                    return ver
+            except NotThisMethod:
+                pass
 
     if verbose:
         print("unable to compute version")
 
     return {"version": "0+unknown", "full-revisionid": None,
-            "dirty": None, "error": "unable to compute version"}
+            "dirty": None,
+            "error": timeout_error or "unable to compute version"}
 
 
 def get_version():
@@ -0,0 +1,76 @@
+import os # --STRIP DURING BUILD
+def register_vcs_handler(*args): # --STRIP DURING BUILD
+    def nil(f): # --STRIP DURING BUILD
+        return f # --STRIP DURING BUILD
+    return nil # --STRIP DURING BUILD
+def git_root_from_pointer(): pass # --STRIP DURING BUILD
+POINTER_FILE = ".versioneer-root" # --STRIP DURING BUILD
+
+
+def git_dirs(root):
+    """Find the git dir of the checkout at root, and the one it shares.
+
+    Returns (gitdir, commondir), or None if root is not a git checkout. A
+    linked worktree (or a submodule) has a .git file naming its own git
+    dir, which may keep its refs and config in the main repository's.
+    """
+    dot_git = os.path.join(root, ".git")
+    if os.path.isdir(dot_git):
+        gitdir = dot_git
+    elif os.path.isfile(dot_git):
+        with open(dot_git, "r") as f:
+            line = f.readline().strip()
+        if not line.startswith("gitdir:"):
+            return None
+        gitdir = os.path.join(root, line[len("gitdir:"):].strip())
+    else:
+        return None
+    commondir = gitdir
+    try:
+        with open(os.path.join(gitdir, "commondir"), "r") as f:
+            commondir = os.path.join(gitdir, f.read().strip())
+    except EnvironmentError:
+        pass
+    return gitdir, commondir
+
+
+@register_vcs_handler("git", "fingerprint_inputs")
+def git_fingerprint_inputs(root):
+    """List the files that decide what 'git describe' reports for root.
+
+    Returns a list of ("read", path) and ("stat", path) pairs: HEAD and the
+    branch it points at are small enough to read, while packed-refs, every
+    loose tag (and the directories holding them, which change when a tag is
+    added or removed), the index, shallow and config only need their stat().
+    A copy of the tree without .git is followed to the checkout its pointer
+    file names, and the pointer file is listed too.
+    """
+    inputs = [("read", os.path.join(root, POINTER_FILE))]
+    dirs = git_dirs(root)
+    if dirs is None:
+        pointed = git_root_from_pointer(root, False)
+        if pointed is not None:
+            dirs = git_dirs(pointed)
+    if dirs is None:
+        return inputs
+    gitdir, commondir = dirs
+    head = os.path.join(gitdir, "HEAD")
+    inputs.append(("read", head))
+    try:
+        with open(head, "r") as f:
+            target = f.read().strip()
+    except EnvironmentError:
+        target = ""
+    if target.startswith("ref:"):
+        inputs.append(("read", os.path.join(commondir,
+                                            target[len("ref:"):].strip())))
+    for name in ["packed-refs", "shallow", "config"]:
+        inputs.append(("stat", os.path.join(commondir, name)))
+    inputs.append(("stat", os.path.join(gitdir, "index")))
+    for dirpath, dirnames, filenames in os.walk(os.path.join(commondir,
+                                                             "refs", "tags")):
+        dirnames.sort()
+        inputs.append(("stat", dirpath))
+        for filename in sorted(filenames):
+            inputs.append(("stat", os.path.join(dirpath, filename)))
+    return inputs
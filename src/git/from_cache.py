@@ -0,0 +1,230 @@
+import os, sys, time # --STRIP DURING BUILD
+def register_vcs_handler(*args): # --STRIP DURING BUILD
+    def nil(f): # --STRIP DURING BUILD
+        return f # --STRIP DURING BUILD
+    return nil # --STRIP DURING BUILD
+def run_command(): pass # --STRIP DURING BUILD
+def git_dirs(): pass # --STRIP DURING BUILD
+def git_root_from_pointer(): pass # --STRIP DURING BUILD
+def git_readonly_env(): pass # --STRIP DURING BUILD
+def git_pieces_from_vcs(): pass # --STRIP DURING BUILD
+def write_atomically(): pass # --STRIP DURING BUILD
+class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+
+# bump this when the meaning of a cache entry changes
+GIT_CACHE_FORMAT = 1
+
+
+def git_resolve_ref(gitdir, commondir, ref):
+    """Find the commit id a ref (like "HEAD") names, by reading files.
+
+    Returns None if that needs more than loose refs and packed-refs, e.g.
+    in a repository that uses reftable.
+    """
+    for i in range(5):  # symbolic refs pointing at symbolic refs
+        value = None
+        for d in [gitdir, commondir]:
+            try:
+                with open(os.path.join(d, ref), "r") as f:
+                    value = f.read().strip()
+                break
+            except EnvironmentError:
+                pass
+        if value is None:
+            value = git_packed_refs(commondir).get(ref)
+        if not value:
+            return None
+        if not value.startswith("ref:"):
+            return value
+        ref = value[len("ref:"):].strip()
+    return None
+
+
+def git_packed_refs(commondir):
+    """Return {refname: id} from the repository's packed-refs file."""
+    refs = {}
+    try:
+        with open(os.path.join(commondir, "packed-refs"), "r") as f:
+            for line in f:
+                if line.startswith("#") or line.startswith("^"):
+                    continue
+                fields = line.split()
+                if len(fields) == 2:
+                    refs[fields[1]] = fields[0]
+    except EnvironmentError:
+        pass
+    return refs
+
+
+def git_tags_digest(commondir, tag_prefix):
+    """Return a digest of the tags that 'git describe' may consider.
+
+    Only tags starting with tag_prefix count. Loose tags win over packed
+    ones, as they do for git.
+    """
+    import hashlib
+    tags = {}
+    for name, value in git_packed_refs(commondir).items():
+        if name.startswith("refs/tags/"):
+            tags[name] = value
+    tags_dir = os.path.join(commondir, "refs", "tags")
+    for dirpath, dirnames, filenames in os.walk(tags_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            name = "refs/tags/" + os.path.relpath(path, tags_dir).replace(
+                os.sep, "/")
+            try:
+                with open(path, "r") as f:
+                    tags[name] = f.read().strip()
+            except EnvironmentError:
+                pass  # deleted while we looked
+    wanted = sorted((name, value) for name, value in tags.items()
+                    if name.startswith("refs/tags/" + tag_prefix))
+    return hashlib.sha1(repr(wanted).encode("utf-8")).hexdigest()
+
+
+def git_cache_lock(cache_dir):
+    """Take the cache directory's lock, returning an object to unlock().
+
+    This serializes writers and eviction between processes. Readers do not
+    need it, since entries are replaced atomically.
+    """
+    f = open(os.path.join(cache_dir, "lock"), "a+")
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def git_cache_unlock(f):
+    """Release a lock taken by git_cache_lock()."""
+    if sys.platform == "win32":
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    f.close()  # this drops a flock() too
+
+
+def git_cache_evict(cache_dir, cache_size):
+    """Remove the least recently used entries beyond cache_size."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".json"):
+            path = os.path.join(cache_dir, name)
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except EnvironmentError:
+                pass
+    entries.sort()
+    for mtime, path in entries[:max(0, len(entries) - cache_size)]:
+        try:
+            os.unlink(path)
+        except EnvironmentError:
+            pass
+
+
+@register_vcs_handler("git", "pieces_from_cache")
+def git_pieces_from_cache(tag_prefix, root, verbose, cache_dir,
+                          cache_size=1000, run_command=run_command,
+                          first_parent=False, short_hash_length=None,
+                          deadline=None):
+    """Get version pieces, sharing 'git describe' results between checkouts.
+
+    Worktrees and clones of one repository on the same machine all ask git
+    to walk the same history. The tag and distance part of their pieces is
+    kept in cache_dir, keyed by the commit id, a digest of the tags that
+    match tag_prefix, the shallow boundary (the only way two repositories
+    can disagree about the history of a commit) and the settings that
+    change the answer. Finding the key only reads files. A hit then needs
+    just a 'git status' to tell whether this checkout is dirty; a miss runs
+    git_pieces_from_vcs() and stores its result. The least recently used
+    entries beyond cache_size are evicted.
+    """
+    import hashlib
+    import json
+    dirs = git_dirs(root)
+    if dirs is None:
+        root = git_root_from_pointer(root, verbose) or root
+        dirs = git_dirs(root)
+    if dirs is None:
+        if verbose:
+            print("no .git in %s" % root)
+        raise NotThisMethod("no .git directory")
+    gitdir, commondir = dirs
+    full = git_resolve_ref(gitdir, commondir, "HEAD")
+
+    def from_vcs():
+        return git_pieces_from_vcs(tag_prefix, root, verbose,
+                                   run_command=run_command,
+                                   first_parent=first_parent,
+                                   short_hash_length=short_hash_length,
+                                   deadline=deadline)
+    if not full:
+        if verbose:
+            print("unable to read HEAD in %s, not using the cache" % gitdir)
+        return from_vcs()
+
+    try:
+        with open(os.path.join(commondir, "shallow"), "r") as f:
+            shallow = f.read().split()
+    except EnvironmentError:
+        shallow = []
+    key = hashlib.sha1(repr([GIT_CACHE_FORMAT, full,
+                             git_tags_digest(commondir, tag_prefix),
+                             sorted(shallow), tag_prefix, bool(first_parent),
+                             short_hash_length]).encode("utf-8")).hexdigest()
+    entry = os.path.join(cache_dir, key + ".json")
+
+    try:
+        with open(entry, "r") as f:
+            pieces = json.load(f)
+    except (EnvironmentError, ValueError):
+        pieces = None
+    if pieces is not None:
+        GITS = ["git"]
+        if sys.platform == "win32":
+            GITS = ["git.cmd", "git.exe"]
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - time.time()
+        status = run_command(GITS, ["status", "--porcelain",
+                                    "--untracked-files=no"],
+                             cwd=root, env=git_readonly_env(),
+                             timeout=timeout)
+        if status is None:
+            raise NotThisMethod("'git status' failed")
+        pieces["dirty"] = bool(status)
+        pieces["error"] = None
+        try:
+            os.utime(entry, None)  # mark it as recently used
+        except EnvironmentError:
+            pass
+        if verbose:
+            print("found %s in the version cache" % full)
+        return pieces
+
+    pieces = from_vcs()
+    if pieces["error"] is None:
+        cached = dict((k, pieces[k])
+                      for k in ["long", "short", "closest-tag", "distance"])
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            lock = git_cache_lock(cache_dir)
+            try:
+                write_atomically(entry, json.dumps(cached, sort_keys=True))
+                git_cache_evict(cache_dir, cache_size)
+            finally:
+                git_cache_unlock(lock)
+        except EnvironmentError as e:
+            if verbose:
+                print("unable to update the version cache: %s" % e)
+    return pieces
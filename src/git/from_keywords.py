@@ -4,8 +4,10 @@ def register_vcs_handler(*args): # --STRIP DURING BUILD
         return f # --STRIP DURING BUILD
     return nil # --STRIP DURING BUILD
 class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+from render import render # --STRIP DURING BUILD
 
 
+# --BEGIN SETUP ONLY
 @register_vcs_handler("git", "get_keywords")
 def git_get_keywords(versionfile_abs):
     """Extract version information from the given file."""
@@ -13,26 +15,72 @@ def git_get_keywords(versionfile_abs):
     # keywords. When used from setup.py, we don't want to import _version.py,
     # so we do it with a regexp instead. This function is not used from
     # _version.py.
-    keywords = {}
     try:
         f = open(versionfile_abs, "r")
-        for line in f.readlines():
-            if line.strip().startswith("git_refnames ="):
-                mo = re.search(r'=\s*"(.*)"', line)
-                if mo:
-                    keywords["refnames"] = mo.group(1)
-            if line.strip().startswith("git_full ="):
-                mo = re.search(r'=\s*"(.*)"', line)
-                if mo:
-                    keywords["full"] = mo.group(1)
+        keywords = git_keywords_from_lines(f.readlines())
         f.close()
     except EnvironmentError:
-        pass
+        return {}
+    return keywords
+
+
+# matches the keyword assignments in get_keywords(), each on its own line
+GIT_KEYWORD_RE = re.compile(r'^\s*git_(refnames|full|describe)\s*=\s*"(.*)"')
+
+
+@register_vcs_handler("git", "keywords_from_lines")
+def git_keywords_from_lines(lines):
+    """Extract version information from the lines of a _version.py."""
+    keywords = {}
+    for line in lines:
+        mo = GIT_KEYWORD_RE.match(line)
+        if mo:
+            keywords[mo.group(1)] = mo.group(2)
     return keywords
+# --END SETUP ONLY
+
+
+def git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                     short_hash_length=None):
+    """Get version pieces from an expanded %(describe) keyword, if any.
+
+    git-2.35 and later expand $Format:%(describe:...)$ during git-archive
+    into TAG or TAG-NUM-gHEX, which tells us the distance that the %d
+    refnames cannot. Older versions of git leave the placeholder alone, and
+    commits with no matching tag expand it to an empty string. For those
+    this returns None, and the caller falls back to the refnames.
+    """
+    describe = keywords.get("describe", "").strip()
+    if not describe or describe.startswith(("$Format", "%(")):
+        if verbose:
+            print("no usable describe keyword")
+        return None
+    import re
+    full = keywords["full"].strip()
+    pieces = {"long": full, "short": full[:short_hash_length or 7],
+              "dirty": False, "error": None, "distance": 0}
+    mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', describe)
+    if mo:
+        full_tag = mo.group(1)
+        pieces["distance"] = int(mo.group(2))
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+    else:
+        full_tag = describe  # exactly on the tag
+    if not full_tag.startswith(tag_prefix):
+        if verbose:
+            print("tag '%s' doesn't start with prefix '%s'"
+                  % (full_tag, tag_prefix))
+        return None
+    pieces["closest-tag"] = full_tag[len(tag_prefix):]
+    if verbose:
+        print("got pieces from describe keyword: %s" % describe)
+    return pieces
 
 
 @register_vcs_handler("git", "keywords")
-def git_versions_from_keywords(keywords, tag_prefix, verbose):
+def git_versions_from_keywords(keywords, tag_prefix, verbose, style=None,
+                               short_hash_length=None):
     """Get version information from git keywords."""
     if not keywords:
         raise NotThisMethod("no keywords at all, weird")
@@ -41,6 +89,11 @@ def git_versions_from_keywords(keywords, tag_prefix, verbose):
         if verbose:
             print("keywords are unexpanded, not using")
         raise NotThisMethod("unexpanded keywords, not a git-archive tarball")
+    pieces = git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                              short_hash_length)
+    if pieces:
+        return render(pieces, style)
+    import re
     refs = set([r.strip() for r in refnames.strip("()").split(",")])
     # starting in git-1.8.3, tags are listed as "tag: foo-1.0" instead of
     # just "foo-1.0". If we see a "tag: " prefix, prefer those.
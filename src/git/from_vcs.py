@@ -1,4 +1,4 @@
-import os, sys, re # --STRIP DURING BUILD
+import os, sys, time # --STRIP DURING BUILD
 def register_vcs_handler(*args): # --STRIP DURING BUILD
     def nil(f): # --STRIP DURING BUILD
         return f # --STRIP DURING BUILD
@@ -6,54 +6,158 @@ def register_vcs_handler(*args): # --STRIP DURING BUILD
 def run_command(): pass # --STRIP DURING BUILD
 class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
 
+# variables that would point version queries at some other repository (or
+# another part of this one), and are dropped from the caller's environment
+GIT_ENV_REDIRECTS = ["GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE",
+                     "GIT_OBJECT_DIRECTORY",
+                     "GIT_ALTERNATE_OBJECT_DIRECTORIES", "GIT_COMMON_DIR",
+                     "GIT_NAMESPACE", "GIT_CEILING_DIRECTORIES",
+                     "GIT_DISCOVERY_ACROSS_FILESYSTEM", "GIT_PREFIX",
+                     "GIT_REPLACE_REF_BASE", "GIT_GRAFT_FILE",
+                     "GIT_SHALLOW_FILE"]
+
+# a copy of the source tree that leaves out .git can find the original
+# checkout through this file, see git_root_from_pointer()
+POINTER_FILE = ".versioneer-root"
+
+
+def git_root_from_pointer(root, verbose):
+    """Return the checkout that root's pointer file names, or None.
+
+    Builds that copy the source tree somewhere else (like pip's legacy
+    builds) can leave out .git, which may be huge, when the tree has a
+    pointer file written by 'versioneer.py pointer': git then runs in the
+    original checkout instead.
+    """
+    pointer = os.path.join(root, POINTER_FILE)
+    if not os.path.exists(pointer):
+        return None
+    import json
+    try:
+        with open(pointer, "r") as f:
+            target = json.load(f)["root"]
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        if verbose:
+            print("unable to read %s" % pointer)
+        return None
+    if not os.path.exists(os.path.join(target, ".git")):
+        if verbose:
+            print("%s points at %s, which has no .git" % (pointer, target))
+        return None
+    if verbose:
+        print("using the checkout in %s, named by %s" % (target, pointer))
+    return target
+
+
+def git_readonly_env():
+    """Build the environment for read-only git queries.
+
+    'git status' normally refreshes the index, which takes index.lock and
+    makes parallel builds of one checkout fight over it. GIT_OPTIONAL_LOCKS=0
+    (git-2.15) tells it to skip that optional write. ('git describe --dirty'
+    refreshes the index regardless, so we do not use it.)
+    Pagers, prompts and the fsmonitor hook are switched off too, and the
+    GIT_ENV_REDIRECTS variables (set e.g. inside git hooks) are dropped so
+    they cannot point the query at some other repository. Everything else
+    is passed through, since git itself may need it to run at all.
+    """
+    env = os.environ.copy()
+    for name in GIT_ENV_REDIRECTS:
+        env.pop(name, None)
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["GIT_PAGER"] = "cat"
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    # same as 'git -c core.fsmonitor=false' (git-2.31), after any such
+    # settings the caller made
+    try:
+        count = int(env.get("GIT_CONFIG_COUNT", "0"))
+    except ValueError:
+        count = 0
+    env["GIT_CONFIG_COUNT"] = str(count + 1)
+    env["GIT_CONFIG_KEY_%d" % count] = "core.fsmonitor"
+    env["GIT_CONFIG_VALUE_%d" % count] = "false"
+    return env
+
+
 @register_vcs_handler("git", "pieces_from_vcs")
-def git_pieces_from_vcs(tag_prefix, root, verbose, run_command=run_command):
+def git_pieces_from_vcs(tag_prefix, root, verbose, run_command=run_command,
+                        first_parent=False, short_hash_length=None,
+                        deadline=None):
     """Get version from 'git describe' in the root of the source tree.
 
     This only gets called if the git-archive 'subst' keywords were *not*
     expanded, and _version.py hasn't already been rewritten with a short
     version string, meaning we're inside a checked out source tree.
+
+    If first_parent is True, the closest tag and the distance are computed
+    along the first-parent (mainline) history only, ignoring any side
+    branches that were merged in.
+
+    If short_hash_length is set, the short revision id is always that many
+    characters of the full one, and git is told not to spend time looking
+    for a unique abbreviation.
+
+    If deadline (a time.time() value) is given, any git command still running
+    when it passes is killed, and CommandTimeoutError is raised.
     """
+    if not os.path.exists(os.path.join(root, ".git")):
+        root = git_root_from_pointer(root, verbose) or root
     if not os.path.exists(os.path.join(root, ".git")):
         if verbose:
             print("no .git in %s" % root)
         raise NotThisMethod("no .git directory")
+    import re
 
     GITS = ["git"]
     if sys.platform == "win32":
         GITS = ["git.cmd", "git.exe"]
-    # if there is a tag matching tag_prefix, this yields TAG-NUM-gHEX[-dirty]
-    # if there isn't one, this yields HEX[-dirty] (no NUM)
-    describe_out = run_command(GITS, ["describe", "--tags", "--dirty",
-                                      "--always", "--long",
-                                      "--match", "%s*" % tag_prefix],
-                               cwd=root)
+
+    env = git_readonly_env()
+
+    def run_git(args):
+        if deadline is None:
+            return run_command(GITS, args, cwd=root, env=env)
+        return run_command(GITS, args, cwd=root, env=env,
+                           timeout=deadline - time.time())
+
+    # if there is a tag matching tag_prefix, this yields TAG-NUM-gHEX
+    # if there isn't one, this yields HEX (no NUM)
+    describe_args = ["describe", "--tags", "--always", "--long",
+                     "--match", "%s*" % tag_prefix]
+    if first_parent:
+        # --first-parent was added in git-1.8.4
+        describe_args.append("--first-parent")
+    if short_hash_length:
+        # a full-length hash is unique by definition, so git can skip the
+        # object lookups it would do to disambiguate a shorter one
+        describe_args.append("--abbrev=40")
+    describe_out = run_git(describe_args)
     # --long was added in git-1.5.5
     if describe_out is None:
         raise NotThisMethod("'git describe' failed")
     describe_out = describe_out.strip()
-    full_out = run_command(GITS, ["rev-parse", "HEAD"], cwd=root)
+    full_out = run_git(["rev-parse", "HEAD"])
     if full_out is None:
         raise NotThisMethod("'git rev-parse' failed")
     full_out = full_out.strip()
+    # 'git describe --dirty' would also tell us this, but it rewrites the
+    # index even with GIT_OPTIONAL_LOCKS=0. Untracked files do not count,
+    # just as they don't for --dirty.
+    status_out = run_git(["status", "--porcelain", "--untracked-files=no"])
+    if status_out is None:
+        raise NotThisMethod("'git status' failed")
 
     pieces = {}
     pieces["long"] = full_out
-    pieces["short"] = full_out[:7]  # maybe improved later
+    # maybe improved later, unless short_hash_length pins it
+    pieces["short"] = full_out[:short_hash_length or 7]
     pieces["error"] = None
+    pieces["dirty"] = bool(status_out.strip())
 
-    # parse describe_out. It will be like TAG-NUM-gHEX[-dirty] or HEX[-dirty]
+    # parse describe_out. It will be like TAG-NUM-gHEX or HEX.
     # TAG might have hyphens.
     git_describe = describe_out
 
-    # look for -dirty suffix
-    dirty = git_describe.endswith("-dirty")
-    pieces["dirty"] = dirty
-    if dirty:
-        git_describe = git_describe[:git_describe.rindex("-dirty")]
-
-    # now we have TAG-NUM-gHEX or HEX
-
     if "-" in git_describe:
         # TAG-NUM-gHEX
         mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', git_describe)
@@ -78,13 +182,16 @@ def git_pieces_from_vcs(tag_prefix, root, verbose, run_command=run_command):
         pieces["distance"] = int(mo.group(2))
 
         # commit: short hex revision ID
-        pieces["short"] = mo.group(3)
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
 
     else:
         # HEX: no tags
         pieces["closest-tag"] = None
-        count_out = run_command(GITS, ["rev-list", "HEAD", "--count"],
-                                cwd=root)
+        count_args = ["rev-list", "HEAD", "--count"]
+        if first_parent:
+            count_args.append("--first-parent")
+        count_out = run_git(count_args)
         pieces["distance"] = int(count_out)  # total number of commits
 
     return pieces
@@ -4,9 +4,11 @@ def get_keywords(): pass # --STRIP DURING BUILD
 def git_versions_from_keywords(): pass # --STRIP DURING BUILD
 def git_pieces_from_vcs(): pass # --STRIP DURING BUILD
 def versions_from_parentdir(): pass # --STRIP DURING BUILD
+def versions_from_metadata(): pass # --STRIP DURING BUILD
 class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
 def render(): pass # --STRIP DURING BUILD
 
+
 def get_versions():
     """Get version information or return default if unable to do so."""
     # I am in _version.py, which lives at ROOT/VERSIONFILE_SOURCE. If we have
@@ -15,37 +17,70 @@ def get_versions():
     # case we can only use expanded keywords.
 
     cfg = get_config()
+    # --BEGIN STRATEGY keywords vcs parentdir
     verbose = cfg.verbose
+    # --END STRATEGY
+
+    # setup.cfg's strategies= may also name "file" and "env", which only
+    # setup.py can use: this file *is* the versionfile, and the environment
+    # of whoever imports it says nothing about how it was built
+    root = None
+    for strategy in cfg.strategies:
+        # --BEGIN STRATEGY keywords
+        if strategy == "keywords":
+            try:
+                return git_versions_from_keywords(
+                    get_keywords(), cfg.tag_prefix, verbose, style=cfg.style,
+                    short_hash_length=cfg.short_hash_length)
+            except NotThisMethod:
+                continue
+        # --END STRATEGY
+        if strategy not in ("vcs", "parentdir"):
+            continue
+
+        if root is None:
+            try:
+                root = os.path.realpath(__file__)
+                # versionfile_source is the relative path from the top of
+                # the source tree (where the .git directory might live) to
+                # this file. Invert this to find the root from __file__.
+                for i in cfg.versionfile_source.split('/'):
+                    root = os.path.dirname(root)
+            except NameError:
+                return {"version": "0+unknown", "full-revisionid": None,
+                        "dirty": None,
+                        "error": "unable to find root of source tree"}
+
+        # --BEGIN STRATEGY vcs
+        if strategy == "vcs":
+            try:
+                pieces = git_pieces_from_vcs(
+                    cfg.tag_prefix, root, verbose,
+                    first_parent=cfg.first_parent,
+                    short_hash_length=cfg.short_hash_length)
+                return render(pieces, cfg.style)
+            except NotThisMethod:
+                pass
+
+            # no checkout (git_pieces_from_vcs() gives up without running
+            # git if there is no .git), so maybe this file was installed:
+            # ask the metadata of the distribution that put it here
+            try:
+                return versions_from_metadata(__name__.split(".")[0],
+                                              verbose, versionfile=__file__)
+            except NotThisMethod:
+                pass
+        # --END STRATEGY
 
-    try:
-        return git_versions_from_keywords(get_keywords(), cfg.tag_prefix,
-                                          verbose)
-    except NotThisMethod:
-        pass
-
-    try:
-        root = os.path.realpath(__file__)
-        # versionfile_source is the relative path from the top of the source
-        # tree (where the .git directory might live) to this file. Invert
-        # this to find the root from __file__.
-        for i in cfg.versionfile_source.split('/'):
-            root = os.path.dirname(root)
-    except NameError:
-        return {"version": "0+unknown", "full-revisionid": None,
-                "dirty": None,
-                "error": "unable to find root of source tree"}
-
-    try:
-        pieces = git_pieces_from_vcs(cfg.tag_prefix, root, verbose)
-        return render(pieces, cfg.style)
-    except NotThisMethod:
-        pass
-
-    try:
-        if cfg.parentdir_prefix:
-            return versions_from_parentdir(cfg.parentdir_prefix, root, verbose)
-    except NotThisMethod:
-        pass
+        # --BEGIN STRATEGY parentdir
+        if strategy == "parentdir":
+            try:
+                if cfg.parentdir_prefix:
+                    return versions_from_parentdir(cfg.parentdir_prefix,
+                                                   root, verbose)
+            except NotThisMethod:
+                pass
+        # --END STRATEGY
 
     return {"version": "0+unknown", "full-revisionid": None,
             "dirty": None,
@@ -9,11 +9,14 @@
 
 """Git implementation of _version.py."""
 
-import errno
+# re and subprocess are only imported when needed, to keep importing
+# _version.py cheap
 import os
-import re
-import subprocess
+# --BEGIN STRATEGY vcs
+import errno
 import sys
+import time
+# --END STRATEGY
 
 
 def get_keywords():
@@ -24,7 +27,9 @@ def get_keywords():
     # get_keywords().
     git_refnames = "%(DOLLAR)sFormat:%%d%(DOLLAR)s"
     git_full = "%(DOLLAR)sFormat:%%H%(DOLLAR)s"
-    keywords = {"refnames": git_refnames, "full": git_full}
+    git_describe = "%(DOLLAR)sFormat:%(DESCRIBE)s%(DOLLAR)s"
+    keywords = {"refnames": git_refnames, "full": git_full,
+                "describe": git_describe}
     return keywords
 
 
@@ -43,6 +48,9 @@ def get_config():
     cfg.tag_prefix = "%(TAG_PREFIX)s"
     cfg.parentdir_prefix = "%(PARENTDIR_PREFIX)s"
     cfg.versionfile_source = "%(VERSIONFILE_SOURCE)s"
+    cfg.first_parent = %(FIRST_PARENT)s
+    cfg.short_hash_length = %(SHORT_HASH_LENGTH)s
+    cfg.strategies = %(STRATEGIES)s
     cfg.verbose = False
     return cfg
 
@@ -7,29 +7,47 @@
 """
 
 from __future__ import print_function
-try:
-    import configparser
-except ImportError:
-    import ConfigParser as configparser
 import errno
-import json
 import os
 import re
-import subprocess
 import sys
+import time
 
 
-class VersioneerConfig:
+class VersioneerConfig(object):
 
     """Container for Versioneer configuration parameters."""
 
+    __slots__ = ("VCS", "style", "versionfile_source", "versionfile_build",
+                 "tag_prefix", "parentdir_prefix", "verbose", "first_parent",
+                 "short_hash_length", "timeout", "ci_env", "manifest",
+                 "strategies", "project_name", "cache_dir", "cache_size")
+
+
+# the names that [versioneer]strategies= may list
+STRATEGIES = ("keywords", "file", "env", "vcs", "parentdir")
+
+
+# the project root found for each (cwd, sys.argv[0]), see get_root()
+ROOT_CACHE = {}
+
 
 def get_root():
     """Get the project root directory.
 
     We require that all commands are run from the project root, i.e. the
     directory that contains setup.py, setup.cfg, and versioneer.py .
+    The answer is remembered for as long as the process stays in the same
+    directory with the same sys.argv[0].
     """
+    key = (os.getcwd(), sys.argv[0] if sys.argv else "")
+    if key not in ROOT_CACHE:
+        ROOT_CACHE[key] = find_root()
+    return ROOT_CACHE[key]
+
+
+def find_root():
+    """Look for the project root directory, see get_root()."""
     root = os.path.realpath(os.path.abspath(os.getcwd()))
     setup_py = os.path.join(root, "setup.py")
     versioneer_py = os.path.join(root, "versioneer.py")
@@ -45,32 +63,95 @@ def get_root():
                "or in a way that lets it use sys.argv[0] to find the root "
                "(like 'python path/to/setup.py COMMAND').")
         raise VersioneerBadRootError(err)
+    return root
+
+
+# the versioneer.py of each other project root this process has built,
+# keyed by its path. See get_versioneer_for_root().
+VERSIONEER_MODULES = {}
+
+
+def get_versioneer_for_root(root):
+    """Return the versioneer.py module that belongs to a project root.
+
+    Certain runtime workflows (setup.py install/develop in a setuptools tree)
+    execute all dependencies in a single python process, so "versioneer" may
+    be imported multiple times, and python's shared module-import table will
+    cache the first one. Assume a main project A and a dependency B, which
+    use different versions of Versioneer: B's setup.py gets A's versioneer
+    when it does "import versioneer". Rather than evicting ourselves from
+    sys.modules (which made every later import re-run this whole module),
+    get_versions() and get_cmdclass() ask this function for B's own
+    versioneer.py and delegate to it. Each one is loaded once per process,
+    without touching sys.modules. Returns None when this module is the right
+    one (or the root has no versioneer.py of its own).
+    Also see https://github.com/warner/python-versioneer/issues/52
+    """
+    # compare real paths, or a symlinked versioneer.py would keep loading
+    # itself
+    versioneer_py = os.path.realpath(os.path.join(root, "versioneer.py"))
     try:
-        # Certain runtime workflows (setup.py install/develop in a setuptools
-        # tree) execute all dependencies in a single python process, so
-        # "versioneer" may be imported multiple times, and python's shared
-        # module-import table will cache the first one. So we can't use
-        # os.path.dirname(__file__), as that will find whichever
-        # versioneer.py was first imported, even in later projects.
         me = os.path.realpath(os.path.abspath(__file__))
-        if os.path.splitext(me)[0] != os.path.splitext(versioneer_py)[0]:
-            print("Warning: build in %s is using versioneer.py from %s"
-                  % (os.path.dirname(me), versioneer_py))
     except NameError:
-        pass
-    return root
+        return None
+    if os.path.splitext(me)[0] == os.path.splitext(versioneer_py)[0]:
+        return None
+    if not os.path.exists(versioneer_py):
+        print("Warning: build in %s is using versioneer.py from %s"
+              % (root, me))
+        return None
+    if versioneer_py not in VERSIONEER_MODULES:
+        try:
+            from importlib.util import (module_from_spec,
+                                        spec_from_file_location)
+        except ImportError:  # py2, py3.4
+            # imp.load_source() registers the module in sys.modules, and
+            # given the name "versioneer" would re-run B's versioneer.py
+            # inside the one already imported, so use a name of its own
+            import imp
+            name = "_versioneer_%d" % len(VERSIONEER_MODULES)
+            module = imp.load_source(name, versioneer_py)
+            del sys.modules[name]
+        else:
+            spec = spec_from_file_location("versioneer", versioneer_py)
+            module = module_from_spec(spec)
+            spec.loader.exec_module(module)
+        VERSIONEER_MODULES[versioneer_py] = module
+    return VERSIONEER_MODULES[versioneer_py]
+
+
+# the parsed setup.cfg of each project root, keyed by path, along with the
+# (mtime, size, inode) it was parsed at
+CONFIG_CACHE = {}
 
 
 def get_config_from_root(root):
-    """Read the project setup.cfg file to determine Versioneer config."""
+    """Read the project setup.cfg file to determine Versioneer config.
+
+    The file is only parsed again once it changes, so callers share one
+    VersioneerConfig per setup.cfg and must not modify it.
+    """
     # This might raise EnvironmentError (if setup.cfg is missing), or
     # configparser.NoSectionError (if it lacks a [versioneer] section), or
     # configparser.NoOptionError (if it lacks "VCS="). See the docstring at
     # the top of versioneer.py for instructions on writing your setup.cfg .
     setup_cfg = os.path.join(root, "setup.cfg")
-    parser = configparser.SafeConfigParser()
+    st = os.stat(setup_cfg)
+    stamp = (st.st_mtime, st.st_size, st.st_ino)
+    cached = CONFIG_CACHE.get(setup_cfg)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     with open(setup_cfg, "r") as f:
-        parser.readfp(f)
+        cfg = get_config_from_file(f)
+    CONFIG_CACHE[setup_cfg] = (stamp, cfg)
+    return cfg
+
+
+def get_config_from_file(f):
+    """Parse Versioneer config from an open setup.cfg-style file object."""
+    configparser = get_configparser()
+    parser = configparser.SafeConfigParser()
+    parser.readfp(f)
     VCS = parser.get("versioneer", "VCS")  # mandatory
 
     def get(parser, name):
@@ -87,9 +168,62 @@ def get_config_from_root(root):
         cfg.tag_prefix = ""
     cfg.parentdir_prefix = get(parser, "parentdir_prefix")
     cfg.verbose = get(parser, "verbose")
+    cfg.first_parent = get_boolean(get(parser, "first_parent"))
+    short_hash_length = get(parser, "short_hash_length")
+    cfg.short_hash_length = None
+    if short_hash_length:
+        cfg.short_hash_length = int(short_hash_length)
+    timeout = get(parser, "timeout")
+    cfg.timeout = None
+    if timeout:
+        cfg.timeout = float(timeout)
+    cfg.ci_env = get_boolean(get(parser, "ci_env"))
+    cfg.manifest = get(parser, "manifest")
+    strategies = get(parser, "strategies")
+    if strategies:
+        cfg.strategies = strategies.replace(",", " ").split()
+        for strategy in cfg.strategies:
+            if strategy not in STRATEGIES:
+                raise configparser.Error(
+                    "unknown strategy '%s' in [versioneer]strategies=, "
+                    "expected some of: %s" % (strategy, ", ".join(STRATEGIES)))
+    else:
+        cfg.strategies = ["keywords", "file", "vcs", "parentdir"]
+        if cfg.ci_env:
+            cfg.strategies.insert(2, "env")
+    cfg.cache_dir = get(parser, "cache_dir")
+    cfg.cache_size = 1000
+    cache_size = get(parser, "cache_size")
+    if cache_size:
+        cfg.cache_size = int(cache_size)
+    # setuptools reads the project name from here, if it is declared in
+    # setup.cfg at all
+    cfg.project_name = None
+    if parser.has_option("metadata", "name"):
+        cfg.project_name = parser.get("metadata", "name")
     return cfg
 
 
+def get_configparser():
+    """Import configparser (ConfigParser on python2) once it is needed.
+
+    Like json and subprocess, it is only imported by the functions that use
+    it, which keeps 'import versioneer' itself quick.
+    """
+    try:
+        import configparser
+    except ImportError:
+        import ConfigParser as configparser
+    return configparser
+
+
+def get_boolean(value):
+    """Interpret an optional setup.cfg value as a boolean flag."""
+    if value is None:
+        return False
+    return value.strip().lower() in ("1", "yes", "true", "on")
+
+
 class NotThisMethod(Exception):
 
     """Exception raised if a method is not valid for the current scenario."""
@@ -97,6 +231,9 @@ class NotThisMethod(Exception):
 # these dictionaries contain VCS-specific tools
 LONG_VERSION_PY = {}
 HANDLERS = {}
+# the slim build of versioneer.py keeps its _version.py templates here,
+# compressed, until get_long_version_py() needs one
+LONG_VERSION_PY_COMPRESSED = {}
 
 
 def register_vcs_handler(vcs, method):  # decorator
@@ -5,10 +5,13 @@ import os, sys, base64
 VERSIONEER_b64 = """
 @VERSIONEER-INSTALLER@
 """
+VERSIONEER_SLIM_b64 = """
+@VERSIONEER-INSTALLER-SLIM@
+"""
 newver = "@VERSIONEER-VERSION@"
 
 if len(sys.argv) < 2:
-    print("Usage: versioneer install")
+    print("Usage: versioneer install [--slim]")
     sys.exit(1)
 
 command = sys.argv[1]
@@ -16,11 +19,14 @@ if command == "version":
     print("versioneer (installer) %s" % newver)
     sys.exit(0)
 
-if command != "install":
-    print("Usage: versioneer install")
+if command != "install" or sys.argv[2:] not in ([], ["--slim"]):
+    print("Usage: versioneer install [--slim]")
     sys.exit(1)
 
-v = base64.b64decode(VERSIONEER_b64)
+if sys.argv[2:] == ["--slim"]:
+    v = base64.b64decode(VERSIONEER_SLIM_b64)
+else:
+    v = base64.b64decode(VERSIONEER_b64)
 if os.path.exists("versioneer.py"):
     for line in open("versioneer.py").readlines()[:5]:
         if line.startswith("# Version: "):
@@ -0,0 +1,123 @@
+import os, time # --STRIP DURING BUILD
+class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+def write_atomically(): pass # --STRIP DURING BUILD
+
+MANIFEST_ENV = "VERSIONEER_MANIFEST"
+
+# how long write_manifest_entry() waits for another writer's lock, before
+# deciding that it was left behind by a process that died
+MANIFEST_LOCK_TIMEOUT = 30
+
+
+def get_manifest_path(root, cfg):
+    """Locate the version manifest, if one is configured.
+
+    $VERSIONEER_MANIFEST wins over the 'manifest' option in setup.cfg. A
+    relative setup.cfg value is relative to the project root.
+    """
+    path = os.environ.get(MANIFEST_ENV) or cfg.manifest
+    if not path:
+        return None
+    return os.path.join(root, path)
+
+
+def manifest_keys(manifest, root, project_name):
+    """Return the keys under which a project may appear in a manifest."""
+    root = os.path.realpath(root)
+    # resolve the directory, not the file: build sandboxes often provide the
+    # manifest itself as a symlink to somewhere outside the sandbox
+    manifest_dir = os.path.dirname(os.path.abspath(manifest))
+    manifest_dir = os.path.realpath(manifest_dir)
+    keys = [root]
+    try:
+        relative = os.path.relpath(root, manifest_dir)
+        keys.append(relative.replace(os.sep, "/"))
+    except ValueError:
+        pass  # on another drive, so there is no relative path
+    if project_name:
+        keys.append(project_name)
+    return keys
+
+
+def read_manifest(manifest):
+    """Load a version manifest, returning {} if it is missing or broken."""
+    import json
+    try:
+        with open(manifest, "r") as f:
+            entries = json.load(f)
+    except (EnvironmentError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def lock_manifest(manifest):
+    """Take the manifest's lock file, returning its path for unlocking.
+
+    Several projects of one build may record their entries at the same time,
+    and each rewrites the whole manifest, so they take turns.
+    """
+    lock = manifest + ".lock"
+    deadline = time.time() + MANIFEST_LOCK_TIMEOUT
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            if not os.path.exists(lock):
+                raise  # not just someone else's lock
+            if time.time() > deadline:
+                print("removing stale lock %s" % lock)
+                try:
+                    os.unlink(lock)
+                except OSError:
+                    pass
+                deadline = time.time() + MANIFEST_LOCK_TIMEOUT
+            else:
+                time.sleep(0.01)
+            continue
+        os.close(fd)
+        return lock
+
+
+def versions_from_manifest(manifest, root, project_name, verbose):
+    """Look up this project's pre-computed versions in a manifest file.
+
+    The manifest is a JSON object that maps project roots (absolute, or
+    relative to the manifest's directory) or project names to the dicts that
+    get_versions() returned when the manifest was written.
+    """
+    entries = read_manifest(manifest)
+    for key in manifest_keys(manifest, root, project_name):
+        if key in entries:
+            if verbose:
+                print("found '%s' in manifest %s" % (key, manifest))
+            return entries[key]
+    if verbose:
+        print("manifest %s has no entry for %s" % (manifest, root))
+    raise NotThisMethod("project not in version manifest")
+
+
+def write_manifest_entry(manifest, root, project_name, versions):
+    """Record this project's versions in a manifest, keeping other entries.
+
+    Entries are stored under the root relative to the manifest, which stays
+    valid when the whole tree is moved (e.g. into a build sandbox), and under
+    the project name if setup.cfg has one.
+    """
+    import json
+    keys = manifest_keys(manifest, root, project_name)[1:]
+    if not keys:
+        keys = [os.path.realpath(root)]
+    lock = lock_manifest(manifest)
+    try:
+        entries = read_manifest(manifest)
+        for key in keys:
+            entries[key] = versions
+        # other projects in the same build may be reading the manifest
+        write_atomically(manifest,
+                         json.dumps(entries, sort_keys=True, indent=1,
+                                    separators=(",", ": ")) + "\n")
+    finally:
+        os.unlink(lock)
+    print("set %s in %s to '%s'" % (root, manifest, versions["version"]))
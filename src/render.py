@@ -1,11 +1,16 @@
+import re # --STRIP DURING BUILD
 
+
+# --BEGIN STYLE pep440 pep440-post
 def plus_or_dot(pieces):
     """Return a + if we don't already have one, else return a ."""
     if "+" in pieces.get("closest-tag", ""):
         return "."
     return "+"
+# --END STYLE
 
 
+# --BEGIN STYLE pep440
 def render_pep440(pieces):
     """Build up version string, with post-release "local version identifier".
 
@@ -29,8 +34,10 @@ def render_pep440(pieces):
         if pieces["dirty"]:
             rendered += ".dirty"
     return rendered
+# --END STYLE
 
 
+# --BEGIN STYLE pep440-pre
 def render_pep440_pre(pieces):
     """TAG[.post.devDISTANCE] -- No -dirty.
 
@@ -45,8 +52,10 @@ def render_pep440_pre(pieces):
         # exception #1
         rendered = "0.post.dev%d" % pieces["distance"]
     return rendered
+# --END STYLE
 
 
+# --BEGIN STYLE pep440-post
 def render_pep440_post(pieces):
     """TAG[.postDISTANCE[.dev0]+gHEX] .
 
@@ -72,8 +81,10 @@ def render_pep440_post(pieces):
             rendered += ".dev0"
         rendered += "+g%s" % pieces["short"]
     return rendered
+# --END STYLE
 
 
+# --BEGIN STYLE pep440-old
 def render_pep440_old(pieces):
     """TAG[.postDISTANCE[.dev0]] .
 
@@ -94,8 +105,10 @@ def render_pep440_old(pieces):
         if pieces["dirty"]:
             rendered += ".dev0"
     return rendered
+# --END STYLE
 
 
+# --BEGIN STYLE git-describe
 def render_git_describe(pieces):
     """TAG[-DISTANCE-gHEX][-dirty].
 
@@ -114,8 +127,10 @@ def render_git_describe(pieces):
     if pieces["dirty"]:
         rendered += "-dirty"
     return rendered
+# --END STYLE
 
 
+# --BEGIN STYLE git-describe-long
 def render_git_describe_long(pieces):
     """TAG-DISTANCE-gHEX[-dirty].
 
@@ -134,6 +149,7 @@ def render_git_describe_long(pieces):
     if pieces["dirty"]:
         rendered += "-dirty"
     return rendered
+# --END STYLE
 
 
 def render(pieces, style):
@@ -147,21 +163,109 @@ def render(pieces, style):
     if not style or style == "default":
         style = "pep440"  # the default
 
+    # each style is tested separately, so that 'versioneer.py setup' can
+    # leave out the ones a project doesn't use
+    rendered = None
+    # --BEGIN STYLE pep440
     if style == "pep440":
         rendered = render_pep440(pieces)
-    elif style == "pep440-pre":
+    # --END STYLE
+    # --BEGIN STYLE pep440-pre
+    if style == "pep440-pre":
         rendered = render_pep440_pre(pieces)
-    elif style == "pep440-post":
+    # --END STYLE
+    # --BEGIN STYLE pep440-post
+    if style == "pep440-post":
         rendered = render_pep440_post(pieces)
-    elif style == "pep440-old":
+    # --END STYLE
+    # --BEGIN STYLE pep440-old
+    if style == "pep440-old":
         rendered = render_pep440_old(pieces)
-    elif style == "git-describe":
+    # --END STYLE
+    # --BEGIN STYLE git-describe
+    if style == "git-describe":
         rendered = render_git_describe(pieces)
-    elif style == "git-describe-long":
+    # --END STYLE
+    # --BEGIN STYLE git-describe-long
+    if style == "git-describe-long":
         rendered = render_git_describe_long(pieces)
-    else:
+    # --END STYLE
+    if rendered is None:
         raise ValueError("unknown style '%s'" % style)
 
     return {"version": rendered, "full-revisionid": pieces["long"],
             "dirty": pieces["dirty"], "error": None}
 
+
+# --BEGIN SETUP ONLY
+# the normalized PEP 440 versions that the pep440* styles produce. The
+# git-describe styles, and tags that are not PEP 440 versions, won't match.
+PEP440_VERSION_RE = re.compile(r"""^(?:(?P<epoch>\d+)!)?
+    (?P<release>\d+(?:\.\d+)*)
+    (?:(?P<pre_l>a|b|rc)(?P<pre_n>\d+))?
+    (?:\.post(?P<post>\d*))?
+    (?:\.dev(?P<dev>\d*))?
+    (?:\+(?P<local>[a-z0-9]+(?:\.[a-z0-9]+)*))?$""", re.I | re.X)
+
+
+def version_tuple(version):
+    """Split a rendered version string into a tuple, or return None.
+
+    The release numbers become ints, and any pre-, post-, dev-release or
+    local part becomes one string each, so "1.2.post3.dev0+gabc" gives
+    (1, 2, "post3", "dev0", "gabc"). This makes 'version_tuple[:2] >=
+    (1, 2)' checks cheap. For full PEP 440 ordering, use
+    version_sort_key().
+    """
+    mo = PEP440_VERSION_RE.match(version)
+    if not mo:
+        return None
+    parts = [int(n) for n in mo.group("release").split(".")]
+    if mo.group("pre_l"):
+        parts.append(mo.group("pre_l").lower() + mo.group("pre_n"))
+    if mo.group("post") is not None:
+        parts.append("post" + (mo.group("post") or "0"))
+    if mo.group("dev") is not None:
+        parts.append("dev" + (mo.group("dev") or "0"))
+    if mo.group("local"):
+        parts.append(mo.group("local"))
+    return tuple(parts)
+
+
+def version_sort_key(version):
+    """Return a tuple that sorts like the PEP 440 version, or None.
+
+    Keys compare with plain tuple comparison, and follow the same rules as
+    'packaging.version.Version': dev releases sort before pre-releases,
+    which sort before the release, which sorts before its post-releases,
+    and a local version sorts after the same version without one.
+    """
+    mo = PEP440_VERSION_RE.match(version)
+    if not mo:
+        return None
+    epoch = int(mo.group("epoch") or 0)
+    release = [int(n) for n in mo.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()  # 1.0 == 1.0.0
+    pre_l, post, dev = mo.group("pre_l"), mo.group("post"), mo.group("dev")
+    # (rank, number): a dev release of the release itself comes first, then
+    # alpha, beta and release candidates, then the release itself
+    if pre_l:
+        pre = (["a", "b", "rc"].index(pre_l.lower()) + 1,
+               int(mo.group("pre_n")))
+    elif post is None and dev is not None:
+        pre = (0, 0)
+    else:
+        pre = (4, 0)
+    post = -1 if post is None else int(post or 0)
+    dev = (1, 0) if dev is None else (0, int(dev or 0))
+    # numeric local segments sort after alphanumeric ones
+    local = []
+    if mo.group("local"):
+        for segment in mo.group("local").lower().split("."):
+            if segment.isdigit():
+                local.append((1, int(segment), ""))
+            else:
+                local.append((0, 0, segment))
+    return (epoch, tuple(release), pre, post, dev, tuple(local))
+# --END SETUP ONLY
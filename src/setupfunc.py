@@ -1,11 +1,20 @@
 
 from __future__ import print_function # --STRIP DURING BUILD
-import os, sys  # --STRIP DURING BUILD
+import os, sys, re  # --STRIP DURING BUILD
 def get_root(): pass # --STRIP DURING BUILD
 def get_config_from_root(): pass # --STRIP DURING BUILD
 LONG_VERSION_PY = {} # --STRIP DURING BUILD
+LONG_VERSION_PY_COMPRESSED = {} # --STRIP DURING BUILD
 def do_vcs_install(): pass # --STRIP DURING BUILD
-configparser = None # --STRIP DURING BUILD
+def get_versions(): pass # --STRIP DURING BUILD
+def get_manifest_path(): pass # --STRIP DURING BUILD
+def write_manifest_entry(): pass # --STRIP DURING BUILD
+def versions_from_archive(): pass # --STRIP DURING BUILD
+def version_fingerprint(): pass # --STRIP DURING BUILD
+def write_atomically(): pass # --STRIP DURING BUILD
+POINTER_FILE = ".versioneer-root" # --STRIP DURING BUILD
+class NotThisMethod(Exception): pass  # --STRIP DURING BUILD
+def get_configparser(): pass # --STRIP DURING BUILD
 
 CONFIG_ERROR = """
 setup.cfg is missing the necessary Versioneer configuration. You need
@@ -51,29 +60,90 @@ del get_versions
 """
 
 
+def get_long_version_py(vcs):
+    """Return the _version.py template for the given VCS."""
+    if vcs not in LONG_VERSION_PY and vcs in LONG_VERSION_PY_COMPRESSED:
+        import base64
+        import zlib
+        compressed = base64.b64decode(LONG_VERSION_PY_COMPRESSED[vcs])
+        LONG_VERSION_PY[vcs] = zlib.decompress(compressed).decode("utf-8")
+    return LONG_VERSION_PY[vcs]
+
+
+def trim_sections(text, keep):
+    """Drop the sections of a template that keep(kind, names) turns down.
+
+    A section starts with a '# --BEGIN KIND [NAME...]' line and ends with
+    a '# --END KIND' line, and sections may be nested. The marker lines
+    themselves are always removed.
+    """
+    lines = []
+    kept = []  # one entry for each section we are in
+    for line in text.split("\n"):
+        marker = line.strip()
+        if marker.startswith("# --BEGIN "):
+            words = marker.split()[2:]
+            kept.append(keep(words[0], words[1:]))
+        elif marker.startswith("# --END "):
+            kept.pop()
+        elif all(kept):
+            lines.append(line)
+    # dropped sections leave the blank lines around them behind: allow two
+    # between top-level definitions, and one inside an indented block
+    text = re.sub(r"\n{4,}", "\n\n\n", "\n".join(lines))
+    return re.sub(r"\n{3,}(?=[ \t])", "\n\n", text)
+
+
+def trim_long_version_py(text, cfg):
+    """Cut a _version.py template down to the style and strategies in cfg.
+
+    Renderers for other styles, and the code behind strategies that are
+    not enabled (e.g. all of the git subprocess handling, for a project
+    that only uses keywords and parentdir), are left out of the file.
+    """
+    style = cfg.style
+    if not style or style == "default":
+        style = "pep440"
+
+    def keep(kind, names):
+        if kind == "STYLE":
+            return style in names
+        if kind == "STRATEGY":
+            return any(name in cfg.strategies for name in names)
+        return True
+    return trim_sections(text, keep)
+
+
 def do_setup():
     """Main VCS-independent setup function for installing Versioneer."""
+    configparser = get_configparser()
     root = get_root()
     try:
         cfg = get_config_from_root(root)
-    except (EnvironmentError, configparser.NoSectionError,
-            configparser.NoOptionError) as e:
+    except (EnvironmentError, configparser.Error) as e:
         if isinstance(e, (EnvironmentError, configparser.NoSectionError)):
             print("Adding sample versioneer config to setup.cfg",
                   file=sys.stderr)
             with open(os.path.join(root, "setup.cfg"), "a") as f:
                 f.write(SAMPLE_CONFIG)
+        elif not isinstance(e, configparser.NoOptionError):
+            print("Error in setup.cfg: %s" % e, file=sys.stderr)
         print(CONFIG_ERROR, file=sys.stderr)
         return 1
 
     print(" creating %s" % cfg.versionfile_source)
     with open(cfg.versionfile_source, "w") as f:
-        LONG = LONG_VERSION_PY[cfg.VCS]
+        LONG = trim_long_version_py(get_long_version_py(cfg.VCS), cfg)
         f.write(LONG % {"DOLLAR": "$",
                         "STYLE": cfg.style,
                         "TAG_PREFIX": cfg.tag_prefix,
+                        "DESCRIBE": "%%(describe:tags=true,match=%s*)"
+                                    % cfg.tag_prefix,
                         "PARENTDIR_PREFIX": cfg.parentdir_prefix,
                         "VERSIONFILE_SOURCE": cfg.versionfile_source,
+                        "FIRST_PARENT": cfg.first_parent,
+                        "SHORT_HASH_LENGTH": cfg.short_hash_length,
+                        "STRATEGIES": cfg.strategies,
                         })
 
     ipy = os.path.join(os.path.dirname(cfg.versionfile_source),
@@ -169,6 +239,102 @@ def scan_setup_py():
         errors += 1
     return errors
 
+
+def do_manifest(args):
+    """Add this project's current versions to a version manifest."""
+    root = get_root()
+    cfg = get_config_from_root(root)
+    if args:
+        manifest = os.path.abspath(args[0])
+    else:
+        manifest = get_manifest_path(root, cfg)
+    if not manifest:
+        print("usage: versioneer.py manifest [MANIFEST]", file=sys.stderr)
+        print("(or set $VERSIONEER_MANIFEST, or 'manifest =' in setup.cfg)",
+              file=sys.stderr)
+        return 1
+    versions = get_versions(use_manifest=False)
+    write_manifest_entry(manifest, root, cfg.project_name, versions)
+    return 0
+
+
+def do_archive(paths):
+    """Print the version of each sdist or git-archive, one JSON per line."""
+    if not paths:
+        print("usage: versioneer.py archive ARCHIVE...", file=sys.stderr)
+        return 1
+    import json
+    configparser = get_configparser()
+    errors = 0
+    for path in paths:
+        try:
+            versions = versions_from_archive(path)
+        except (NotThisMethod, EnvironmentError,
+                configparser.Error) as e:
+            print("%s: %s" % (path, e), file=sys.stderr)
+            errors += 1
+            continue
+        versions["archive"] = path
+        print(json.dumps(versions, sort_keys=True))
+    return errors
+
+
+def do_version(args):
+    """Print the version, without importing setuptools or distutils."""
+    usage = "usage: versioneer.py version [--json | --field NAME]"
+    if args and args[0].startswith("--field="):
+        args = ["--field", args[0][len("--field="):]]
+    if args not in ([], ["--json"]) and not (len(args) == 2
+                                             and args[0] == "--field"):
+        print(usage, file=sys.stderr)
+        return 1
+    versions = get_versions()
+    if not args:
+        print(versions["version"])
+    elif args[0] == "--json":
+        import json
+        print(json.dumps(versions, sort_keys=True))
+    else:
+        if args[1] not in versions:
+            print("unknown field '%s', try one of: %s"
+                  % (args[1], ", ".join(sorted(versions))), file=sys.stderr)
+            return 1
+        value = versions[args[1]]
+        print("" if value is None else value)
+    return 0
+
+
+def do_pointer(copies):
+    """Write a pointer file naming this checkout, see git_root_from_pointer().
+
+    It goes into the project root (so copies of the tree take it along), or
+    into each of the given copies instead.
+    """
+    import json
+    root = get_root()
+    if not os.path.exists(os.path.join(root, ".git")):
+        print("%s has no .git to point at" % root, file=sys.stderr)
+        return 1
+    contents = json.dumps({"root": root}, sort_keys=True) + "\n"
+    for copy in copies or [root]:
+        pointer = os.path.join(copy, POINTER_FILE)
+        write_atomically(pointer, contents)
+        print(" wrote %s" % pointer)
+    return 0
+
+
+def do_fingerprint(roots):
+    """Print the version fingerprint of each project root (default: ours)."""
+    configparser = get_configparser()
+    errors = 0
+    for root in roots or [get_root()]:
+        try:
+            print(version_fingerprint(root))
+        except (EnvironmentError, configparser.Error) as e:
+            print("%s: %s" % (root, e), file=sys.stderr)
+            errors += 1
+    return errors
+
 if __name__ == "__main__":
     cmd = sys.argv[1]
     if cmd == "setup":
@@ -176,3 +342,18 @@ if __name__ == "__main__":
         errors += scan_setup_py()
         if errors:
             sys.exit(1)
+    elif cmd == "manifest":
+        if do_manifest(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "archive":
+        if do_archive(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "version":
+        if do_version(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "pointer":
+        if do_pointer(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "fingerprint":
+        if do_fingerprint(sys.argv[2:]):
+            sys.exit(1)
@@ -1,15 +1,32 @@
-import sys, subprocess, errno # --STRIP DURING BUILD
+import sys, errno # --STRIP DURING BUILD
 
 
-def run_command(commands, args, cwd=None, verbose=False, hide_stderr=False):
-    """Call the given command(s)."""
+class CommandTimeoutError(Exception):
+
+    """Exception raised if a command was killed for running too long."""
+
+
+def run_command(commands, args, cwd=None, verbose=False, hide_stderr=False,
+                timeout=None, env=None):
+    """Call the given command(s).
+
+    If env is given, it replaces the environment of the child.
+
+    If timeout (in seconds) is given and the command is still running when
+    it expires, the child is killed and CommandTimeoutError is raised.
+    """
     assert isinstance(commands, list)
+    if timeout is not None and timeout <= 0:
+        raise CommandTimeoutError("no time left to run %s"
+                                  % str(commands[:1] + args))
+    import subprocess
     p = None
     for c in commands:
         try:
             dispcmd = str([c] + args)
             # remember shell=False, so use git.cmd on windows, not just git
-            p = subprocess.Popen([c] + args, cwd=cwd, stdout=subprocess.PIPE,
+            p = subprocess.Popen([c] + args, cwd=cwd, env=env,
+                                 stdout=subprocess.PIPE,
                                  stderr=(subprocess.PIPE if hide_stderr
                                          else None))
             break
@@ -25,7 +42,28 @@ def run_command(commands, args, cwd=None, verbose=False, hide_stderr=False):
         if verbose:
             print("unable to find command, tried %s" % (commands,))
         return None
-    stdout = p.communicate()[0].strip()
+    expired = []
+    if timeout is not None:
+        import threading
+
+        def kill():
+            expired.append(True)
+            try:
+                p.kill()
+            except EnvironmentError:
+                pass  # it finished on its own in the meantime
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    try:
+        stdout = p.communicate()[0].strip()
+    finally:
+        if timeout is not None:
+            timer.cancel()
+    if expired:
+        if verbose:
+            print("killed %s after %ss" % (dispcmd, timeout))
+        raise CommandTimeoutError("%s timed out after %ss"
+                                  % (dispcmd, timeout))
     if sys.version_info[0] >= 3:
         stdout = stdout.decode()
     if p.returncode != 0:
@@ -0,0 +1,97 @@
+#! /usr/bin/python
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, "src")
+sys.path.insert(0, ".")
+import common
+from subprocess_helper import run_command
+from versioneer import git_pieces_from_cache, git_pieces_from_vcs
+
+
+class Cache(common.Common, unittest.TestCase):
+    def setUp(self):
+        self.testdir = os.path.realpath(tempfile.mkdtemp())
+        self.root = self.subpath("demoapp")
+        self.cache_dir = self.subpath("cache")
+        os.mkdir(self.root)
+        self.git("init", "-q")
+        with open(os.path.join(self.root, "file"), "w") as f:
+            f.write("hello\n")
+        self.git("add", "file")
+        self.git("commit", "-q", "-m", "first")
+        self.git("tag", "1.0")
+        self.git("commit", "-q", "--allow-empty", "-m", "second")
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.testdir)
+
+    def run_command(self, commands, args, **kwargs):
+        self.calls.append(args[0])
+        return run_command(commands, args, **kwargs)
+
+    def pieces(self, root=None, cache_size=1000):
+        self.calls = []
+        return git_pieces_from_cache("", root or self.root, False,
+                                     self.cache_dir, cache_size,
+                                     run_command=self.run_command)
+
+    def entries(self):
+        return sorted(name for name in os.listdir(self.cache_dir)
+                      if name.endswith(".json"))
+
+    def test_hit(self):
+        expected = git_pieces_from_vcs("", self.root, False)
+        self.assertEqual(self.pieces(), expected)
+        self.assertIn("describe", self.calls)
+        self.assertEqual(self.pieces(), expected)
+        self.assertEqual(self.calls, ["status"])
+        self.assertEqual(len(self.entries()), 1)
+
+    def test_dirty(self):
+        self.pieces()
+        with open(os.path.join(self.root, "file"), "w") as f:
+            f.write("changed\n")
+        pieces = self.pieces()
+        self.assertEqual(self.calls, ["status"])
+        self.assertEqual(pieces["dirty"], True)
+        # untracked files do not make a tree dirty
+        self.git("checkout", "-q", "file")
+        with open(os.path.join(self.root, "new"), "w") as f:
+            f.write("new\n")
+        self.assertEqual(self.pieces()["dirty"], False)
+
+    def test_tags(self):
+        self.assertEqual(self.pieces()["closest-tag"], "1.0")
+        self.git("tag", "1.1")
+        self.assertEqual(self.pieces()["closest-tag"], "1.1")
+        self.assertIn("describe", self.calls)
+        self.git("pack-refs", "--all")
+        # the same tags, now packed, still hit
+        self.assertEqual(self.pieces()["closest-tag"], "1.1")
+        self.assertEqual(self.calls, ["status"])
+
+    def test_shared(self):
+        self.pieces()
+        clone = self.subpath("clone")
+        self.git("clone", "-q", self.root, clone)
+        worktree = self.subpath("worktree")
+        self.git("worktree", "add", "-q", worktree)
+        self.git("checkout", "-q", "--detach", "HEAD", workdir=worktree)
+        for root in [clone, worktree]:
+            self.assertEqual(self.pieces(root)["distance"], 1)
+            self.assertEqual(self.calls, ["status"])
+
+    def test_evict(self):
+        self.pieces(cache_size=2)
+        first = self.entries()
+        for i in range(2):
+            self.git("commit", "-q", "--allow-empty", "-m", "more")
+            self.pieces(cache_size=2)
+        self.assertEqual(len(self.entries()), 2)
+        self.assertNotIn(first[0], self.entries())
+
+
+if __name__ == '__main__':
+    unittest.main()
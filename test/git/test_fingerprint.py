@@ -0,0 +1,84 @@
+#! /usr/bin/python
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, "src")
+sys.path.insert(0, "test")
+sys.path.insert(0, ".")
+import common
+from project import write_setup_cfg
+from versioneer import version_fingerprint, write_depfile, depfile_escape
+
+
+class Fingerprint(common.Common, unittest.TestCase):
+    def setUp(self):
+        self.testdir = tempfile.mkdtemp()
+        self.root = self.subpath("demoapp")
+        os.mkdir(self.root)
+        write_setup_cfg(self.root)
+        self.git("init", "-q")
+        self.git("add", "setup.cfg")
+        self.git("commit", "-q", "-m", "first")
+
+    def tearDown(self):
+        shutil.rmtree(self.testdir)
+
+    def test_changes(self):
+        seen = [version_fingerprint(self.root)]
+        self.assertEqual(version_fingerprint(self.root), seen[-1])
+
+        def changed():
+            fp = version_fingerprint(self.root)
+            self.assertNotIn(fp, seen)
+            seen.append(fp)
+        self.git("tag", "1.0")
+        changed()
+        self.git("commit", "-q", "--allow-empty", "-m", "second")
+        changed()
+        self.git("checkout", "-q", "-b", "topic")
+        changed()
+        self.git("pack-refs", "--all")
+        changed()
+        with open(os.path.join(self.root, "setup.cfg"), "a") as f:
+            f.write("parentdir_prefix = demo-\n")
+        changed()
+        # unrelated files do not count
+        with open(os.path.join(self.root, "README"), "w") as f:
+            f.write("hello\n")
+        self.assertEqual(version_fingerprint(self.root), seen[-1])
+
+    def test_not_vcs(self):
+        shutil.rmtree(os.path.join(self.root, ".git"))
+        fp = version_fingerprint(self.root)
+        with open(os.path.join(self.root, "_version.py"), "w") as f:
+            f.write("# short\n")
+        self.assertNotEqual(version_fingerprint(self.root), fp)
+
+    def test_depfile(self):
+        self.git("tag", "1.0")
+        depfile = os.path.join(self.root, "version.d")
+        write_depfile(depfile, "build/version.txt", self.root)
+        with open(depfile) as f:
+            text = f.read()
+        rules = text.replace("\\\n", "").split("\n\n")
+        target, deps = rules[0].split(":", 1)
+        self.assertEqual(target, "build/version.txt")
+        deps = deps.split()
+        root = os.path.realpath(self.root)
+        git_dir = os.path.join(root, ".git")
+        for path in [os.path.join(root, "setup.cfg"),
+                     os.path.join(git_dir, "HEAD"),
+                     os.path.join(git_dir, "index"),
+                     os.path.join(git_dir, "refs", "tags")]:
+            self.assertIn(path, deps)
+        # missing files are left out, and the rest get empty rules
+        self.assertNotIn(os.path.join(root, "_version.py"), deps)
+        self.assertEqual([rule.strip() for rule in rules[1:]],
+                         ["%s:" % dep for dep in deps])
+
+    def test_escape(self):
+        self.assertEqual(depfile_escape("a b/#1/$x"), "a\\ b/\\#1/$$x")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 
 from __future__ import print_function
 import os, sys
+import time
 import shutil
 import tarfile
 import unittest
@@ -13,8 +14,9 @@ from pkg_resources import parse_version, SetuptoolsLegacyVersion
 sys.path.insert(0, "src")
 import common
 from render import render
+import from_metadata
 from git import from_vcs, from_keywords
-from subprocess_helper import run_command
+from subprocess_helper import run_command, CommandTimeoutError
 
 class ParseGitDescribe(unittest.TestCase):
     def setUp(self):
@@ -23,9 +25,11 @@ class ParseGitDescribe(unittest.TestCase):
         os.mkdir(self.fakegit)
 
     def test_pieces(self):
-        def pv(git_describe, do_error=False, expect_pieces=False):
-            def fake_run_command(exes, args, cwd=None):
+        def pv(git_describe, do_error=False, expect_pieces=False,
+               status=""):
+            def fake_run_command(exes, args, cwd=None, env=None):
                 if args[0] == "describe":
+                    self.assertNotIn("--dirty", args)
                     if do_error == "describe":
                         return None
                     return git_describe+"\n"
@@ -33,6 +37,10 @@ class ParseGitDescribe(unittest.TestCase):
                     if do_error == "rev-parse":
                         return None
                     return "longlong\n"
+                if args[0] == "status":
+                    if do_error == "status":
+                        return None
+                    return status
                 if args[0] == "rev-list":
                     return "42\n"
                 self.fail("git called in weird way: %s" % (args,))
@@ -43,12 +51,14 @@ class ParseGitDescribe(unittest.TestCase):
                           pv, "ignored", do_error="describe")
         self.assertRaises(from_vcs.NotThisMethod,
                           pv, "ignored", do_error="rev-parse")
+        self.assertRaises(from_vcs.NotThisMethod,
+                          pv, "ignored", do_error="status")
         self.assertEqual(pv("1f"),
                          {"closest-tag": None, "dirty": False, "error": None,
                           "distance": 42,
                           "long": "longlong",
                           "short": "longlon"})
-        self.assertEqual(pv("1f-dirty"),
+        self.assertEqual(pv("1f", status=" M file"),
                          {"closest-tag": None, "dirty": True, "error": None,
                           "distance": 42,
                           "long": "longlong",
@@ -58,7 +68,7 @@ class ParseGitDescribe(unittest.TestCase):
                           "distance": 0,
                           "long": "longlong",
                           "short": "1f"})
-        self.assertEqual(pv("v1.0-0-g1f-dirty"),
+        self.assertEqual(pv("v1.0-0-g1f", status=" M file"),
                          {"closest-tag": "1.0", "dirty": True, "error": None,
                           "distance": 0,
                           "long": "longlong",
@@ -68,17 +78,192 @@ class ParseGitDescribe(unittest.TestCase):
                           "distance": 1,
                           "long": "longlong",
                           "short": "1f"})
-        self.assertEqual(pv("v1.0-1-g1f-dirty"),
+        self.assertEqual(pv("v1.0-1-g1f", status=" M file"),
                          {"closest-tag": "1.0", "dirty": True, "error": None,
                           "distance": 1,
                           "long": "longlong",
                           "short": "1f"})
 
+    def test_first_parent(self):
+        calls = []
+        def fake_run_command(exes, args, cwd=None, env=None):
+            calls.append(args)
+            if args[0] == "describe":
+                return "1f\n"
+            if args[0] == "rev-parse":
+                return "longlong\n"
+            if args[0] == "status":
+                return ""
+            if args[0] == "rev-list":
+                return "42\n"
+            self.fail("git called in weird way: %s" % (args,))
+        pieces = from_vcs.git_pieces_from_vcs(
+            "v", self.fakeroot, verbose=False, run_command=fake_run_command,
+            first_parent=True)
+        self.assertEqual(pieces["distance"], 42)
+        for args in calls:
+            if args[0] in ("describe", "rev-list"):
+                self.assertIn("--first-parent", args)
+
+    def test_short_hash_length(self):
+        full = "250b7ca731388d8f016db2e06ab1d6289486424b"
+        def pv(git_describe):
+            def fake_run_command(exes, args, cwd=None, env=None):
+                if args[0] == "describe":
+                    self.assertIn("--abbrev=40", args)
+                    return git_describe+"\n"
+                if args[0] == "rev-parse":
+                    return full+"\n"
+                if args[0] == "status":
+                    return ""
+                if args[0] == "rev-list":
+                    return "42\n"
+                self.fail("git called in weird way: %s" % (args,))
+            return from_vcs.git_pieces_from_vcs(
+                "v", self.fakeroot, verbose=False,
+                run_command=fake_run_command, short_hash_length=10)
+        self.assertEqual(pv(full)["short"], "250b7ca731")
+        self.assertEqual(pv("v1.0-3-g%s" % full)["short"], "250b7ca731")
+
+    def test_deadline(self):
+        timeouts = []
+        def fake_run_command(exes, args, cwd=None, env=None, timeout=None):
+            timeouts.append(timeout)
+            if args[0] == "describe":
+                return "v1.0-1-g1f\n"
+            if args[0] == "rev-parse":
+                raise CommandTimeoutError("'git rev-parse' timed out")
+            self.fail("git called in weird way: %s" % (args,))
+        self.assertRaises(CommandTimeoutError,
+                          from_vcs.git_pieces_from_vcs,
+                          "v", self.fakeroot, verbose=False,
+                          run_command=fake_run_command,
+                          deadline=time.time() + 60)
+        self.assertEqual(len(timeouts), 2)
+        self.assertTrue(0 < timeouts[1] <= timeouts[0] <= 60, timeouts)
+
     def tearDown(self):
         os.rmdir(self.fakegit)
         os.rmdir(self.fakeroot)
 
 
+class ReadonlyEnv(unittest.TestCase):
+    def test_env(self):
+        saved = os.environ.copy()
+        os.environ["GIT_INDEX_FILE"] = "elsewhere"
+        os.environ["GIT_DIR"] = "elsewhere"
+        os.environ["LD_LIBRARY_PATH"] = "/opt/git/lib"
+        os.environ["LANG"] = "de_DE.UTF-8"
+        os.environ["GIT_CONFIG_COUNT"] = "1"
+        os.environ["GIT_CONFIG_KEY_0"] = "safe.directory"
+        try:
+            env = from_vcs.git_readonly_env()
+        finally:
+            os.environ.clear()
+            os.environ.update(saved)
+        self.assertEqual(env["GIT_OPTIONAL_LOCKS"], "0")
+        self.assertEqual(env["GIT_PAGER"], "cat")
+        self.assertEqual(env.get("PATH"), os.environ.get("PATH"))
+        self.assertEqual(env["LD_LIBRARY_PATH"], "/opt/git/lib")
+        self.assertEqual(env["LANG"], "de_DE.UTF-8")
+        self.assertNotIn("GIT_INDEX_FILE", env)
+        self.assertNotIn("GIT_DIR", env)
+        self.assertEqual(env["GIT_CONFIG_COUNT"], "2")
+        self.assertEqual(env["GIT_CONFIG_KEY_0"], "safe.directory")
+        self.assertEqual(env["GIT_CONFIG_KEY_1"], "core.fsmonitor")
+
+    def test_passed_to_git(self):
+        fakeroot = tempfile.mkdtemp()
+        os.mkdir(os.path.join(fakeroot, ".git"))
+        envs = []
+        def fake_run_command(exes, args, cwd=None, env=None):
+            envs.append(env)
+            if args[0] == "describe":
+                return "v1.0-1-g1f\n"
+            if args[0] == "rev-parse":
+                return "longlong\n"
+            if args[0] == "status":
+                return ""
+            self.fail("git called in weird way: %s" % (args,))
+        try:
+            from_vcs.git_pieces_from_vcs("v", fakeroot, verbose=False,
+                                         run_command=fake_run_command)
+        finally:
+            shutil.rmtree(fakeroot)
+        self.assertEqual(len(envs), 3)
+        for env in envs:
+            self.assertEqual(env["GIT_OPTIONAL_LOCKS"], "0")
+
+
+class ReadonlyIndex(common.Common, unittest.TestCase):
+    def setUp(self):
+        self.testdir = tempfile.mkdtemp()
+        os.mkdir(self.subpath("demoapp"))
+        with open(self.subpath("demoapp", "file"), "w") as f:
+            f.write("hello\n")
+        self.git("init", "-q")
+        self.git("add", "file")
+        self.git("commit", "-q", "-m", "first")
+        self.git("tag", "v1.0")
+
+    def tearDown(self):
+        shutil.rmtree(self.testdir)
+
+    def test_index_not_rewritten(self):
+        # a new mtime makes the index stale, which git would normally
+        # refresh (and rewrite) while checking whether the tree is dirty
+        t = time.time() + 100
+        os.utime(self.subpath("demoapp", "file"), (t, t))
+        index = self.subpath("demoapp", ".git", "index")
+        with open(index, "rb") as f:
+            before = f.read()
+        mtime = os.stat(index).st_mtime
+        pieces = from_vcs.git_pieces_from_vcs("v", self.subpath("demoapp"),
+                                              verbose=False,
+                                              run_command=run_command)
+        self.assertEqual(pieces["dirty"], False)
+        self.assertEqual(pieces["closest-tag"], "1.0")
+        with open(index, "rb") as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(os.stat(index).st_mtime, mtime)
+        with open(self.subpath("demoapp", "file"), "w") as f:
+            f.write("changed\n")
+        self.assertEqual(from_vcs.git_pieces_from_vcs(
+            "v", self.subpath("demoapp"), verbose=False,
+            run_command=run_command)["dirty"], True)
+
+
+class Metadata(unittest.TestCase):
+    def test_installed(self):
+        import setuptools
+        v = from_metadata.versions_from_metadata("setuptools", False)
+        self.assertEqual(v["version"], setuptools.__version__)
+        self.assertEqual(v["full-revisionid"], None)
+        self.assertEqual(v["error"], None)
+
+    def test_not_installed(self):
+        self.assertRaises(from_metadata.NotThisMethod,
+                          from_metadata.versions_from_metadata,
+                          "no_such_package_anywhere", False)
+
+
+class RunCommand(unittest.TestCase):
+    def test_timeout(self):
+        start = time.time()
+        self.assertRaises(CommandTimeoutError, run_command,
+                          [sys.executable], ["-c", "import time; time.sleep(30)"],
+                          timeout=0.5)
+        self.assertTrue(time.time() - start < 10)
+
+    def test_no_time_left(self):
+        self.assertRaises(CommandTimeoutError, run_command,
+                          [sys.executable], ["-c", "pass"], timeout=0)
+
+    def test_within_timeout(self):
+        out = run_command([sys.executable], ["-c", "print('hi')"], timeout=30)
+        self.assertEqual(out, "hi")
+
+
 class Keywords(unittest.TestCase):
     def parse(self, refnames, full, prefix=""):
         return from_keywords.git_versions_from_keywords(
@@ -116,6 +301,25 @@ class Keywords(unittest.TestCase):
         self.assertEqual(v["dirty"], False)
         self.assertEqual(v["error"], "no suitable tags")
 
+    def test_describe(self):
+        def parse(describe, style="pep440", prefix="v"):
+            return from_keywords.git_versions_from_keywords(
+                {"refnames": "(HEAD, master)", "full": "250b7ca731388d8f",
+                 "describe": describe}, prefix, False, style=style)
+        v = parse("v1.0-3-g250b7ca")
+        self.assertEqual(v["version"], "1.0+3.g250b7ca")
+        self.assertEqual(v["full-revisionid"], "250b7ca731388d8f")
+        self.assertEqual(v["dirty"], False)
+        self.assertEqual(v["error"], None)
+        self.assertEqual(parse("v1.0")["version"], "1.0")
+        self.assertEqual(parse("v1.0", "git-describe-long")["version"],
+                         "1.0-0-g250b7ca")
+        # old git leaves the placeholder alone; no tag at all expands to ""
+        for describe in ["%(describe:tags=true,match=v*)", ""]:
+            v = parse(describe)
+            self.assertEqual(v["version"], "0+unknown")
+            self.assertEqual(v["error"], "no suitable tags")
+
     def test_no_prefix(self):
         v = self.parse("(HEAD, master, 1.23)", "full", "missingprefix-")
         self.assertEqual(v["version"], "0+unknown")
@@ -263,6 +467,13 @@ class RenderPieces(unittest.TestCase):
 
 VERBOSE = False
 
+
+def git_expands_describe():
+    # git-archive learned to expand $Format:%(describe:tags=...)$ in 2.35
+    ver = run_command(common.GITS, ["--version"], ".", True)
+    numbers = ver.split()[2].split(".")[:2]
+    return tuple(int(n) for n in numbers) >= (2, 35)
+
 class Repo(common.Common, unittest.TestCase):
 
     # There are three tree states we're interested in:
@@ -396,11 +607,12 @@ class Repo(common.Common, unittest.TestCase):
                               "TE": [short, full, False, None],
                               })
 
-        # TD: expanded keywords only tell us about tags and full revisionids,
-        # not how many patches we are beyond a tag. So any TD git-archive
-        # tarball from a non-tagged version will give us an error. "dirty" is
-        # False, since the tree from which the tarball was created is
-        # necessarily clean.
+        # TD: expanded %d/%H keywords only tell us about tags and full
+        # revisionids, not how many patches we are beyond a tag. git-2.35
+        # and later also expand %(describe), which does, but only once some
+        # tag exists. Otherwise any TD git-archive tarball from a non-tagged
+        # version will give us an error. "dirty" is False, since the tree
+        # from which the tarball was created is necessarily clean.
 
         # S2: dirty the pre-tagged tree
         f = open(self.subpath("demoapp/setup.py"),"a")
@@ -452,10 +664,13 @@ class Repo(common.Common, unittest.TestCase):
         self.git("commit", "-m", "dirty")
         full = self.git("rev-parse", "HEAD")
         short = "1.0+1.g%s" % full[:7]
+        TD = ["0+unknown", full, False, NOTAG]
+        if git_expands_describe():
+            TD = [short, full, False, None]
         self.do_checks("S5", {"TA": [short, full, False, None],
                               "TB": ["0+unknown", None, None, UNABLE],
                               "TC": [short, full, False, None],
-                              "TD": ["0+unknown", full, False, NOTAG],
+                              "TD": TD,
                               "TE": [short, full, False, None],
                               })
 
@@ -468,7 +683,7 @@ class Repo(common.Common, unittest.TestCase):
         self.do_checks("S6", {"TA": [short, full, True, None],
                               "TB": ["0+unknown", None, None, UNABLE],
                               "TC": [short, full, True, None],
-                              "TD": ["0+unknown", full, False, NOTAG],
+                              "TD": TD,
                               "TE": [short, full, True, None],
                               })
 
@@ -0,0 +1,76 @@
+#! /usr/bin/python
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, "src")
+sys.path.insert(0, "test")
+sys.path.insert(0, ".")
+import common
+from project import write_setup_cfg
+import versioneer
+from versioneer import (git_pieces_from_vcs, git_pieces_from_cache,
+                        git_fingerprint_inputs, NotThisMethod, POINTER_FILE)
+
+
+class Pointer(common.Common, unittest.TestCase):
+    def setUp(self):
+        self.testdir = os.path.realpath(tempfile.mkdtemp())
+        self.root = self.subpath("demoapp")
+        self.copy = self.subpath("build")
+        os.mkdir(self.root)
+        shutil.copy(os.path.splitext(versioneer.__file__)[0] + ".py",
+                    os.path.join(self.root, "versioneer.py"))
+        with open(os.path.join(self.root, "setup.py"), "w") as f:
+            f.write("# demo\n")
+        write_setup_cfg(self.root)
+        self.git("init", "-q")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "1")
+        self.git("tag", "1.0")
+        self.git("commit", "-q", "--allow-empty", "-m", "2")
+
+    def tearDown(self):
+        shutil.rmtree(self.testdir)
+
+    def copy_tree(self):
+        shutil.copytree(self.root, self.copy,
+                        ignore=shutil.ignore_patterns(".git"))
+
+    def write_pointer(self, *args):
+        self.python("versioneer.py", "pointer", *args)
+
+    def test_no_pointer(self):
+        self.copy_tree()
+        self.assertRaises(NotThisMethod, git_pieces_from_vcs, "", self.copy,
+                          False)
+
+    def test_pointer(self):
+        expected = git_pieces_from_vcs("", self.root, False)
+        self.write_pointer()
+        self.copy_tree()
+        self.assertEqual(git_pieces_from_vcs("", self.copy, False), expected)
+        cache_dir = self.subpath("cache")
+        self.assertEqual(git_pieces_from_cache("", self.copy, False,
+                                               cache_dir), expected)
+        inputs = [path for how, path in git_fingerprint_inputs(self.copy)]
+        self.assertIn(os.path.join(self.copy, POINTER_FILE), inputs)
+        self.assertIn(os.path.join(self.root, ".git", "HEAD"), inputs)
+
+    def test_pointer_into_copy(self):
+        self.copy_tree()
+        self.write_pointer(self.copy)
+        self.assertFalse(os.path.exists(os.path.join(self.root,
+                                                     POINTER_FILE)))
+        self.assertEqual(git_pieces_from_vcs("", self.copy, False)["distance"],
+                         1)
+
+    def test_stale_pointer(self):
+        self.write_pointer()
+        self.copy_tree()
+        shutil.rmtree(os.path.join(self.root, ".git"))
+        self.assertRaises(NotThisMethod, git_pieces_from_vcs, "", self.copy,
+                          False)
+
+
+if __name__ == '__main__':
+    unittest.main()
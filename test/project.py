@@ -0,0 +1,25 @@
+"""The setup.cfg shared by the tests that build a small project on disk."""
+
+import os
+
+SETUP_CFG = """
+[versioneer]
+VCS = git
+style = pep440
+versionfile_source = %(versionfile_source)s
+tag_prefix = %(tag_prefix)s
+"""
+
+
+def setup_cfg(versionfile_source="_version.py", tag_prefix="",
+              parentdir_prefix=None):
+    text = SETUP_CFG % {"versionfile_source": versionfile_source,
+                        "tag_prefix": tag_prefix}
+    if parentdir_prefix is not None:
+        text += "parentdir_prefix = %s\n" % parentdir_prefix
+    return text
+
+
+def write_setup_cfg(root, **options):
+    with open(os.path.join(root, "setup.cfg"), "w") as f:
+        f.write(setup_cfg(**options))
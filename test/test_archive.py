@@ -0,0 +1,137 @@
+import unittest
+import os, io, sys, json, subprocess, tarfile, zipfile, tempfile, shutil
+
+import versioneer
+from versioneer import versions_from_archive, NotThisMethod
+from project import setup_cfg
+
+SETUP_CFG = setup_cfg(versionfile_source="src/demo/_version.py",
+                      tag_prefix="demo-", parentdir_prefix="demo-")
+
+SHORT_VERSION_PY = """
+version_json = '''
+{"dirty": false, "error": null, "full-revisionid": "abc123", "version": "1.2"}
+'''  # END VERSION_JSON
+"""
+
+# what 'git archive' leaves behind in an unmodified long _version.py
+LONG_VERSION_PY = '''
+def get_keywords():
+    git_refnames = "%s"
+    git_full = "1076c978a8d3cfc70f408fe5974aa6c092c949ac"
+    git_describe = "%s"
+'''
+
+
+class Archive(unittest.TestCase):
+    def setUp(self):
+        self.top = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.top)
+
+    def make_tarball(self, files, name="demo-1.0.tar.gz"):
+        path = os.path.join(self.top, name)
+        t = tarfile.open(path, "w:gz")
+        for fn, contents in files:
+            data = contents.encode("utf-8")
+            info = tarfile.TarInfo(fn)
+            info.size = len(data)
+            t.addfile(info, io.BytesIO(data))
+        t.close()
+        return path
+
+    def make_zipfile(self, files, name="demo-1.0.zip"):
+        path = os.path.join(self.top, name)
+        z = zipfile.ZipFile(path, "w")
+        for fn, contents in files:
+            z.writestr(fn, contents)
+        z.close()
+        return path
+
+    def test_short_file(self):
+        files = [("demo-1.0/setup.cfg", SETUP_CFG),
+                 ("demo-1.0/src/demo/_version.py", SHORT_VERSION_PY)]
+        for path in [self.make_tarball(files), self.make_zipfile(files)]:
+            v = versions_from_archive(path)
+            self.assertEqual(v["version"], "1.2")
+            self.assertEqual(v["full-revisionid"], "abc123")
+
+    def test_versionfile_before_setup_cfg(self):
+        # the tarball has to be read a second time to find _version.py if
+        # it came first and was not buffered, so check both orders
+        files = [("demo-1.0/src/demo/_version.py", SHORT_VERSION_PY),
+                 ("demo-1.0/src/other/_version.py", "junk"),
+                 ("demo-1.0/setup.cfg", SETUP_CFG)]
+        v = versions_from_archive(self.make_tarball(files))
+        self.assertEqual(v["version"], "1.2")
+
+    def test_no_prefix(self):
+        # 'git archive' without --prefix: sub/setup.cfg streams past before
+        # the project's own, and has no [versioneer] section
+        files = [("README", "hi"),
+                 ("sub/setup.cfg", "[metadata]\nname = sub\n"),
+                 ("setup.cfg", SETUP_CFG),
+                 ("src/demo/_version.py", SHORT_VERSION_PY)]
+        v = versions_from_archive(self.make_tarball(files))
+        self.assertEqual(v["version"], "1.2")
+        v = versions_from_archive(self.make_zipfile(files))
+        self.assertEqual(v["version"], "1.2")
+
+    def test_keywords(self):
+        kw = LONG_VERSION_PY % (" (HEAD -> master, tag: demo-2.0)", "")
+        files = [("demo-1.0/setup.cfg", SETUP_CFG),
+                 ("demo-1.0/src/demo/_version.py", kw)]
+        v = versions_from_archive(self.make_tarball(files))
+        self.assertEqual(v["version"], "2.0")
+        kw = LONG_VERSION_PY % (" (HEAD -> master)", "demo-2.0-3-g1076c97")
+        files = [("demo-1.0/setup.cfg", SETUP_CFG),
+                 ("demo-1.0/src/demo/_version.py", kw)]
+        v = versions_from_archive(self.make_zipfile(files))
+        self.assertEqual(v["version"], "2.0+3.g1076c97")
+
+    def test_parentdir(self):
+        kw = LONG_VERSION_PY % ("$Format:%d$", "$Format:%(describe)$")
+        files = [("demo-1.0/setup.cfg", SETUP_CFG),
+                 ("demo-1.0/src/demo/_version.py", kw)]
+        v = versions_from_archive(self.make_tarball(files))
+        self.assertEqual(v["version"], "1.0")
+        files = [("elsewhere/setup.cfg", SETUP_CFG)]
+        v = versions_from_archive(self.make_tarball(files))
+        self.assertEqual(v["version"], "0+unknown")
+
+    def test_no_setup_cfg(self):
+        files = [("demo-1.0/README", "hi")]
+        self.assertRaises(NotThisMethod, versions_from_archive,
+                          self.make_tarball(files))
+        self.assertRaises(NotThisMethod, versions_from_archive,
+                          self.make_zipfile(files))
+
+    def test_not_an_archive(self):
+        path = os.path.join(self.top, "demo-1.0.tar.gz")
+        with open(path, "w") as f:
+            f.write("not a tarball\n")
+        self.assertRaises(NotThisMethod, versions_from_archive, path)
+
+    def test_corrupt_zipfile(self):
+        path = self.make_zipfile([("demo-1.0/setup.cfg", SETUP_CFG)])
+        with open(path, "rb") as f:
+            data = f.read()
+        # damage the contents of setup.cfg, which breaks its CRC
+        data = data.replace(b"versionfile_source", b"VERSIONFILE_SOURCE")
+        with open(path, "wb") as f:
+            f.write(data)
+        self.assertRaises(NotThisMethod, versions_from_archive, path)
+
+    def test_do_archive_reports_bad_files(self):
+        bad = os.path.join(self.top, "bad.tar.gz")
+        with open(bad, "w") as f:
+            f.write("not a tarball\n")
+        good = self.make_tarball([("demo-1.0/setup.cfg", SETUP_CFG)])
+        p = subprocess.Popen([sys.executable, versioneer.__file__, "archive",
+                              bad, good],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = p.communicate()
+        self.assertEqual(p.returncode, 1)
+        self.assertIn(bad, err.decode("utf-8"))
+        self.assertEqual(json.loads(out.decode("utf-8"))["archive"], good)
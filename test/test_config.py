@@ -36,6 +36,12 @@ class Parser(unittest.TestCase):
         self.assertEqual(cfg.tag_prefix, "v")
         self.assertEqual(cfg.parentdir_prefix, "petmail-")
         self.assertEqual(cfg.verbose, None)
+        self.assertEqual(cfg.first_parent, False)
+        self.assertEqual(cfg.short_hash_length, None)
+        self.assertEqual(cfg.timeout, None)
+        self.assertEqual(cfg.ci_env, False)
+        self.assertEqual(cfg.manifest, None)
+        self.assertEqual(cfg.project_name, None)
 
     def test_empty(self):
         self.assertRaises(configparser.NoSectionError,
@@ -66,3 +72,73 @@ class Parser(unittest.TestCase):
         self.assertEqual(cfg.tag_prefix, "")
         cfg = self.parse("[versioneer]\nVCS=git\ntag_prefix=\"\"")
         self.assertEqual(cfg.tag_prefix, "")
+
+    def test_first_parent(self):
+        cfg = self.parse("[versioneer]\nVCS=git\nfirst_parent = true")
+        self.assertEqual(cfg.first_parent, True)
+        cfg = self.parse("[versioneer]\nVCS=git\nfirst_parent = 0")
+        self.assertEqual(cfg.first_parent, False)
+
+    def test_short_hash_length(self):
+        cfg = self.parse("[versioneer]\nVCS=git\nshort_hash_length = 10")
+        self.assertEqual(cfg.short_hash_length, 10)
+
+    def test_timeout(self):
+        cfg = self.parse("[versioneer]\nVCS=git\ntimeout = 2.5")
+        self.assertEqual(cfg.timeout, 2.5)
+
+    def test_project_name(self):
+        cfg = self.parse("[metadata]\nname = petmail\n"
+                         "[versioneer]\nVCS=git\nmanifest = ../v.json")
+        self.assertEqual(cfg.project_name, "petmail")
+        self.assertEqual(cfg.manifest, "../v.json")
+
+    def test_strategies(self):
+        cfg = self.parse("[versioneer]\nVCS=git")
+        self.assertEqual(cfg.strategies,
+                         ["keywords", "file", "vcs", "parentdir"])
+        cfg = self.parse("[versioneer]\nVCS=git\nci_env = yes")
+        self.assertEqual(cfg.strategies,
+                         ["keywords", "file", "env", "vcs", "parentdir"])
+        cfg = self.parse("[versioneer]\nVCS=git\nstrategies = file, vcs")
+        self.assertEqual(cfg.strategies, ["file", "vcs"])
+        cfg = self.parse("[versioneer]\nVCS=git\nstrategies = vcs parentdir")
+        self.assertEqual(cfg.strategies, ["vcs", "parentdir"])
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(configparser.Error) as cm:
+            self.parse("[versioneer]\nVCS=git\nstrategies = vcs, git")
+        self.assertIn("unknown strategy 'git'", str(cm.exception))
+
+    def test_cache(self):
+        cfg = self.parse("[versioneer]\nVCS=git")
+        self.assertEqual(cfg.cache_dir, None)
+        self.assertEqual(cfg.cache_size, 1000)
+        cfg = self.parse("[versioneer]\nVCS=git\ncache_dir = ~/.cache/v\n"
+                         "cache_size = 50")
+        self.assertEqual(cfg.cache_dir, "~/.cache/v")
+        self.assertEqual(cfg.cache_size, 50)
+
+
+class Cache(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.setup_cfg = os.path.join(self.root, "setup.cfg")
+        with open(self.setup_cfg, "w") as f:
+            f.write(base)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_cached(self):
+        cfg = get_config_from_root(self.root)
+        self.assertTrue(get_config_from_root(self.root) is cfg)
+        self.assertRaises(AttributeError, setattr, cfg, "typo", 1)
+
+    def test_changed(self):
+        cfg = get_config_from_root(self.root)
+        with open(self.setup_cfg, "w") as f:
+            f.write(base.replace("tag_prefix = v", "tag_prefix = release-"))
+        cfg2 = get_config_from_root(self.root)
+        self.assertEqual(cfg2.tag_prefix, "release-")
+        self.assertFalse(cfg2 is cfg)
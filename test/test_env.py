@@ -0,0 +1,75 @@
+import unittest
+
+from versioneer import pieces_from_env, render, NotThisMethod
+
+FULL = "250b7ca731388d8f016db2e06ab1d6289486424b"
+
+
+class FromEnv(unittest.TestCase):
+    def pieces(self, environ, prefix="v"):
+        return pieces_from_env(prefix, False, environ=environ)
+
+    def test_nothing(self):
+        self.assertRaises(NotThisMethod, self.pieces, {})
+
+    def test_generic(self):
+        p = self.pieces({"VERSIONEER_FULL_REVISIONID": FULL,
+                         "VERSIONEER_CLOSEST_TAG": "v1.0",
+                         "VERSIONEER_DISTANCE": "3",
+                         "VERSIONEER_DIRTY": "true"})
+        self.assertEqual(p, {"long": FULL, "short": "250b7ca",
+                             "closest-tag": "1.0", "distance": 3,
+                             "dirty": True, "error": None})
+        self.assertEqual(render(p, "pep440")["version"],
+                         "1.0+3.g250b7ca.dirty")
+
+    def test_github_tag(self):
+        p = self.pieces({"GITHUB_SHA": FULL, "GITHUB_REF": "refs/tags/v2.1"})
+        self.assertEqual(p["closest-tag"], "2.1")
+        self.assertEqual(p["distance"], 0)
+        self.assertEqual(p["dirty"], False)
+        self.assertEqual(render(p, "pep440")["version"], "2.1")
+
+    def test_github_branch(self):
+        # no tag, so no way to know the distance
+        self.assertRaises(NotThisMethod, self.pieces,
+                          {"GITHUB_SHA": FULL, "GITHUB_REF": "refs/heads/v2"})
+
+    def test_gitlab_tag(self):
+        p = self.pieces({"CI_COMMIT_SHA": FULL, "CI_COMMIT_TAG": "v3.0"})
+        self.assertEqual(p["closest-tag"], "3.0")
+
+    def test_wrong_prefix(self):
+        self.assertRaises(NotThisMethod, self.pieces,
+                          {"TRAVIS_COMMIT": FULL, "TRAVIS_TAG": "other-1.0"})
+
+    def test_untagged_with_distance(self):
+        p = self.pieces({"CIRCLE_SHA1": FULL, "VERSIONEER_DISTANCE": "7"})
+        self.assertEqual(p["closest-tag"], None)
+        self.assertEqual(render(p, "pep440")["version"],
+                         "0+untagged.7.g250b7ca")
+
+    def test_bad_distance(self):
+        for distance in ["", "abc"]:
+            self.assertRaises(NotThisMethod, self.pieces,
+                              {"VERSIONEER_FULL_REVISIONID": FULL,
+                               "VERSIONEER_CLOSEST_TAG": "v1.0",
+                               "VERSIONEER_DISTANCE": distance})
+
+    def test_generic_tag_with_ci_commit(self):
+        # a branch build, where the job exported the closest tag itself
+        p = self.pieces({"GITHUB_SHA": FULL, "GITHUB_REF": "refs/heads/main",
+                         "VERSIONEER_CLOSEST_TAG": "v1.2",
+                         "VERSIONEER_DISTANCE": "3"})
+        self.assertEqual(p["closest-tag"], "1.2")
+        self.assertEqual(render(p, "pep440")["version"], "1.2+3.g250b7ca")
+        p = self.pieces({"CI_COMMIT_SHA": FULL, "CI_COMMIT_TAG": "v9.0",
+                         "VERSIONEER_CLOSEST_TAG": "v1.2",
+                         "VERSIONEER_DISTANCE": "3"})
+        self.assertEqual(p["closest-tag"], "1.2")
+
+    def test_short_hash_length(self):
+        p = pieces_from_env("v", False, short_hash_length=12,
+                            environ={"GITHUB_SHA": FULL,
+                                     "GITHUB_REF": "refs/tags/v2.1"})
+        self.assertEqual(p["short"], FULL[:12])
@@ -0,0 +1,112 @@
+import unittest
+import os, sys, shutil, subprocess, tempfile
+
+import versioneer
+from project import write_setup_cfg
+
+# modules that a plain "import versioneer; versioneer.get_version()" should
+# not need to pay for
+HEAVY = ["subprocess", "json", "configparser", "ConfigParser", "tarfile",
+         "zipfile", "zlib", "base64"]
+
+SHORT_VERSION_PY = """
+versions = {'dirty': False, 'error': None, 'full-revisionid': 'abc', \
+'version': '1.0'}
+
+
+def get_versions():
+    return dict(versions)
+"""
+
+PROBE = """
+import sys
+before = set(sys.modules)
+import versioneer
+%s
+print(" ".join(sorted(set(sys.modules) - before)))
+"""
+
+
+class ImportBudget(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        shutil.copy(os.path.splitext(versioneer.__file__)[0] + ".py",
+                    os.path.join(self.root, "versioneer.py"))
+        with open(os.path.join(self.root, "setup.py"), "w") as f:
+            f.write("# demo\n")
+        write_setup_cfg(self.root, versionfile_source="demo/_version.py",
+                        parentdir_prefix="demo-")
+        os.mkdir(os.path.join(self.root, "demo"))
+        with open(os.path.join(self.root, "demo", "_version.py"), "w") as f:
+            f.write(SHORT_VERSION_PY)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def probe(self, code=""):
+        p = subprocess.Popen([sys.executable, "-c", PROBE % code],
+                             cwd=self.root, stdout=subprocess.PIPE)
+        out = p.communicate()[0].decode("ascii")
+        self.assertEqual(p.returncode, 0)
+        return out.split()
+
+    def assertNotLoaded(self, loaded, names):
+        for name in names:
+            self.assertNotIn(name, loaded)
+
+    def test_import(self):
+        self.assertNotLoaded(self.probe(),
+                             HEAVY + ["distutils", "setuptools"])
+
+    def test_get_version(self):
+        loaded = self.probe("assert versioneer.get_version() == '1.0'")
+        self.assertNotLoaded(loaded, [name for name in HEAVY
+                                      if "onfig" not in name])
+
+    def test_version_cli(self):
+        # what "python versioneer.py version --field version" loads
+        loaded = self.probe("""
+import runpy
+sys.argv = ["versioneer.py", "version", "--field", "version"]
+runpy.run_path("versioneer.py", run_name="__main__")
+""")
+        self.assertEqual(loaded[0], "1.0")
+        self.assertNotLoaded(loaded, ["subprocess", "json", "distutils",
+                                      "setuptools"])
+
+    def run_cli(self, *args):
+        p = subprocess.Popen([sys.executable, "versioneer.py"] + list(args),
+                             cwd=self.root, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE)
+        out, err = p.communicate()
+        return p.returncode, out.decode("ascii").strip()
+
+    def test_version_output(self):
+        self.assertEqual(self.run_cli("version"), (0, "1.0"))
+        self.assertEqual(self.run_cli("version", "--field=full-revisionid"),
+                         (0, "abc"))
+        self.assertEqual(self.run_cli("version", "--field", "error"), (0, ""))
+        self.assertEqual(self.run_cli("version", "--json"),
+                         (0, '{"dirty": false, "error": null, '
+                          '"full-revisionid": "abc", "version": "1.0"}'))
+        self.assertEqual(self.run_cli("version", "--field", "nope")[0], 1)
+        self.assertEqual(self.run_cli("version", "--verbose")[0], 1)
+
+    def test_slim(self):
+        top = os.path.dirname(os.path.abspath(versioneer.__file__))
+        if not os.path.exists(os.path.join(top, "src", "header.py")):
+            raise unittest.SkipTest("needs the versioneer source tree")
+        slim = os.path.join(self.root, "versioneer.py")
+        subprocess.check_call([sys.executable, "setup.py", "-q",
+                               "make_versioneer", "--slim", "--output", slim],
+                              cwd=top)
+        self.assertTrue(os.path.getsize(slim) <
+                        os.path.getsize(versioneer.__file__))
+        self.assertNotLoaded(self.probe(), HEAVY)
+        loaded = self.probe("""
+import versioneer as v
+print(v.get_version())
+assert v.get_long_version_py('git') == %r
+""" % versioneer.LONG_VERSION_PY["git"])
+        self.assertEqual(loaded[0], "1.0")
+        self.assertIn("zlib", loaded)
@@ -0,0 +1,163 @@
+import unittest
+import os, re, sys, shutil, tempfile
+
+from versioneer import (get_long_version_py, trim_long_version_py,
+                        trim_sections)
+
+STYLES = ["pep440", "pep440-pre", "pep440-post", "pep440-old",
+          "git-describe", "git-describe-long"]
+
+# strategies= settings that 'versioneer.py setup' must trim cleanly for
+STRATEGY_SETS = [["keywords"], ["vcs"], ["parentdir"],
+                 ["keywords", "parentdir"], ["keywords", "vcs", "parentdir"],
+                 ["file"], ["file", "env"]]
+
+PIECES = {"closest-tag": "1.0", "distance": 2, "short": "abc1234",
+          "long": "abc1234" * 5 + "abcde", "dirty": False, "error": None}
+
+
+class Config:
+    pass
+
+
+def make_long_version_py(style, strategies):
+    cfg = Config()
+    cfg.style = style
+    cfg.strategies = strategies
+    template = trim_long_version_py(get_long_version_py("git"), cfg)
+    return template % {"DOLLAR": "$",
+                       "STYLE": style,
+                       "TAG_PREFIX": "",
+                       "DESCRIBE": "%(describe:tags=true,match=*)",
+                       "PARENTDIR_PREFIX": "demo-",
+                       "VERSIONFILE_SOURCE": "demo/_version.py",
+                       "FIRST_PARENT": False,
+                       "SHORT_HASH_LENGTH": None,
+                       "STRATEGIES": strategies,
+                       }
+
+
+class Trim(unittest.TestCase):
+    def test_sections(self):
+        text = "\n".join(["a",
+                          "# --BEGIN STYLE x y",
+                          "b",
+                          "    # --BEGIN STRATEGY z",
+                          "c",
+                          "    # --END STRATEGY",
+                          "# --END STYLE",
+                          "d"])
+        self.assertEqual(trim_sections(text, lambda kind, names: True),
+                         "a\nb\nc\nd")
+        self.assertEqual(trim_sections(text,
+                                       lambda kind, names: kind == "STYLE"),
+                         "a\nb\nd")
+        self.assertEqual(trim_sections(text,
+                                       lambda kind, names: kind != "STYLE"),
+                         "a\nd")
+
+    def test_styles(self):
+        for style in STYLES:
+            text = make_long_version_py(style,
+                                        ["keywords", "vcs", "parentdir"])
+            self.assertTrue(len(text) < len(get_long_version_py("git")))
+            self.assertNotIn("# --", text.replace("# --first", "")
+                             .replace("# --long", ""))
+            namespace = {"__name__": "demo._version"}
+            exec(compile(text, "_version.py", "exec"), namespace)
+            # the configured style renders, and the others are gone
+            self.assertEqual(namespace["render"](PIECES, style)["error"],
+                             None)
+            for other in STYLES:
+                if other != style:
+                    self.assertRaises(ValueError, namespace["render"],
+                                      PIECES, other)
+
+    def test_strategies(self):
+        text = make_long_version_py("pep440", ["keywords", "parentdir"])
+        namespace = {"__name__": "demo._version"}
+        exec(compile(text, "_version.py", "exec"), namespace)
+        self.assertNotIn("git_pieces_from_vcs", namespace)
+        self.assertNotIn("run_command", namespace)
+        self.assertIn("git_versions_from_keywords", namespace)
+        self.assertIn("versions_from_parentdir", namespace)
+        self.assertNotIn("import subprocess", text)
+        # no .git and no expanded keywords, so only parentdir can answer
+        namespace["__file__"] = "/nonexistent/demo-2.0/demo/_version.py"
+        self.assertEqual(namespace["get_versions"]()["version"], "2.0")
+
+    def test_lazy_imports(self):
+        text = make_long_version_py("pep440", ["keywords", "vcs"])
+        top_level = [line for line in text.splitlines()
+                     if line.startswith("import ")]
+        self.assertNotIn("import re", top_level)
+        self.assertNotIn("import subprocess", top_level)
+        # only the vcs strategy needs the rest
+        text = make_long_version_py("pep440", ["keywords", "parentdir"])
+        top_level = [line for line in text.splitlines()
+                     if line.startswith("import ")]
+        self.assertEqual(top_level, ["import os"])
+
+    def test_blank_lines(self):
+        # trimming must not leave runs of blank lines behind (flake8 E303)
+        for style in STYLES:
+            for strategies in STRATEGY_SETS:
+                text = make_long_version_py(style, strategies)
+                self.assertNotIn("\n\n\n\n", text)
+                self.assertFalse(re.search(r"\n\n\n[ \t]", text),
+                                 (style, strategies))
+
+    def test_pyflakes(self):
+        # nor names that the remaining code no longer uses
+        try:
+            from pyflakes.api import check
+            from pyflakes.reporter import Reporter
+        except ImportError:
+            raise unittest.SkipTest("pyflakes is not installed")
+
+        class Messages(list):
+            write = list.append
+        for style in STYLES:
+            for strategies in STRATEGY_SETS:
+                text = make_long_version_py(style, strategies)
+                messages = Messages()
+                check(text, "_version.py", Reporter(messages, messages))
+                self.assertEqual("".join(messages), "", (style, strategies))
+
+
+class InstalledMetadata(unittest.TestCase):
+    # an installed copy of "demo" 9.9, e.g. left in site-packages by an
+    # older install
+    def setUp(self):
+        self.site = os.path.realpath(tempfile.mkdtemp())
+        info = os.path.join(self.site, "demo-9.9.dist-info")
+        os.makedirs(info)
+        os.makedirs(os.path.join(self.site, "demo"))
+        with open(os.path.join(info, "METADATA"), "w") as f:
+            f.write("Metadata-Version: 2.1\nName: demo\nVersion: 9.9\n")
+        with open(os.path.join(info, "RECORD"), "w") as f:
+            f.write("demo/_version.py,,\ndemo-9.9.dist-info/METADATA,,\n")
+        self.installed = os.path.join(self.site, "demo", "_version.py")
+        with open(self.installed, "w") as f:
+            f.write("# installed\n")
+        sys.path.insert(0, self.site)
+
+    def tearDown(self):
+        sys.path.remove(self.site)
+        shutil.rmtree(self.site)
+
+    def get_versions(self, versionfile):
+        text = make_long_version_py("pep440", ["vcs", "parentdir"])
+        namespace = {"__name__": "demo._version", "__file__": versionfile}
+        exec(compile(text, "_version.py", "exec"), namespace)
+        return namespace["get_versions"]()
+
+    def test_installed(self):
+        self.assertEqual(self.get_versions(self.installed)["version"], "9.9")
+
+    def test_stale(self):
+        # a source tree of demo-2.0, with no .git: the installed 9.9 does
+        # not own its _version.py, so parentdir answers
+        versionfile = os.path.join(self.site, "elsewhere", "demo-2.0",
+                                   "demo", "_version.py")
+        self.assertEqual(self.get_versions(versionfile)["version"], "2.0")
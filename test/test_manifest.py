@@ -0,0 +1,111 @@
+import unittest
+import os, sys, time, json, tempfile, shutil, subprocess, threading
+
+import versioneer
+from versioneer import (versions_from_manifest, write_manifest_entry,
+                        NotThisMethod)
+
+V1 = {"version": "1.0", "full-revisionid": "abc", "dirty": False,
+      "error": None}
+V2 = {"version": "2.0+3.gdef", "full-revisionid": "def", "dirty": False,
+      "error": None}
+
+
+class Manifest(unittest.TestCase):
+    def setUp(self):
+        self.top = os.path.realpath(tempfile.mkdtemp())
+        self.manifest = os.path.join(self.top, "versions.json")
+        self.proj1 = os.path.join(self.top, "proj1")
+        self.proj2 = os.path.join(self.top, "sub", "proj2")
+        os.makedirs(self.proj1)
+        os.makedirs(self.proj2)
+
+    def tearDown(self):
+        shutil.rmtree(self.top)
+
+    def test_missing(self):
+        self.assertRaises(NotThisMethod, versions_from_manifest,
+                          self.manifest, self.proj1, None, False)
+
+    def test_roundtrip(self):
+        write_manifest_entry(self.manifest, self.proj1, None, V1)
+        write_manifest_entry(self.manifest, self.proj2, "proj2", V2)
+        with open(self.manifest) as f:
+            entries = json.load(f)
+        self.assertEqual(sorted(entries.keys()),
+                         ["proj1", "proj2", "sub/proj2"])
+        self.assertEqual(versions_from_manifest(self.manifest, self.proj1,
+                                                None, False), V1)
+        self.assertEqual(versions_from_manifest(self.manifest, self.proj2,
+                                                "proj2", False), V2)
+
+    def test_moved_tree(self):
+        # the whole tree, manifest included, is copied into a sandbox
+        write_manifest_entry(self.manifest, self.proj2, None, V2)
+        sandbox = os.path.join(self.top, "sandbox")
+        os.makedirs(os.path.join(sandbox, "sub", "proj2"))
+        shutil.copy(self.manifest, sandbox)
+        self.assertEqual(versions_from_manifest(
+            os.path.join(sandbox, "versions.json"),
+            os.path.join(sandbox, "sub", "proj2"), None, False), V2)
+
+    def test_by_name(self):
+        write_manifest_entry(self.manifest, self.proj1, "demo", V1)
+        elsewhere = os.path.join(self.top, "elsewhere")
+        os.mkdir(elsewhere)
+        self.assertEqual(versions_from_manifest(self.manifest, elsewhere,
+                                                "demo", False), V1)
+        self.assertRaises(NotThisMethod, versions_from_manifest,
+                          self.manifest, elsewhere, "other", False)
+
+    def test_broken(self):
+        with open(self.manifest, "w") as f:
+            f.write('{"proj1": {"version": ')
+        self.assertRaises(NotThisMethod, versions_from_manifest,
+                          self.manifest, self.proj1, None, False)
+        write_manifest_entry(self.manifest, self.proj1, None, V1)
+        self.assertEqual(versions_from_manifest(self.manifest, self.proj1,
+                                                None, False), V1)
+
+    def test_concurrent(self):
+        # separate processes, as in a parallel build
+        here = os.path.dirname(os.path.abspath(versioneer.__file__))
+        # the writers all start at the same moment, once they are loaded
+        start = time.time() + 1
+        code = ("import sys, time; sys.path.insert(0, %r)\n"
+                "import versioneer\n"
+                "time.sleep(max(0, %r - time.time()))\n"
+                "for n in range(20):\n"
+                "    versioneer.write_manifest_entry(%r, sys.argv[1], None,"
+                " %r)\n" % (here, start, self.manifest, V1))
+        procs = []
+        for i in range(8):
+            root = os.path.join(self.top, "p%d" % i)
+            os.mkdir(root)
+            procs.append(subprocess.Popen([sys.executable, "-c", code, root],
+                                          stdout=subprocess.PIPE))
+        for p in procs:
+            p.communicate()
+            self.assertEqual(p.returncode, 0)
+        with open(self.manifest) as f:
+            entries = json.load(f)
+        self.assertEqual(sorted(entries.keys()),
+                         ["p%d" % i for i in range(8)])
+        self.assertFalse(os.path.exists(self.manifest + ".lock"))
+
+    def test_waits_for_lock(self):
+        write_manifest_entry(self.manifest, self.proj1, None, V1)
+        lock = self.manifest + ".lock"
+        open(lock, "w").close()  # another writer is busy
+        t = threading.Thread(target=write_manifest_entry,
+                             args=(self.manifest, self.proj2, None, V2))
+        t.start()
+        time.sleep(0.2)
+        self.assertRaises(NotThisMethod, versions_from_manifest,
+                          self.manifest, self.proj2, None, False)
+        os.unlink(lock)
+        t.join()
+        self.assertEqual(versions_from_manifest(self.manifest, self.proj1,
+                                                None, False), V1)
+        self.assertEqual(versions_from_manifest(self.manifest, self.proj2,
+                                                None, False), V2)
@@ -0,0 +1,41 @@
+import unittest
+import os, tempfile, shutil
+
+from versioneer import copy_to_overlay
+
+
+class Overlay(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.overlay = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+        shutil.rmtree(self.overlay)
+
+    def touch(self, *path):
+        fn = os.path.join(self.root, *path)
+        if not os.path.isdir(os.path.dirname(fn)):
+            os.makedirs(os.path.dirname(fn))
+        with open(fn, "w") as f:
+            f.write("# %s\n" % "/".join(path))
+
+    def test_package(self):
+        self.touch("src", "demo", "__init__.py")
+        self.touch("src", "demo", "sub", "__init__.py")
+        self.touch("src", "demo", "sub", "_version.py")
+        self.touch("src", "other.py")
+        copied = copy_to_overlay(self.overlay, self.root,
+                                 "src/demo/sub/_version.py")
+        self.assertEqual(copied, os.path.join(self.overlay, "demo", "sub",
+                                              "_version.py"))
+        with open(copied) as f:
+            self.assertEqual(f.read(), "# src/demo/sub/_version.py\n")
+        self.assertTrue(os.path.exists(os.path.join(self.overlay, "demo",
+                                                    "__init__.py")))
+        self.assertEqual(os.listdir(self.overlay), ["demo"])
+
+    def test_module(self):
+        self.touch("_version.py")
+        copied = copy_to_overlay(self.overlay, self.root, "_version.py")
+        self.assertEqual(copied, os.path.join(self.overlay, "_version.py"))
@@ -0,0 +1,103 @@
+import unittest
+import os, sys, shutil, subprocess, tempfile, warnings, importlib
+
+import versioneer
+from project import write_setup_cfg
+
+SHORT_VERSION_PY = """
+versions = {'dirty': False, 'error': None, 'full-revisionid': 'abc', \
+'version': '%s'}
+"""
+
+
+class Registry(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.top = os.path.realpath(tempfile.mkdtemp())
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.top)
+
+    def make_project(self, name, version):
+        root = os.path.join(self.top, name)
+        os.mkdir(root)
+        shutil.copy(os.path.splitext(versioneer.__file__)[0] + ".py",
+                    os.path.join(root, "versioneer.py"))
+        with open(os.path.join(root, "setup.py"), "w") as f:
+            f.write("# %s\n" % name)
+        write_setup_cfg(root)
+        with open(os.path.join(root, "_version.py"), "w") as f:
+            f.write(SHORT_VERSION_PY % version)
+        return root
+
+    def test_delegate(self):
+        a = self.make_project("a", "1.0")
+        b = self.make_project("b", "2.0")
+        module = sys.modules["versioneer"]
+        os.chdir(a)
+        self.assertEqual(versioneer.get_version(), "1.0")
+        other_a = versioneer.get_versioneer_for_root(a)
+        self.assertEqual(other_a.__file__, os.path.join(a, "versioneer.py"))
+        os.chdir(b)
+        self.assertEqual(versioneer.get_version(), "2.0")
+        cmds = versioneer.get_cmdclass()
+        self.assertEqual(cmds["version"].run.__globals__["__file__"],
+                         os.path.join(b, "versioneer.py"))
+        # each root's versioneer.py is loaded once, and the one that was
+        # imported stays put
+        self.assertTrue(versioneer.get_versioneer_for_root(a) is other_a)
+        self.assertTrue(sys.modules["versioneer"] is module)
+        # a root's own versioneer.py does not delegate any further
+        self.assertEqual(other_a.get_versioneer_for_root(a), None)
+
+    def test_delegate_with_imp(self):
+        # py2 and py3.4 have no importlib.util, and load B's versioneer.py
+        # with imp instead
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                importlib.import_module("imp")
+            except ImportError:
+                raise unittest.SkipTest("no imp module")
+        a = self.make_project("a", "1.0")
+        module = sys.modules["versioneer"]
+        before = set(sys.modules)
+        util = sys.modules.get("importlib.util")
+        sys.modules["importlib.util"] = None
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                other_a = versioneer.get_versioneer_for_root(a)
+        finally:
+            if util is None:
+                del sys.modules["importlib.util"]
+            else:
+                sys.modules["importlib.util"] = util
+        self.assertEqual(other_a.__file__, os.path.join(a, "versioneer.py"))
+        self.assertTrue(other_a is not module)
+        self.assertTrue(sys.modules["versioneer"] is module)
+        self.assertEqual(set(sys.modules), before)
+        os.chdir(a)
+        self.assertEqual(versioneer.get_version(), "1.0")
+
+    def test_symlinked_versioneer(self):
+        if not hasattr(os, "symlink"):
+            raise unittest.SkipTest("no symlinks")
+        a = self.make_project("a", "1.0")
+        shared = os.path.join(self.top, "shared")
+        os.mkdir(shared)
+        os.rename(os.path.join(a, "versioneer.py"),
+                  os.path.join(shared, "versioneer.py"))
+        os.symlink(os.path.join(shared, "versioneer.py"),
+                   os.path.join(a, "versioneer.py"))
+        os.chdir(a)
+        self.assertEqual(versioneer.get_version(), "1.0")
+        other_a = versioneer.get_versioneer_for_root(a)
+        self.assertEqual(other_a.get_versioneer_for_root(a), None)
+        # and the symlinked copy, run directly, answers for itself
+        p = subprocess.Popen([sys.executable, "versioneer.py", "version"],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = p.communicate()
+        self.assertEqual((p.returncode, out.decode("utf-8").strip()),
+                         (0, "1.0"), err)
@@ -1,6 +1,6 @@
 import unittest
 
-from versioneer import render
+from versioneer import render, version_tuple, version_sort_key
 
 
 class Testing_renderer_case_mixin(object):
@@ -136,5 +136,30 @@ class Test_git_describe(unittest.TestCase, Testing_renderer_case_mixin):
                 }
 
 
+class Test_version_tuple(unittest.TestCase):
+    def test_tuple(self):
+        self.assertEqual(version_tuple("1.2"), (1, 2))
+        self.assertEqual(version_tuple("1.2+3.gabc.dirty"),
+                         (1, 2, "3.gabc.dirty"))
+        self.assertEqual(version_tuple("1.2.post.dev3"),
+                         (1, 2, "post0", "dev3"))
+        self.assertEqual(version_tuple("2.0rc1.post3+gabc"),
+                         (2, 0, "rc1", "post3", "gabc"))
+        self.assertEqual(version_tuple("v1.2-3-gabc"), None)
+        self.assertEqual(version_tuple("unknown"), None)
+
+    def test_sort_key(self):
+        # in PEP 440 order
+        versions = ["0+unknown", "0.post.dev1", "1.0.dev0", "1.0a1.dev1",
+                    "1.0a1", "1.0b2", "1.0rc1", "1.0", "1.0+abc.5",
+                    "1.0+2.gabc", "1.0+3.gabc", "1.0.post1.dev0", "1.0.post1",
+                    "1.1", "1.10", "1!0.1"]
+        keys = [version_sort_key(v) for v in versions]
+        self.assertEqual(sorted(keys), keys)
+        self.assertEqual(len(set(keys)), len(keys))
+        self.assertEqual(version_sort_key("1.0"), version_sort_key("1.0.0"))
+        self.assertEqual(version_sort_key("v1.2-3-gabc"), None)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from versioneer import (scan_version_lines, versions_from_scan,
+                        git_keywords_from_lines, NotThisMethod)
+
+SHORT = """
+versions = {'dirty': False, 'error': None, 'full-revisionid': 'abc', \
+'version': '1.0'}
+"""
+
+# as written by older versions of versioneer.py
+SHORT_JSON = """
+import json
+
+version_json = '''
+{"dirty": false, "error": null, "full-revisionid": "abc", "version": "1.0"}
+'''  # END VERSION_JSON
+"""
+
+LONG = '''
+def get_keywords():
+    git_refnames = "$Format:%d$"
+    git_full = "$Format:%H$"
+    git_describe = "$Format:%(describe)$"
+    keywords = {"refnames": git_refnames, "full": git_full,
+                "describe": git_describe}
+    return keywords
+'''
+
+
+def lines_until(text, last):
+    """Yield the lines of text, failing if asked for any after 'last'."""
+    for line in text.splitlines(True):
+        yield line
+        if last in line:
+            break
+    raise AssertionError("read past the end of what was needed")
+
+
+class Scan(unittest.TestCase):
+    def test_short(self):
+        scan = scan_version_lines(lines_until(SHORT, "versions = "))
+        self.assertEqual(scan["kind"], "short")
+        self.assertEqual(versions_from_scan(scan),
+                         {"dirty": False, "error": None,
+                          "full-revisionid": "abc", "version": "1.0"})
+
+    def test_short_json(self):
+        scan = scan_version_lines(lines_until(SHORT_JSON, "END VERSION_JSON"))
+        self.assertEqual(scan["kind"], "short")
+        self.assertEqual(versions_from_scan(scan)["version"], "1.0")
+
+    def test_not_a_literal(self):
+        scan = scan_version_lines(["versions = {'version': os.getcwd()}\n"])
+        self.assertEqual(scan["kind"], "short")
+        self.assertRaises(NotThisMethod, versions_from_scan, scan)
+
+    def test_long(self):
+        scan = scan_version_lines(lines_until(LONG, "keywords = {"))
+        self.assertEqual(scan["kind"], "keywords")
+        self.assertEqual(git_keywords_from_lines(scan["lines"]),
+                         {"refnames": "$Format:%d$", "full": "$Format:%H$",
+                          "describe": "$Format:%(describe)$"})
+        self.assertRaises(NotThisMethod, versions_from_scan, scan)
+
+    def test_neither(self):
+        scan = scan_version_lines(["print('hello')\n"])
+        self.assertEqual(scan["kind"], None)
+        self.assertRaises(NotThisMethod, versions_from_scan, scan)
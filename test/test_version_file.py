@@ -0,0 +1,91 @@
+import unittest
+import os, stat, tempfile, shutil, threading
+
+from versioneer import (write_to_version_file, versions_from_file,
+                        version_sort_key, NotThisMethod)
+
+V1 = {"version": "1.0", "full-revisionid": "abc", "dirty": False,
+      "error": None}
+V2 = {"version": "1.0+1.gdef", "full-revisionid": "def", "dirty": False,
+      "error": None}
+
+
+class WriteVersionFile(unittest.TestCase):
+    def setUp(self):
+        self.top = tempfile.mkdtemp()
+        self.fn = os.path.join(self.top, "_version.py")
+        with open(self.fn, "w") as f:
+            f.write("# the long version\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.top)
+
+    def test_unchanged(self):
+        write_to_version_file(self.fn, V1)
+        self.assertEqual(versions_from_file(self.fn), V1)
+        # pretend the first write happened long ago, so any rewrite shows
+        os.utime(self.fn, (1000000000, 1000000000))
+        write_to_version_file(self.fn, V1)
+        self.assertEqual(os.stat(self.fn).st_mtime, 1000000000)
+        write_to_version_file(self.fn, V2)
+        self.assertNotEqual(os.stat(self.fn).st_mtime, 1000000000)
+        self.assertEqual(versions_from_file(self.fn), V2)
+
+    def test_version_tuple(self):
+        write_to_version_file(self.fn, V2)
+        namespace = {}
+        with open(self.fn) as f:
+            exec(f.read(), namespace)
+        self.assertEqual(namespace["__version__"], "1.0+1.gdef")
+        self.assertEqual(namespace["get_versions"](), V2)
+        self.assertNotIn("json", namespace)
+        self.assertEqual(namespace["version_tuple"], (1, 0, "1.gdef"))
+        self.assertTrue(namespace["version_sort_key"] >
+                        version_sort_key("1.0"))
+
+    def test_hardlink(self):
+        # sdist release trees may hardlink to the source tree, which must
+        # keep its long _version.py
+        linked = os.path.join(self.top, "linked_version.py")
+        os.link(self.fn, linked)
+        os.chmod(self.fn, 0o755)
+        write_to_version_file(self.fn, V1)
+        with open(linked) as f:
+            self.assertEqual(f.read(), "# the long version\n")
+        self.assertEqual(versions_from_file(self.fn), V1)
+        self.assertEqual(stat.S_IMODE(os.stat(self.fn).st_mode), 0o755)
+        self.assertEqual(sorted(os.listdir(self.top)),
+                         ["_version.py", "linked_version.py"])
+
+    def test_concurrent(self):
+        write_to_version_file(self.fn, V1)
+        errors = []
+        done = []
+
+        def writer(i):
+            try:
+                for n in range(100):
+                    write_to_version_file(self.fn, [V1, V2][(n + i) % 2])
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                while not done:
+                    self.assertIn(versions_from_file(self.fn), [V1, V2])
+            except (NotThisMethod, AssertionError, ValueError) as e:
+                errors.append(e)
+
+        writers = [threading.Thread(target=writer, args=(i,))
+                   for i in range(4)]
+        readers = [threading.Thread(target=reader) for i in range(4)]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+        done.append(True)
+        for t in readers:
+            t.join()
+        self.assertEqual(errors, [])
+        # and no temporary files were left behind
+        self.assertEqual(os.listdir(self.top), ["_version.py"])
@@ -0,0 +1,3829 @@
+
+# Version: 0.15+dev
+
+"""The Versioneer - like a rocketeer, but for versions.
+
+The Versioneer
+==============
+
+* like a rocketeer, but for versions!
+* https://github.com/warner/python-versioneer
+* Brian Warner
+* License: Public Domain
+* Compatible With: python2.6, 2.7, 3.2, 3.3, 3.4, and pypy
+* [![Latest Version]
+(https://pypip.in/version/versioneer/badge.svg?style=flat)
+](https://pypi.python.org/pypi/versioneer/)
+* [![Build Status]
+(https://travis-ci.org/warner/python-versioneer.png?branch=master)
+](https://travis-ci.org/warner/python-versioneer)
+
+This is a tool for managing a recorded version number in distutils-based
+python projects. The goal is to remove the tedious and error-prone "update
+the embedded version string" step from your release process. Making a new
+release should be as easy as recording a new tag in your version-control
+system, and maybe making new tarballs.
+
+
+## Quick Install
+
+* `pip install versioneer` to somewhere to your $PATH
+* add a `[versioneer]` section to your setup.cfg (see below)
+* run `versioneer install` in your source tree, commit the results
+
+## Version Identifiers
+
+Source trees come from a variety of places:
+
+* a version-control system checkout (mostly used by developers)
+* a nightly tarball, produced by build automation
+* a snapshot tarball, produced by a web-based VCS browser, like github's
+  "tarball from tag" feature
+* a release tarball, produced by "setup.py sdist", distributed through PyPI
+
+Within each source tree, the version identifier (either a string or a number,
+this tool is format-agnostic) can come from a variety of places:
+
+* ask the VCS tool itself, e.g. "git describe" (for checkouts), which knows
+  about recent "tags" and an absolute revision-id
+* the name of the directory into which the tarball was unpacked
+* an expanded VCS keyword ($Id$, etc)
+* a `_version.py` created by some earlier build step
+
+For released software, the version identifier is closely related to a VCS
+tag. Some projects use tag names that include more than just the version
+string (e.g. "myproject-1.2" instead of just "1.2"), in which case the tool
+needs to strip the tag prefix to extract the version identifier. For
+unreleased software (between tags), the version identifier should provide
+enough information to help developers recreate the same tree, while also
+giving them an idea of roughly how old the tree is (after version 1.2, before
+version 1.3). Many VCS systems can report a description that captures this,
+for example `git describe --tags --dirty --always` reports things like
+"0.7-1-g574ab98-dirty" to indicate that the checkout is one revision past the
+0.7 tag, has a unique revision id of "574ab98", and is "dirty" (it has
+uncommitted changes.
+
+The version identifier is used for multiple purposes:
+
+* to allow the module to self-identify its version: `myproject.__version__`
+* to choose a name and prefix for a 'setup.py sdist' tarball
+
+## Theory of Operation
+
+Versioneer works by adding a special `_version.py` file into your source
+tree, where your `__init__.py` can import it. This `_version.py` knows how to
+dynamically ask the VCS tool for version information at import time.
+
+`_version.py` also contains `$Revision$` markers, and the installation
+process marks `_version.py` to have this marker rewritten with a tag name
+during the `git archive` command. As a result, generated tarballs will
+contain enough information to get the proper version. With git-2.35 or
+later, `git archive` also records the closest tag, the distance from it and
+the short revision id (a `%(describe)` placeholder), so an archive of an
+untagged commit gets the same version as a checkout of that commit. Note
+that this ignores `first_parent`.
+
+To allow `setup.py` to compute a version too, a `versioneer.py` is added to
+the top level of your source tree, next to `setup.py` and the `setup.cfg`
+that configures it. This overrides several distutils/setuptools commands to
+compute the version when invoked, and changes `setup.py build` and `setup.py
+sdist` to replace `_version.py` with a small static file that contains just
+the generated version data.
+
+If the full `_version.py` is imported from a tree that has no `.git`
+directory (for example a zipapp, a PEX file, or a copy installed without
+going through `setup.py build`), it asks `importlib.metadata` for the version
+of the installed distribution that this `_version.py` file belongs to, before
+falling back to `parentdir`. A different install of the same project
+elsewhere on `sys.path` is ignored.
+
+## Installation
+
+First, decide on values for the following configuration variables:
+
+* `VCS`: the version control system you use. Currently accepts "git".
+
+* `style`: the style of version string to be produced. See "Styles" below for
+  details. Defaults to "pep440", which looks like
+  `TAG[+DISTANCE.gSHORTHASH[.dirty]]`.
+
+* `versionfile_source`:
+
+  A project-relative pathname into which the generated version strings should
+  be written. This is usually a `_version.py` next to your project's main
+  `__init__.py` file, so it can be imported at runtime. If your project uses
+  `src/myproject/__init__.py`, this should be `src/myproject/_version.py`.
+  This file should be checked in to your VCS as usual: the copy created below
+  by `setup.py setup_versioneer` will include code that parses expanded VCS
+  keywords in generated tarballs. The 'build' and 'sdist' commands will
+  replace it with a copy that has just the calculated version string.
+
+  This must be set even if your project does not have any modules (and will
+  therefore never import `_version.py`), since "setup.py sdist" -based trees
+  still need somewhere to record the pre-calculated version strings. Anywhere
+  in the source tree should do. If there is a `__init__.py` next to your
+  `_version.py`, the `setup.py setup_versioneer` command (described below)
+  will append some `__version__`-setting assignments, if they aren't already
+  present.
+
+* `versionfile_build`:
+
+  Like `versionfile_source`, but relative to the build directory instead of
+  the source directory. These will differ when your setup.py uses
+  'package_dir='. If you have `package_dir={'myproject': 'src/myproject'}`,
+  then you will probably have `versionfile_build='myproject/_version.py'` and
+  `versionfile_source='src/myproject/_version.py'`.
+
+  If this is set to None, then `setup.py build` will not attempt to rewrite
+  any `_version.py` in the built tree. If your project does not have any
+  libraries (e.g. if it only builds a script), then you should use
+  `versionfile_build = None` and override `distutils.command.build_scripts`
+  to explicitly insert a copy of `versioneer.get_version()` into your
+  generated script.
+
+* `tag_prefix`:
+
+  a string, like 'PROJECTNAME-', which appears at the start of all VCS tags.
+  If your tags look like 'myproject-1.2.0', then you should use
+  tag_prefix='myproject-'. If you use unprefixed tags like '1.2.0', this
+  should be an empty string, using either `tag_prefix=` or `tag_prefix=''`.
+
+* `parentdir_prefix`:
+
+  a optional string, frequently the same as tag_prefix, which appears at the
+  start of all unpacked tarball filenames. If your tarball unpacks into
+  'myproject-1.2.0', this should be 'myproject-'. To disable this feature,
+  just omit the field from your `setup.cfg`.
+
+* `first_parent`:
+
+  an optional boolean. If set to `true`, the closest tag and the distance
+  from it are computed along the first-parent (mainline) history only, by
+  passing `--first-parent` to `git describe` and `git rev-list`. In
+  merge-heavy repositories this keeps side branches from inflating the
+  distance, and bounds the history walk to the length of the mainline.
+  Defaults to `false`.
+
+* `short_hash_length`:
+
+  an optional integer. If set, the short revision id used in version strings
+  (the `HEX` in `gHEX`) is always exactly this many characters of the full
+  revision id, and `git describe` is told not to spend time searching for a
+  unique abbreviation. Without it, git picks the length, and that length can
+  grow as the repository does.
+
+* `timeout`:
+
+  an optional number of seconds. If set, the whole version lookup in
+  `versioneer.py` must finish within this time. A VCS command (like `git
+  describe`) that is still running when the time runs out is killed, and
+  Versioneer falls back to the last version it computed from the VCS in the
+  same process, then to `parentdir_prefix`, then to "0+unknown". The
+  `error` field of the result says that the timeout was hit. Unset by
+  default, which means no limit.
+
+* `ci_env`:
+
+  an optional boolean. If set to `true`, `versioneer.py` tries to build the
+  version from environment variables before asking the VCS. This helps CI
+  jobs that use shallow clones, where `git describe` is slow or wrong. The
+  generic variables `VERSIONEER_FULL_REVISIONID`, `VERSIONEER_CLOSEST_TAG`
+  (the tag name, including `tag_prefix`), `VERSIONEER_DISTANCE` and
+  `VERSIONEER_DIRTY` are read first. Otherwise the commit and tag exported
+  by GitHub Actions, GitLab CI, Travis CI, CircleCI, Azure Pipelines,
+  Bitbucket Pipelines, AppVeyor or Jenkins are used. A CI system only
+  reports a tag when it builds exactly that tag. For any other commit the
+  distance is unknown, so the VCS is asked after all, unless
+  `VERSIONEER_DISTANCE` is set. Defaults to `false`, because the variables
+  would also be seen by unrelated projects built inside the same job.
+
+* `manifest`:
+
+  an optional path (relative to the project root) to a version manifest. The
+  `VERSIONEER_MANIFEST` environment variable overrides it. A manifest is a
+  JSON file that maps project roots or names to the complete results of
+  `get_versions()`. If it has an entry for this project, `versioneer.py`
+  returns that entry and skips every other lookup. Hermetic builds that run
+  without a `.git` directory can use it to get real versions. Run `python
+  versioneer.py manifest [MANIFEST]` in each project once, while the VCS is
+  still available, to add or refresh its entry. Entries are stored under the
+  project root relative to the manifest's directory, and under the `name`
+  from the `[metadata]` section of `setup.cfg`, if present.
+
+* `strategies`:
+
+  an optional list of the ways to find a version, tried in the given order,
+  separated by commas or spaces. The choices are `keywords` (expanded
+  git-archive keywords in `_version.py`), `file` (the short `_version.py`
+  written into sdists), `env` (CI environment variables, see `ci_env`),
+  `vcs` (e.g. `git describe`) and `parentdir`. The default is `keywords,
+  file, vcs, parentdir`, with `env` before `vcs` if `ci_env` is set. A
+  project that only ships sdists might use `file, vcs`. Any other name is
+  reported as an error in `setup.cfg`. The generated `_version.py` honors
+  the order too, but only knows `keywords`, `vcs` and `parentdir`, and
+  ignores the rest.
+
+* `cache_dir`:
+
+  an optional directory (`~` is expanded) in which `versioneer.py` keeps the
+  results of `git describe`, so that other worktrees and clones of the same
+  repository on this machine can reuse them. The `VERSIONEER_CACHE_DIR`
+  environment variable overrides it, which makes it easy to share one cache
+  between every project a build agent checks out. Entries are keyed by the
+  commit, the tags, the shallow boundary and the options that change the
+  answer, so a hit only needs a quick `git status` to tell whether the tree
+  is dirty. The generated `_version.py` does not use the cache.
+
+* `cache_size`:
+
+  the number of entries to keep in `cache_dir`. The least recently used
+  ones beyond it are removed. Defaults to 1000.
+
+`versioneer install` (and `python versioneer.py setup`) writes a `_version.py`
+that only contains the code for the configured `style` and `strategies`, and
+imports `re` and `subprocess` only when it has to run git. If you change
+either option, run `versioneer install` again to regenerate `_version.py`.
+
+The git queries Versioneer makes to compute a version are read-only. The
+dirty flag comes from `git status` run with `GIT_OPTIONAL_LOCKS=0`, and not
+from `git describe --dirty`, which rewrites the index whatever that variable
+says. So they do not take `index.lock`, and parallel builds of one checkout
+do not wait on each other. Variables like `GIT_DIR`
+or `GIT_INDEX_FILE` (set e.g. inside git hooks) are removed from their
+environment, so they always look at the project's own checkout.
+
+To find the version of an sdist tarball or a `git archive` tarball or zipfile
+without unpacking it, run `python versioneer.py archive ARCHIVE...`. This
+reads `setup.cfg` and the `versionfile_source` it names straight out of the
+archive, and prints one line of JSON per archive.
+
+Builds that copy the source tree somewhere else first (like pip's legacy
+builds) normally have to take `.git` along, or the copy falls back to
+`parentdir` or `0+unknown`. Run `python versioneer.py pointer` once in your
+checkout to write a small `.versioneer-root` file that names it: a copy
+without `.git` then runs git in the original checkout instead. (Or run
+`python versioneer.py pointer COPY...` to write the file into copies that
+have already been made.) The file holds an absolute path that only makes
+sense on your machine, so add it to `.gitignore` rather than committing it.
+
+Build systems that cache artifacts can key them on
+`versioneer.version_fingerprint(root)` (or `python versioneer.py fingerprint
+[ROOT...]`), a digest of everything that can change the version: `setup.cfg`,
+`_version.py`, and for git `HEAD`, the current branch, the tags,
+`packed-refs`, the index and config. It only reads and stats files, so it is
+much cheaper than `get_versions()`. A tracked file that was just edited only
+changes the fingerprint once git has refreshed its index (e.g. by running
+`git status`).
+
+Make and Ninja builds can get the same list of files as a depfile instead:
+`python setup.py version --depfile out/version.d` writes one that makes
+`out/version` (or whatever `--depfile-target` names) depend on them.
+
+This tool provides one script, named `versioneer`. That script has one mode,
+"install", which writes a copy of `versioneer.py` into the current directory
+and runs `versioneer.py setup` to finish the installation.
+
+`versioneer install --slim` writes a smaller `versioneer.py` instead: it
+leaves out this documentation and keeps the `_version.py` template
+compressed until `versioneer.py setup` needs it. Either build imports
+`subprocess`, `json` and `configparser` only when it has to, so a plain
+`versioneer.get_version()` in a tree with a built `_version.py` starts fast.
+(`python setup.py make_versioneer --slim` builds the same file from a
+versioneer checkout.)
+
+To versioneer-enable your project:
+
+* 1: Modify your `setup.cfg`, adding a section named `[versioneer]` and
+  populating it with the configuration values you decided earlier (note that
+  the option names are not case-sensitive):
+
+  ````
+  [versioneer]
+  VCS = git
+  style = pep440
+  versionfile_source = src/myproject/_version.py
+  versionfile_build = myproject/_version.py
+  tag_prefix =
+  parentdir_prefix = myproject-
+  ````
+
+* 2: Run `versioneer install`. This will do the following:
+
+  * copy `versioneer.py` into the top of your source tree
+  * create `_version.py` in the right place (`versionfile_source`)
+  * modify your `__init__.py` (if one exists next to `_version.py`) to define
+    `__version__` (by calling a function from `_version.py`)
+  * modify your `MANIFEST.in` to include both `versioneer.py` and the
+    generated `_version.py` in sdist tarballs
+
+  `versioneer install` will complain about any problems it finds with your
+  `setup.py` or `setup.cfg`. Run it multiple times until you have fixed all
+  the problems.
+
+* 3: add a `import versioneer` to your setup.py, and add the following
+  arguments to the setup() call:
+
+        version=versioneer.get_version(),
+        cmdclass=versioneer.get_cmdclass(),
+
+* 4: commit these changes to your VCS. To make sure you won't forget,
+  `versioneer install` will mark everything it touched for addition using
+  `git add`. Don't forget to add `setup.py` and `setup.cfg` too.
+
+## Post-Installation Usage
+
+Once established, all uses of your tree from a VCS checkout should get the
+current version string. All generated tarballs should include an embedded
+version string (so users who unpack them will not need a VCS tool installed).
+
+If you distribute your project through PyPI, then the release process should
+boil down to two steps:
+
+* 1: git tag 1.0
+* 2: python setup.py register sdist upload
+
+If you distribute it through github (i.e. users use github to generate
+tarballs with `git archive`), the process is:
+
+* 1: git tag 1.0
+* 2: git push; git push --tags
+
+Versioneer will report "0+untagged.NUMCOMMITS.gHASH" until your tree has at
+least one tag in its history.
+
+Shell scripts and Dockerfiles can run `python versioneer.py version` in the
+project root to print the version string. It does not import setuptools or
+distutils, so it is much faster than `python setup.py version`. Add `--json`
+to get the whole `get_versions()` dictionary as JSON, or `--field NAME` to
+get just one of its values (such as `full-revisionid`).
+
+## Version-String Flavors
+
+Code which uses Versioneer can learn about its version string at runtime by
+importing `_version` from your main `__init__.py` file and running the
+`get_versions()` function. From the "outside" (e.g. in `setup.py`), you can
+import the top-level `versioneer.py` and run `get_versions()`.
+
+Both functions return a dictionary with different flavors of version
+information:
+
+* `['version']`: A condensed version string, rendered using the selected
+  style. This is the most commonly used value for the project's version
+  string. The default "pep440" style yields strings like `0.11`,
+  `0.11+2.g1076c97`, or `0.11+2.g1076c97.dirty`. See the "Styles" section
+  below for alternative styles.
+
+* `['full-revisionid']`: detailed revision identifier. For Git, this is the
+  full SHA1 commit id, e.g. "1076c978a8d3cfc70f408fe5974aa6c092c949ac".
+
+* `['dirty']`: a boolean, True if the tree has uncommitted changes. Note that
+  this is only accurate if run in a VCS checkout, otherwise it is likely to
+  be False or None
+
+* `['error']`: if the version string could not be computed, this will be set
+  to a string describing the problem, otherwise it will be None. It may be
+  useful to throw an exception in setup.py if this is set, to avoid e.g.
+  creating tarballs with a version string of "unknown".
+
+Some variants are more useful than others. Including `full-revisionid` in a
+bug report should allow developers to reconstruct the exact code being tested
+(or indicate the presence of local changes that should be shared with the
+developers). `version` is suitable for display in an "about" box or a CLI
+`--version` output: it can be easily compared against release notes and lists
+of bugs fixed in various releases.
+
+The installer adds the following text to your `__init__.py` to place a basic
+version in `YOURPROJECT.__version__`:
+
+    from ._version import get_versions
+    __version__ = get_versions()['version']
+    del get_versions
+
+In built and installed copies, `_version.py` has been replaced by a short
+generated file that holds the results as plain Python constants, so importing
+it costs no parsing and no further imports. Besides `get_versions()`, it
+defines `__version__` and two pre-parsed constants, so that code can compare
+versions without importing anything like `packaging`.
+`version_tuple` holds the release numbers as ints, followed by any
+pre/post/dev-release and local parts as strings, e.g. `(0, 11, '2.g1076c97')`.
+`version_sort_key` is a tuple that sorts the way PEP 440 orders versions.
+Both are `None` if the version is not a PEP 440 version, as with the
+git-describe styles. `versioneer.py` has `version_tuple()` and
+`version_sort_key()` functions that compute the same values from a version
+string.
+
+## Styles
+
+The setup.cfg `style=` configuration controls how the VCS information is
+rendered into a version string.
+
+The default style, "pep440", produces a PEP440-compliant string, equal to the
+un-prefixed tag name for actual releases, and containing an additional "local
+version" section with more detail for in-between builds. For Git, this is
+TAG[+DISTANCE.gHEX[.dirty]] , using information from `git describe --tags
+--dirty --always`. For example "0.11+2.g1076c97.dirty" indicates that the
+tree is like the "1076c97" commit but has uncommitted changes (".dirty"), and
+that this commit is two revisions ("+2") beyond the "0.11" tag. For released
+software (exactly equal to a known tag), the identifier will only contain the
+stripped tag, e.g. "0.11".
+
+Other styles are available. See details.md in the Versioneer source tree for
+descriptions.
+
+## Debugging
+
+Versioneer tries to avoid fatal errors: if something goes wrong, it will tend
+to return a version of "0+unknown". To investigate the problem, run `setup.py
+version`, which will run the version-lookup code in a verbose mode, and will
+display the full contents of `get_versions()` (including the `error` string,
+which may help identify what went wrong).
+
+## Updating Versioneer
+
+To upgrade your project to a new release of Versioneer, do the following:
+
+* install the new Versioneer (`pip install -U versioneer` or equivalent)
+* edit `setup.cfg`, if necessary, to include any new configuration settings
+  indicated by the release notes
+* re-run `versioneer install` in your source tree, to replace
+  `SRC/_version.py`
+* commit any changed files
+
+### Upgrading to 0.15
+
+Starting with this version, Versioneer is configured with a `[versioneer]`
+section in your `setup.cfg` file. Earlier versions required the `setup.py` to
+set attributes on the `versioneer` module immediately after import. The new
+version will refuse to run (raising an exception during import) until you
+have provided the necessary `setup.cfg` section.
+
+In addition, the Versioneer package provides an executable named
+`versioneer`, and the installation process is driven by running `versioneer
+install`. In 0.14 and earlier, the executable was named
+`versioneer-installer` and was run without an argument.
+
+### Upgrading to 0.14
+
+0.14 changes the format of the version string. 0.13 and earlier used
+hyphen-separated strings like "0.11-2-g1076c97-dirty". 0.14 and beyond use a
+plus-separated "local version" section strings, with dot-separated
+components, like "0.11+2.g1076c97". PEP440-strict tools did not like the old
+format, but should be ok with the new one.
+
+### Upgrading from 0.11 to 0.12
+
+Nothing special.
+
+### Upgrading from 0.10 to 0.11
+
+You must add a `versioneer.VCS = "git"` to your `setup.py` before re-running
+`setup.py setup_versioneer`. This will enable the use of additional
+version-control systems (SVN, etc) in the future.
+
+## Future Directions
+
+This tool is designed to make it easily extended to other version-control
+systems: all VCS-specific components are in separate directories like
+src/git/ . The top-level `versioneer.py` script is assembled from these
+components by running make-versioneer.py . In the future, make-versioneer.py
+will take a VCS name as an argument, and will construct a version of
+`versioneer.py` that is specific to the given VCS. It might also take the
+configuration arguments that are currently provided manually during
+installation by editing setup.py . Alternatively, it might go the other
+direction and include code from all supported VCS systems, reducing the
+number of intermediate scripts.
+
+
+## License
+
+To make Versioneer easier to embed, all its code is dedicated to the public
+domain. The `_version.py` that it creates is also in the public domain.
+Specifically, both are released under the Creative Commons "Public Domain
+Dedication" license (CC0-1.0), as described in
+https://creativecommons.org/publicdomain/zero/1.0/ .
+
+"""
+
+from __future__ import print_function
+import errno
+import os
+import re
+import sys
+import time
+
+
+class VersioneerConfig(object):
+
+    """Container for Versioneer configuration parameters."""
+
+    __slots__ = ("VCS", "style", "versionfile_source", "versionfile_build",
+                 "tag_prefix", "parentdir_prefix", "verbose", "first_parent",
+                 "short_hash_length", "timeout", "ci_env", "manifest",
+                 "strategies", "project_name", "cache_dir", "cache_size")
+
+
+# the names that [versioneer]strategies= may list
+STRATEGIES = ("keywords", "file", "env", "vcs", "parentdir")
+
+
+# the project root found for each (cwd, sys.argv[0]), see get_root()
+ROOT_CACHE = {}
+
+
+def get_root():
+    """Get the project root directory.
+
+    We require that all commands are run from the project root, i.e. the
+    directory that contains setup.py, setup.cfg, and versioneer.py .
+    The answer is remembered for as long as the process stays in the same
+    directory with the same sys.argv[0].
+    """
+    key = (os.getcwd(), sys.argv[0] if sys.argv else "")
+    if key not in ROOT_CACHE:
+        ROOT_CACHE[key] = find_root()
+    return ROOT_CACHE[key]
+
+
+def find_root():
+    """Look for the project root directory, see get_root()."""
+    root = os.path.realpath(os.path.abspath(os.getcwd()))
+    setup_py = os.path.join(root, "setup.py")
+    versioneer_py = os.path.join(root, "versioneer.py")
+    if not (os.path.exists(setup_py) or os.path.exists(versioneer_py)):
+        # allow 'python path/to/setup.py COMMAND'
+        root = os.path.dirname(os.path.realpath(os.path.abspath(sys.argv[0])))
+        setup_py = os.path.join(root, "setup.py")
+        versioneer_py = os.path.join(root, "versioneer.py")
+    if not (os.path.exists(setup_py) or os.path.exists(versioneer_py)):
+        err = ("Versioneer was unable to run the project root directory. "
+               "Versioneer requires setup.py to be executed from "
+               "its immediate directory (like 'python setup.py COMMAND'), "
+               "or in a way that lets it use sys.argv[0] to find the root "
+               "(like 'python path/to/setup.py COMMAND').")
+        raise VersioneerBadRootError(err)
+    return root
+
+
+# the versioneer.py of each other project root this process has built,
+# keyed by its path. See get_versioneer_for_root().
+VERSIONEER_MODULES = {}
+
+
+def get_versioneer_for_root(root):
+    """Return the versioneer.py module that belongs to a project root.
+
+    Certain runtime workflows (setup.py install/develop in a setuptools tree)
+    execute all dependencies in a single python process, so "versioneer" may
+    be imported multiple times, and python's shared module-import table will
+    cache the first one. Assume a main project A and a dependency B, which
+    use different versions of Versioneer: B's setup.py gets A's versioneer
+    when it does "import versioneer". Rather than evicting ourselves from
+    sys.modules (which made every later import re-run this whole module),
+    get_versions() and get_cmdclass() ask this function for B's own
+    versioneer.py and delegate to it. Each one is loaded once per process,
+    without touching sys.modules. Returns None when this module is the right
+    one (or the root has no versioneer.py of its own).
+    Also see https://github.com/warner/python-versioneer/issues/52
+    """
+    # compare real paths, or a symlinked versioneer.py would keep loading
+    # itself
+    versioneer_py = os.path.realpath(os.path.join(root, "versioneer.py"))
+    try:
+        me = os.path.realpath(os.path.abspath(__file__))
+    except NameError:
+        return None
+    if os.path.splitext(me)[0] == os.path.splitext(versioneer_py)[0]:
+        return None
+    if not os.path.exists(versioneer_py):
+        print("Warning: build in %s is using versioneer.py from %s"
+              % (root, me))
+        return None
+    if versioneer_py not in VERSIONEER_MODULES:
+        try:
+            from importlib.util import (module_from_spec,
+                                        spec_from_file_location)
+        except ImportError:  # py2, py3.4
+            # imp.load_source() registers the module in sys.modules, and
+            # given the name "versioneer" would re-run B's versioneer.py
+            # inside the one already imported, so use a name of its own
+            import imp
+            name = "_versioneer_%d" % len(VERSIONEER_MODULES)
+            module = imp.load_source(name, versioneer_py)
+            del sys.modules[name]
+        else:
+            spec = spec_from_file_location("versioneer", versioneer_py)
+            module = module_from_spec(spec)
+            spec.loader.exec_module(module)
+        VERSIONEER_MODULES[versioneer_py] = module
+    return VERSIONEER_MODULES[versioneer_py]
+
+
+# the parsed setup.cfg of each project root, keyed by path, along with the
+# (mtime, size, inode) it was parsed at
+CONFIG_CACHE = {}
+
+
+def get_config_from_root(root):
+    """Read the project setup.cfg file to determine Versioneer config.
+
+    The file is only parsed again once it changes, so callers share one
+    VersioneerConfig per setup.cfg and must not modify it.
+    """
+    # This might raise EnvironmentError (if setup.cfg is missing), or
+    # configparser.NoSectionError (if it lacks a [versioneer] section), or
+    # configparser.NoOptionError (if it lacks "VCS="). See the docstring at
+    # the top of versioneer.py for instructions on writing your setup.cfg .
+    setup_cfg = os.path.join(root, "setup.cfg")
+    st = os.stat(setup_cfg)
+    stamp = (st.st_mtime, st.st_size, st.st_ino)
+    cached = CONFIG_CACHE.get(setup_cfg)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(setup_cfg, "r") as f:
+        cfg = get_config_from_file(f)
+    CONFIG_CACHE[setup_cfg] = (stamp, cfg)
+    return cfg
+
+
+def get_config_from_file(f):
+    """Parse Versioneer config from an open setup.cfg-style file object."""
+    configparser = get_configparser()
+    parser = configparser.SafeConfigParser()
+    parser.readfp(f)
+    VCS = parser.get("versioneer", "VCS")  # mandatory
+
+    def get(parser, name):
+        if parser.has_option("versioneer", name):
+            return parser.get("versioneer", name)
+        return None
+    cfg = VersioneerConfig()
+    cfg.VCS = VCS
+    cfg.style = get(parser, "style") or ""
+    cfg.versionfile_source = get(parser, "versionfile_source")
+    cfg.versionfile_build = get(parser, "versionfile_build")
+    cfg.tag_prefix = get(parser, "tag_prefix")
+    if cfg.tag_prefix in ("''", '""'):
+        cfg.tag_prefix = ""
+    cfg.parentdir_prefix = get(parser, "parentdir_prefix")
+    cfg.verbose = get(parser, "verbose")
+    cfg.first_parent = get_boolean(get(parser, "first_parent"))
+    short_hash_length = get(parser, "short_hash_length")
+    cfg.short_hash_length = None
+    if short_hash_length:
+        cfg.short_hash_length = int(short_hash_length)
+    timeout = get(parser, "timeout")
+    cfg.timeout = None
+    if timeout:
+        cfg.timeout = float(timeout)
+    cfg.ci_env = get_boolean(get(parser, "ci_env"))
+    cfg.manifest = get(parser, "manifest")
+    strategies = get(parser, "strategies")
+    if strategies:
+        cfg.strategies = strategies.replace(",", " ").split()
+        for strategy in cfg.strategies:
+            if strategy not in STRATEGIES:
+                raise configparser.Error(
+                    "unknown strategy '%s' in [versioneer]strategies=, "
+                    "expected some of: %s" % (strategy, ", ".join(STRATEGIES)))
+    else:
+        cfg.strategies = ["keywords", "file", "vcs", "parentdir"]
+        if cfg.ci_env:
+            cfg.strategies.insert(2, "env")
+    cfg.cache_dir = get(parser, "cache_dir")
+    cfg.cache_size = 1000
+    cache_size = get(parser, "cache_size")
+    if cache_size:
+        cfg.cache_size = int(cache_size)
+    # setuptools reads the project name from here, if it is declared in
+    # setup.cfg at all
+    cfg.project_name = None
+    if parser.has_option("metadata", "name"):
+        cfg.project_name = parser.get("metadata", "name")
+    return cfg
+
+
+def get_configparser():
+    """Import configparser (ConfigParser on python2) once it is needed.
+
+    Like json and subprocess, it is only imported by the functions that use
+    it, which keeps 'import versioneer' itself quick.
+    """
+    try:
+        import configparser
+    except ImportError:
+        import ConfigParser as configparser
+    return configparser
+
+
+def get_boolean(value):
+    """Interpret an optional setup.cfg value as a boolean flag."""
+    if value is None:
+        return False
+    return value.strip().lower() in ("1", "yes", "true", "on")
+
+
+class NotThisMethod(Exception):
+
+    """Exception raised if a method is not valid for the current scenario."""
+
+# these dictionaries contain VCS-specific tools
+LONG_VERSION_PY = {}
+HANDLERS = {}
+# the slim build of versioneer.py keeps its _version.py templates here,
+# compressed, until get_long_version_py() needs one
+LONG_VERSION_PY_COMPRESSED = {}
+
+
+def register_vcs_handler(vcs, method):  # decorator
+    """Decorator to mark a method as the handler for a particular VCS."""
+    def decorate(f):
+        """Store f in HANDLERS[vcs][method]."""
+        if vcs not in HANDLERS:
+            HANDLERS[vcs] = {}
+        HANDLERS[vcs][method] = f
+        return f
+    return decorate
+
+
+class CommandTimeoutError(Exception):
+
+    """Exception raised if a command was killed for running too long."""
+
+
+def run_command(commands, args, cwd=None, verbose=False, hide_stderr=False,
+                timeout=None, env=None):
+    """Call the given command(s).
+
+    If env is given, it replaces the environment of the child.
+
+    If timeout (in seconds) is given and the command is still running when
+    it expires, the child is killed and CommandTimeoutError is raised.
+    """
+    assert isinstance(commands, list)
+    if timeout is not None and timeout <= 0:
+        raise CommandTimeoutError("no time left to run %s"
+                                  % str(commands[:1] + args))
+    import subprocess
+    p = None
+    for c in commands:
+        try:
+            dispcmd = str([c] + args)
+            # remember shell=False, so use git.cmd on windows, not just git
+            p = subprocess.Popen([c] + args, cwd=cwd, env=env,
+                                 stdout=subprocess.PIPE,
+                                 stderr=(subprocess.PIPE if hide_stderr
+                                         else None))
+            break
+        except EnvironmentError:
+            e = sys.exc_info()[1]
+            if e.errno == errno.ENOENT:
+                continue
+            if verbose:
+                print("unable to run %s" % dispcmd)
+                print(e)
+            return None
+    else:
+        if verbose:
+            print("unable to find command, tried %s" % (commands,))
+        return None
+    expired = []
+    if timeout is not None:
+        import threading
+
+        def kill():
+            expired.append(True)
+            try:
+                p.kill()
+            except EnvironmentError:
+                pass  # it finished on its own in the meantime
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    try:
+        stdout = p.communicate()[0].strip()
+    finally:
+        if timeout is not None:
+            timer.cancel()
+    if expired:
+        if verbose:
+            print("killed %s after %ss" % (dispcmd, timeout))
+        raise CommandTimeoutError("%s timed out after %ss"
+                                  % (dispcmd, timeout))
+    if sys.version_info[0] >= 3:
+        stdout = stdout.decode()
+    if p.returncode != 0:
+        if verbose:
+            print("unable to run %s (error)" % dispcmd)
+        return None
+    return stdout
+LONG_VERSION_PY['git'] = '''
+# This file helps to compute a version number in source trees obtained from
+# git-archive tarball (such as those provided by githubs download-from-tag
+# feature). Distribution tarballs (built by setup.py sdist) and build
+# directories (produced by setup.py build) will contain a much shorter file
+# that just contains the computed version number.
+
+# This file is released into the public domain. Generated by
+# versioneer-0.15+dev (https://github.com/warner/python-versioneer)
+
+"""Git implementation of _version.py."""
+
+# re and subprocess are only imported when needed, to keep importing
+# _version.py cheap
+import os
+# --BEGIN STRATEGY vcs
+import errno
+import sys
+import time
+# --END STRATEGY
+
+
+def get_keywords():
+    """Get the keywords needed to look up the version information."""
+    # these strings will be replaced by git during git-archive.
+    # setup.py/versioneer.py will grep for the variable names, so they must
+    # each be defined on a line of their own. _version.py will just call
+    # get_keywords().
+    git_refnames = "%(DOLLAR)sFormat:%%d%(DOLLAR)s"
+    git_full = "%(DOLLAR)sFormat:%%H%(DOLLAR)s"
+    git_describe = "%(DOLLAR)sFormat:%(DESCRIBE)s%(DOLLAR)s"
+    keywords = {"refnames": git_refnames, "full": git_full,
+                "describe": git_describe}
+    return keywords
+
+
+class VersioneerConfig:
+
+    """Container for Versioneer configuration parameters."""
+
+
+def get_config():
+    """Create, populate and return the VersioneerConfig() object."""
+    # these strings are filled in when 'setup.py versioneer' creates
+    # _version.py
+    cfg = VersioneerConfig()
+    cfg.VCS = "git"
+    cfg.style = "%(STYLE)s"
+    cfg.tag_prefix = "%(TAG_PREFIX)s"
+    cfg.parentdir_prefix = "%(PARENTDIR_PREFIX)s"
+    cfg.versionfile_source = "%(VERSIONFILE_SOURCE)s"
+    cfg.first_parent = %(FIRST_PARENT)s
+    cfg.short_hash_length = %(SHORT_HASH_LENGTH)s
+    cfg.strategies = %(STRATEGIES)s
+    cfg.verbose = False
+    return cfg
+
+
+class NotThisMethod(Exception):
+
+    """Exception raised if a method is not valid for the current scenario."""
+
+
+LONG_VERSION_PY = {}
+HANDLERS = {}
+
+
+def register_vcs_handler(vcs, method):  # decorator
+    """Decorator to mark a method as the handler for a particular VCS."""
+    def decorate(f):
+        """Store f in HANDLERS[vcs][method]."""
+        if vcs not in HANDLERS:
+            HANDLERS[vcs] = {}
+        HANDLERS[vcs][method] = f
+        return f
+    return decorate
+
+
+# --BEGIN STRATEGY vcs
+class CommandTimeoutError(Exception):
+
+    """Exception raised if a command was killed for running too long."""
+
+
+def run_command(commands, args, cwd=None, verbose=False, hide_stderr=False,
+                timeout=None, env=None):
+    """Call the given command(s).
+
+    If env is given, it replaces the environment of the child.
+
+    If timeout (in seconds) is given and the command is still running when
+    it expires, the child is killed and CommandTimeoutError is raised.
+    """
+    assert isinstance(commands, list)
+    if timeout is not None and timeout <= 0:
+        raise CommandTimeoutError("no time left to run %%s"
+                                  %% str(commands[:1] + args))
+    import subprocess
+    p = None
+    for c in commands:
+        try:
+            dispcmd = str([c] + args)
+            # remember shell=False, so use git.cmd on windows, not just git
+            p = subprocess.Popen([c] + args, cwd=cwd, env=env,
+                                 stdout=subprocess.PIPE,
+                                 stderr=(subprocess.PIPE if hide_stderr
+                                         else None))
+            break
+        except EnvironmentError:
+            e = sys.exc_info()[1]
+            if e.errno == errno.ENOENT:
+                continue
+            if verbose:
+                print("unable to run %%s" %% dispcmd)
+                print(e)
+            return None
+    else:
+        if verbose:
+            print("unable to find command, tried %%s" %% (commands,))
+        return None
+    expired = []
+    if timeout is not None:
+        import threading
+
+        def kill():
+            expired.append(True)
+            try:
+                p.kill()
+            except EnvironmentError:
+                pass  # it finished on its own in the meantime
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    try:
+        stdout = p.communicate()[0].strip()
+    finally:
+        if timeout is not None:
+            timer.cancel()
+    if expired:
+        if verbose:
+            print("killed %%s after %%ss" %% (dispcmd, timeout))
+        raise CommandTimeoutError("%%s timed out after %%ss"
+                                  %% (dispcmd, timeout))
+    if sys.version_info[0] >= 3:
+        stdout = stdout.decode()
+    if p.returncode != 0:
+        if verbose:
+            print("unable to run %%s (error)" %% dispcmd)
+        return None
+    return stdout
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY parentdir
+def versions_from_parentdir(parentdir_prefix, root, verbose):
+    """Try to determine the version from the parent directory name.
+
+    Source tarballs conventionally unpack into a directory that includes
+    both the project name and a version string.
+    """
+    dirname = os.path.basename(root)
+    if not dirname.startswith(parentdir_prefix):
+        if verbose:
+            print("guessing rootdir is '%%s', but '%%s' doesn't start with "
+                  "prefix '%%s'" %% (root, dirname, parentdir_prefix))
+        raise NotThisMethod("rootdir doesn't start with parentdir_prefix")
+    return {"version": dirname[len(parentdir_prefix):],
+            "full-revisionid": None,
+            "dirty": False, "error": None}
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY vcs
+def versions_from_metadata(package, verbose, versionfile=None):
+    """Get the version of the installed distribution that provides package.
+
+    This answers from installed metadata (a .dist-info or .egg-info found on
+    sys.path, including inside zipapps and PEX files) without running any
+    subprocess, for installs that have no source checkout next to them.
+
+    If versionfile is given, only a distribution that installed that very
+    file counts, so an older install of the same project somewhere on
+    sys.path cannot answer for a source tree.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            raise NotThisMethod("no importlib.metadata")
+
+    def owns(dist):
+        if versionfile is None:
+            return True
+        target = os.path.realpath(versionfile)
+        for path in dist.files or []:
+            if (os.path.basename(str(path)) == os.path.basename(target)
+                    and os.path.realpath(str(dist.locate_file(path)))
+                    == target):
+                return True
+        if verbose:
+            print("distribution '%%s' did not install %%s"
+                  %% (dist.metadata["Name"], versionfile))
+        return False
+
+    def find(names):
+        for name in names:
+            try:
+                dist = metadata.distribution(name)
+            except metadata.PackageNotFoundError:
+                continue
+            if owns(dist):
+                return dist
+        return None
+
+    dist = find([package])
+    if dist is None:
+        # the distribution may be named differently than the package it
+        # provides. packages_distributions() is py3.10+, and has to look at
+        # every installed distribution, so only ask it if we must.
+        try:
+            names = metadata.packages_distributions().get(package, [])
+        except AttributeError:
+            names = []
+        dist = find(names)
+    if dist is None or not dist.version:
+        if verbose:
+            print("no installed distribution provides '%%s'" %% package)
+        raise NotThisMethod("no installed distribution metadata")
+    return {"version": dist.version, "full-revisionid": None,
+            "dirty": False, "error": None}
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY keywords
+def git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                     short_hash_length=None):
+    """Get version pieces from an expanded %%(describe) keyword, if any.
+
+    git-2.35 and later expand $Format:%%(describe:...)$ during git-archive
+    into TAG or TAG-NUM-gHEX, which tells us the distance that the %%d
+    refnames cannot. Older versions of git leave the placeholder alone, and
+    commits with no matching tag expand it to an empty string. For those
+    this returns None, and the caller falls back to the refnames.
+    """
+    describe = keywords.get("describe", "").strip()
+    if not describe or describe.startswith(("$Format", "%%(")):
+        if verbose:
+            print("no usable describe keyword")
+        return None
+    import re
+    full = keywords["full"].strip()
+    pieces = {"long": full, "short": full[:short_hash_length or 7],
+              "dirty": False, "error": None, "distance": 0}
+    mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', describe)
+    if mo:
+        full_tag = mo.group(1)
+        pieces["distance"] = int(mo.group(2))
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+    else:
+        full_tag = describe  # exactly on the tag
+    if not full_tag.startswith(tag_prefix):
+        if verbose:
+            print("tag '%%s' doesn't start with prefix '%%s'"
+                  %% (full_tag, tag_prefix))
+        return None
+    pieces["closest-tag"] = full_tag[len(tag_prefix):]
+    if verbose:
+        print("got pieces from describe keyword: %%s" %% describe)
+    return pieces
+
+
+@register_vcs_handler("git", "keywords")
+def git_versions_from_keywords(keywords, tag_prefix, verbose, style=None,
+                               short_hash_length=None):
+    """Get version information from git keywords."""
+    if not keywords:
+        raise NotThisMethod("no keywords at all, weird")
+    refnames = keywords["refnames"].strip()
+    if refnames.startswith("$Format"):
+        if verbose:
+            print("keywords are unexpanded, not using")
+        raise NotThisMethod("unexpanded keywords, not a git-archive tarball")
+    pieces = git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                              short_hash_length)
+    if pieces:
+        return render(pieces, style)
+    import re
+    refs = set([r.strip() for r in refnames.strip("()").split(",")])
+    # starting in git-1.8.3, tags are listed as "tag: foo-1.0" instead of
+    # just "foo-1.0". If we see a "tag: " prefix, prefer those.
+    TAG = "tag: "
+    tags = set([r[len(TAG):] for r in refs if r.startswith(TAG)])
+    if not tags:
+        # Either we're using git < 1.8.3, or there really are no tags. We use
+        # a heuristic: assume all version tags have a digit. The old git %%d
+        # expansion behaves like git log --decorate=short and strips out the
+        # refs/heads/ and refs/tags/ prefixes that would let us distinguish
+        # between branches and tags. By ignoring refnames without digits, we
+        # filter out many common branch names like "release" and
+        # "stabilization", as well as "HEAD" and "master".
+        tags = set([r for r in refs if re.search(r'\d', r)])
+        if verbose:
+            print("discarding '%%s', no digits" %% ",".join(refs-tags))
+    if verbose:
+        print("likely tags: %%s" %% ",".join(sorted(tags)))
+    for ref in sorted(tags):
+        # sorting will prefer e.g. "2.0" over "2.0rc1"
+        if ref.startswith(tag_prefix):
+            r = ref[len(tag_prefix):]
+            if verbose:
+                print("picking %%s" %% r)
+            return {"version": r,
+                    "full-revisionid": keywords["full"].strip(),
+                    "dirty": False, "error": None
+                    }
+    # no suitable tags, so version is "0+unknown", but full hex is still there
+    if verbose:
+        print("no suitable tags, using unknown + full revision id")
+    return {"version": "0+unknown",
+            "full-revisionid": keywords["full"].strip(),
+            "dirty": False, "error": "no suitable tags"}
+# --END STRATEGY
+
+
+# --BEGIN STRATEGY vcs
+# variables that would point version queries at some other repository (or
+# another part of this one), and are dropped from the caller's environment
+GIT_ENV_REDIRECTS = ["GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE",
+                     "GIT_OBJECT_DIRECTORY",
+                     "GIT_ALTERNATE_OBJECT_DIRECTORIES", "GIT_COMMON_DIR",
+                     "GIT_NAMESPACE", "GIT_CEILING_DIRECTORIES",
+                     "GIT_DISCOVERY_ACROSS_FILESYSTEM", "GIT_PREFIX",
+                     "GIT_REPLACE_REF_BASE", "GIT_GRAFT_FILE",
+                     "GIT_SHALLOW_FILE"]
+
+# a copy of the source tree that leaves out .git can find the original
+# checkout through this file, see git_root_from_pointer()
+POINTER_FILE = ".versioneer-root"
+
+
+def git_root_from_pointer(root, verbose):
+    """Return the checkout that root's pointer file names, or None.
+
+    Builds that copy the source tree somewhere else (like pip's legacy
+    builds) can leave out .git, which may be huge, when the tree has a
+    pointer file written by 'versioneer.py pointer': git then runs in the
+    original checkout instead.
+    """
+    pointer = os.path.join(root, POINTER_FILE)
+    if not os.path.exists(pointer):
+        return None
+    import json
+    try:
+        with open(pointer, "r") as f:
+            target = json.load(f)["root"]
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        if verbose:
+            print("unable to read %%s" %% pointer)
+        return None
+    if not os.path.exists(os.path.join(target, ".git")):
+        if verbose:
+            print("%%s points at %%s, which has no .git" %% (pointer, target))
+        return None
+    if verbose:
+        print("using the checkout in %%s, named by %%s" %% (target, pointer))
+    return target
+
+
+def git_readonly_env():
+    """Build the environment for read-only git queries.
+
+    'git status' normally refreshes the index, which takes index.lock and
+    makes parallel builds of one checkout fight over it. GIT_OPTIONAL_LOCKS=0
+    (git-2.15) tells it to skip that optional write. ('git describe --dirty'
+    refreshes the index regardless, so we do not use it.)
+    Pagers, prompts and the fsmonitor hook are switched off too, and the
+    GIT_ENV_REDIRECTS variables (set e.g. inside git hooks) are dropped so
+    they cannot point the query at some other repository. Everything else
+    is passed through, since git itself may need it to run at all.
+    """
+    env = os.environ.copy()
+    for name in GIT_ENV_REDIRECTS:
+        env.pop(name, None)
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["GIT_PAGER"] = "cat"
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    # same as 'git -c core.fsmonitor=false' (git-2.31), after any such
+    # settings the caller made
+    try:
+        count = int(env.get("GIT_CONFIG_COUNT", "0"))
+    except ValueError:
+        count = 0
+    env["GIT_CONFIG_COUNT"] = str(count + 1)
+    env["GIT_CONFIG_KEY_%%d" %% count] = "core.fsmonitor"
+    env["GIT_CONFIG_VALUE_%%d" %% count] = "false"
+    return env
+
+
+@register_vcs_handler("git", "pieces_from_vcs")
+def git_pieces_from_vcs(tag_prefix, root, verbose, run_command=run_command,
+                        first_parent=False, short_hash_length=None,
+                        deadline=None):
+    """Get version from 'git describe' in the root of the source tree.
+
+    This only gets called if the git-archive 'subst' keywords were *not*
+    expanded, and _version.py hasn't already been rewritten with a short
+    version string, meaning we're inside a checked out source tree.
+
+    If first_parent is True, the closest tag and the distance are computed
+    along the first-parent (mainline) history only, ignoring any side
+    branches that were merged in.
+
+    If short_hash_length is set, the short revision id is always that many
+    characters of the full one, and git is told not to spend time looking
+    for a unique abbreviation.
+
+    If deadline (a time.time() value) is given, any git command still running
+    when it passes is killed, and CommandTimeoutError is raised.
+    """
+    if not os.path.exists(os.path.join(root, ".git")):
+        root = git_root_from_pointer(root, verbose) or root
+    if not os.path.exists(os.path.join(root, ".git")):
+        if verbose:
+            print("no .git in %%s" %% root)
+        raise NotThisMethod("no .git directory")
+    import re
+
+    GITS = ["git"]
+    if sys.platform == "win32":
+        GITS = ["git.cmd", "git.exe"]
+
+    env = git_readonly_env()
+
+    def run_git(args):
+        if deadline is None:
+            return run_command(GITS, args, cwd=root, env=env)
+        return run_command(GITS, args, cwd=root, env=env,
+                           timeout=deadline - time.time())
+
+    # if there is a tag matching tag_prefix, this yields TAG-NUM-gHEX
+    # if there isn't one, this yields HEX (no NUM)
+    describe_args = ["describe", "--tags", "--always", "--long",
+                     "--match", "%%s*" %% tag_prefix]
+    if first_parent:
+        # --first-parent was added in git-1.8.4
+        describe_args.append("--first-parent")
+    if short_hash_length:
+        # a full-length hash is unique by definition, so git can skip the
+        # object lookups it would do to disambiguate a shorter one
+        describe_args.append("--abbrev=40")
+    describe_out = run_git(describe_args)
+    # --long was added in git-1.5.5
+    if describe_out is None:
+        raise NotThisMethod("'git describe' failed")
+    describe_out = describe_out.strip()
+    full_out = run_git(["rev-parse", "HEAD"])
+    if full_out is None:
+        raise NotThisMethod("'git rev-parse' failed")
+    full_out = full_out.strip()
+    # 'git describe --dirty' would also tell us this, but it rewrites the
+    # index even with GIT_OPTIONAL_LOCKS=0. Untracked files do not count,
+    # just as they don't for --dirty.
+    status_out = run_git(["status", "--porcelain", "--untracked-files=no"])
+    if status_out is None:
+        raise NotThisMethod("'git status' failed")
+
+    pieces = {}
+    pieces["long"] = full_out
+    # maybe improved later, unless short_hash_length pins it
+    pieces["short"] = full_out[:short_hash_length or 7]
+    pieces["error"] = None
+    pieces["dirty"] = bool(status_out.strip())
+
+    # parse describe_out. It will be like TAG-NUM-gHEX or HEX.
+    # TAG might have hyphens.
+    git_describe = describe_out
+
+    if "-" in git_describe:
+        # TAG-NUM-gHEX
+        mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', git_describe)
+        if not mo:
+            # unparseable. Maybe git-describe is misbehaving?
+            pieces["error"] = ("unable to parse git-describe output: '%%s'"
+                               %% describe_out)
+            return pieces
+
+        # tag
+        full_tag = mo.group(1)
+        if not full_tag.startswith(tag_prefix):
+            if verbose:
+                fmt = "tag '%%s' doesn't start with prefix '%%s'"
+                print(fmt %% (full_tag, tag_prefix))
+            pieces["error"] = ("tag '%%s' doesn't start with prefix '%%s'"
+                               %% (full_tag, tag_prefix))
+            return pieces
+        pieces["closest-tag"] = full_tag[len(tag_prefix):]
+
+        # distance: number of commits since tag
+        pieces["distance"] = int(mo.group(2))
+
+        # commit: short hex revision ID
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+
+    else:
+        # HEX: no tags
+        pieces["closest-tag"] = None
+        count_args = ["rev-list", "HEAD", "--count"]
+        if first_parent:
+            count_args.append("--first-parent")
+        count_out = run_git(count_args)
+        pieces["distance"] = int(count_out)  # total number of commits
+
+    return pieces
+# --END STRATEGY
+
+
+# --BEGIN STYLE pep440 pep440-post
+def plus_or_dot(pieces):
+    """Return a + if we don't already have one, else return a ."""
+    if "+" in pieces.get("closest-tag", ""):
+        return "."
+    return "+"
+# --END STYLE
+
+
+# --BEGIN STYLE pep440
+def render_pep440(pieces):
+    """Build up version string, with post-release "local version identifier".
+
+    Our goal: TAG[+DISTANCE.gHEX[.dirty]] . Note that if you
+    get a tagged build and then dirty it, you'll get TAG+0.gHEX.dirty
+
+    Exceptions:
+    1: no tags. git_describe was just HEX. 0+untagged.DISTANCE.gHEX[.dirty]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += plus_or_dot(pieces)
+            rendered += "%%d.g%%s" %% (pieces["distance"], pieces["short"])
+            if pieces["dirty"]:
+                rendered += ".dirty"
+    else:
+        # exception #1
+        rendered = "0+untagged.%%d.g%%s" %% (pieces["distance"],
+                                          pieces["short"])
+        if pieces["dirty"]:
+            rendered += ".dirty"
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE pep440-pre
+def render_pep440_pre(pieces):
+    """TAG[.post.devDISTANCE] -- No -dirty.
+
+    Exceptions:
+    1: no tags. 0.post.devDISTANCE
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"]:
+            rendered += ".post.dev%%d" %% pieces["distance"]
+    else:
+        # exception #1
+        rendered = "0.post.dev%%d" %% pieces["distance"]
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE pep440-post
+def render_pep440_post(pieces):
+    """TAG[.postDISTANCE[.dev0]+gHEX] .
+
+    The ".dev0" means dirty. Note that .dev0 sorts backwards
+    (a dirty tree will appear "older" than the corresponding clean one),
+    but you shouldn't be releasing software with -dirty anyways.
+
+    Exceptions:
+    1: no tags. 0.postDISTANCE[.dev0]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += ".post%%d" %% pieces["distance"]
+            if pieces["dirty"]:
+                rendered += ".dev0"
+            rendered += plus_or_dot(pieces)
+            rendered += "g%%s" %% pieces["short"]
+    else:
+        # exception #1
+        rendered = "0.post%%d" %% pieces["distance"]
+        if pieces["dirty"]:
+            rendered += ".dev0"
+        rendered += "+g%%s" %% pieces["short"]
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE pep440-old
+def render_pep440_old(pieces):
+    """TAG[.postDISTANCE[.dev0]] .
+
+    The ".dev0" means dirty.
+
+    Eexceptions:
+    1: no tags. 0.postDISTANCE[.dev0]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += ".post%%d" %% pieces["distance"]
+            if pieces["dirty"]:
+                rendered += ".dev0"
+    else:
+        # exception #1
+        rendered = "0.post%%d" %% pieces["distance"]
+        if pieces["dirty"]:
+            rendered += ".dev0"
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE git-describe
+def render_git_describe(pieces):
+    """TAG[-DISTANCE-gHEX][-dirty].
+
+    Like 'git describe --tags --dirty --always'.
+
+    Exceptions:
+    1: no tags. HEX[-dirty]  (note: no 'g' prefix)
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"]:
+            rendered += "-%%d-g%%s" %% (pieces["distance"], pieces["short"])
+    else:
+        # exception #1
+        rendered = pieces["short"]
+    if pieces["dirty"]:
+        rendered += "-dirty"
+    return rendered
+# --END STYLE
+
+
+# --BEGIN STYLE git-describe-long
+def render_git_describe_long(pieces):
+    """TAG-DISTANCE-gHEX[-dirty].
+
+    Like 'git describe --tags --dirty --always -long'.
+    The distance/hash is unconditional.
+
+    Exceptions:
+    1: no tags. HEX[-dirty]  (note: no 'g' prefix)
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        rendered += "-%%d-g%%s" %% (pieces["distance"], pieces["short"])
+    else:
+        # exception #1
+        rendered = pieces["short"]
+    if pieces["dirty"]:
+        rendered += "-dirty"
+    return rendered
+# --END STYLE
+
+
+def render(pieces, style):
+    """Render the given version pieces into the requested style."""
+    if pieces["error"]:
+        return {"version": "unknown",
+                "full-revisionid": pieces.get("long"),
+                "dirty": None,
+                "error": pieces["error"]}
+
+    if not style or style == "default":
+        style = "pep440"  # the default
+
+    # each style is tested separately, so that 'versioneer.py setup' can
+    # leave out the ones a project doesn't use
+    rendered = None
+    # --BEGIN STYLE pep440
+    if style == "pep440":
+        rendered = render_pep440(pieces)
+    # --END STYLE
+    # --BEGIN STYLE pep440-pre
+    if style == "pep440-pre":
+        rendered = render_pep440_pre(pieces)
+    # --END STYLE
+    # --BEGIN STYLE pep440-post
+    if style == "pep440-post":
+        rendered = render_pep440_post(pieces)
+    # --END STYLE
+    # --BEGIN STYLE pep440-old
+    if style == "pep440-old":
+        rendered = render_pep440_old(pieces)
+    # --END STYLE
+    # --BEGIN STYLE git-describe
+    if style == "git-describe":
+        rendered = render_git_describe(pieces)
+    # --END STYLE
+    # --BEGIN STYLE git-describe-long
+    if style == "git-describe-long":
+        rendered = render_git_describe_long(pieces)
+    # --END STYLE
+    if rendered is None:
+        raise ValueError("unknown style '%%s'" %% style)
+
+    return {"version": rendered, "full-revisionid": pieces["long"],
+            "dirty": pieces["dirty"], "error": None}
+
+
+def get_versions():
+    """Get version information or return default if unable to do so."""
+    # I am in _version.py, which lives at ROOT/VERSIONFILE_SOURCE. If we have
+    # __file__, we can work backwards from there to the root. Some
+    # py2exe/bbfreeze/non-CPython implementations don't do __file__, in which
+    # case we can only use expanded keywords.
+
+    cfg = get_config()
+    # --BEGIN STRATEGY keywords vcs parentdir
+    verbose = cfg.verbose
+    # --END STRATEGY
+
+    # setup.cfg's strategies= may also name "file" and "env", which only
+    # setup.py can use: this file *is* the versionfile, and the environment
+    # of whoever imports it says nothing about how it was built
+    root = None
+    for strategy in cfg.strategies:
+        # --BEGIN STRATEGY keywords
+        if strategy == "keywords":
+            try:
+                return git_versions_from_keywords(
+                    get_keywords(), cfg.tag_prefix, verbose, style=cfg.style,
+                    short_hash_length=cfg.short_hash_length)
+            except NotThisMethod:
+                continue
+        # --END STRATEGY
+        if strategy not in ("vcs", "parentdir"):
+            continue
+
+        if root is None:
+            try:
+                root = os.path.realpath(__file__)
+                # versionfile_source is the relative path from the top of
+                # the source tree (where the .git directory might live) to
+                # this file. Invert this to find the root from __file__.
+                for i in cfg.versionfile_source.split('/'):
+                    root = os.path.dirname(root)
+            except NameError:
+                return {"version": "0+unknown", "full-revisionid": None,
+                        "dirty": None,
+                        "error": "unable to find root of source tree"}
+
+        # --BEGIN STRATEGY vcs
+        if strategy == "vcs":
+            try:
+                pieces = git_pieces_from_vcs(
+                    cfg.tag_prefix, root, verbose,
+                    first_parent=cfg.first_parent,
+                    short_hash_length=cfg.short_hash_length)
+                return render(pieces, cfg.style)
+            except NotThisMethod:
+                pass
+
+            # no checkout (git_pieces_from_vcs() gives up without running
+            # git if there is no .git), so maybe this file was installed:
+            # ask the metadata of the distribution that put it here
+            try:
+                return versions_from_metadata(__name__.split(".")[0],
+                                              verbose, versionfile=__file__)
+            except NotThisMethod:
+                pass
+        # --END STRATEGY
+
+        # --BEGIN STRATEGY parentdir
+        if strategy == "parentdir":
+            try:
+                if cfg.parentdir_prefix:
+                    return versions_from_parentdir(cfg.parentdir_prefix,
+                                                   root, verbose)
+            except NotThisMethod:
+                pass
+        # --END STRATEGY
+
+    return {"version": "0+unknown", "full-revisionid": None,
+            "dirty": None,
+            "error": "unable to compute version"}
+'''
+
+
+@register_vcs_handler("git", "get_keywords")
+def git_get_keywords(versionfile_abs):
+    """Extract version information from the given file."""
+    # the code embedded in _version.py can just fetch the value of these
+    # keywords. When used from setup.py, we don't want to import _version.py,
+    # so we do it with a regexp instead. This function is not used from
+    # _version.py.
+    try:
+        f = open(versionfile_abs, "r")
+        keywords = git_keywords_from_lines(f.readlines())
+        f.close()
+    except EnvironmentError:
+        return {}
+    return keywords
+
+
+# matches the keyword assignments in get_keywords(), each on its own line
+GIT_KEYWORD_RE = re.compile(r'^\s*git_(refnames|full|describe)\s*=\s*"(.*)"')
+
+
+@register_vcs_handler("git", "keywords_from_lines")
+def git_keywords_from_lines(lines):
+    """Extract version information from the lines of a _version.py."""
+    keywords = {}
+    for line in lines:
+        mo = GIT_KEYWORD_RE.match(line)
+        if mo:
+            keywords[mo.group(1)] = mo.group(2)
+    return keywords
+
+
+def git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                     short_hash_length=None):
+    """Get version pieces from an expanded %(describe) keyword, if any.
+
+    git-2.35 and later expand $Format:%(describe:...)$ during git-archive
+    into TAG or TAG-NUM-gHEX, which tells us the distance that the %d
+    refnames cannot. Older versions of git leave the placeholder alone, and
+    commits with no matching tag expand it to an empty string. For those
+    this returns None, and the caller falls back to the refnames.
+    """
+    describe = keywords.get("describe", "").strip()
+    if not describe or describe.startswith(("$Format", "%(")):
+        if verbose:
+            print("no usable describe keyword")
+        return None
+    import re
+    full = keywords["full"].strip()
+    pieces = {"long": full, "short": full[:short_hash_length or 7],
+              "dirty": False, "error": None, "distance": 0}
+    mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', describe)
+    if mo:
+        full_tag = mo.group(1)
+        pieces["distance"] = int(mo.group(2))
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+    else:
+        full_tag = describe  # exactly on the tag
+    if not full_tag.startswith(tag_prefix):
+        if verbose:
+            print("tag '%s' doesn't start with prefix '%s'"
+                  % (full_tag, tag_prefix))
+        return None
+    pieces["closest-tag"] = full_tag[len(tag_prefix):]
+    if verbose:
+        print("got pieces from describe keyword: %s" % describe)
+    return pieces
+
+
+@register_vcs_handler("git", "keywords")
+def git_versions_from_keywords(keywords, tag_prefix, verbose, style=None,
+                               short_hash_length=None):
+    """Get version information from git keywords."""
+    if not keywords:
+        raise NotThisMethod("no keywords at all, weird")
+    refnames = keywords["refnames"].strip()
+    if refnames.startswith("$Format"):
+        if verbose:
+            print("keywords are unexpanded, not using")
+        raise NotThisMethod("unexpanded keywords, not a git-archive tarball")
+    pieces = git_pieces_from_describe_keyword(keywords, tag_prefix, verbose,
+                                              short_hash_length)
+    if pieces:
+        return render(pieces, style)
+    import re
+    refs = set([r.strip() for r in refnames.strip("()").split(",")])
+    # starting in git-1.8.3, tags are listed as "tag: foo-1.0" instead of
+    # just "foo-1.0". If we see a "tag: " prefix, prefer those.
+    TAG = "tag: "
+    tags = set([r[len(TAG):] for r in refs if r.startswith(TAG)])
+    if not tags:
+        # Either we're using git < 1.8.3, or there really are no tags. We use
+        # a heuristic: assume all version tags have a digit. The old git %d
+        # expansion behaves like git log --decorate=short and strips out the
+        # refs/heads/ and refs/tags/ prefixes that would let us distinguish
+        # between branches and tags. By ignoring refnames without digits, we
+        # filter out many common branch names like "release" and
+        # "stabilization", as well as "HEAD" and "master".
+        tags = set([r for r in refs if re.search(r'\d', r)])
+        if verbose:
+            print("discarding '%s', no digits" % ",".join(refs-tags))
+    if verbose:
+        print("likely tags: %s" % ",".join(sorted(tags)))
+    for ref in sorted(tags):
+        # sorting will prefer e.g. "2.0" over "2.0rc1"
+        if ref.startswith(tag_prefix):
+            r = ref[len(tag_prefix):]
+            if verbose:
+                print("picking %s" % r)
+            return {"version": r,
+                    "full-revisionid": keywords["full"].strip(),
+                    "dirty": False, "error": None
+                    }
+    # no suitable tags, so version is "0+unknown", but full hex is still there
+    if verbose:
+        print("no suitable tags, using unknown + full revision id")
+    return {"version": "0+unknown",
+            "full-revisionid": keywords["full"].strip(),
+            "dirty": False, "error": "no suitable tags"}
+
+
+# variables that would point version queries at some other repository (or
+# another part of this one), and are dropped from the caller's environment
+GIT_ENV_REDIRECTS = ["GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE",
+                     "GIT_OBJECT_DIRECTORY",
+                     "GIT_ALTERNATE_OBJECT_DIRECTORIES", "GIT_COMMON_DIR",
+                     "GIT_NAMESPACE", "GIT_CEILING_DIRECTORIES",
+                     "GIT_DISCOVERY_ACROSS_FILESYSTEM", "GIT_PREFIX",
+                     "GIT_REPLACE_REF_BASE", "GIT_GRAFT_FILE",
+                     "GIT_SHALLOW_FILE"]
+
+# a copy of the source tree that leaves out .git can find the original
+# checkout through this file, see git_root_from_pointer()
+POINTER_FILE = ".versioneer-root"
+
+
+def git_root_from_pointer(root, verbose):
+    """Return the checkout that root's pointer file names, or None.
+
+    Builds that copy the source tree somewhere else (like pip's legacy
+    builds) can leave out .git, which may be huge, when the tree has a
+    pointer file written by 'versioneer.py pointer': git then runs in the
+    original checkout instead.
+    """
+    pointer = os.path.join(root, POINTER_FILE)
+    if not os.path.exists(pointer):
+        return None
+    import json
+    try:
+        with open(pointer, "r") as f:
+            target = json.load(f)["root"]
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        if verbose:
+            print("unable to read %s" % pointer)
+        return None
+    if not os.path.exists(os.path.join(target, ".git")):
+        if verbose:
+            print("%s points at %s, which has no .git" % (pointer, target))
+        return None
+    if verbose:
+        print("using the checkout in %s, named by %s" % (target, pointer))
+    return target
+
+
+def git_readonly_env():
+    """Build the environment for read-only git queries.
+
+    'git status' normally refreshes the index, which takes index.lock and
+    makes parallel builds of one checkout fight over it. GIT_OPTIONAL_LOCKS=0
+    (git-2.15) tells it to skip that optional write. ('git describe --dirty'
+    refreshes the index regardless, so we do not use it.)
+    Pagers, prompts and the fsmonitor hook are switched off too, and the
+    GIT_ENV_REDIRECTS variables (set e.g. inside git hooks) are dropped so
+    they cannot point the query at some other repository. Everything else
+    is passed through, since git itself may need it to run at all.
+    """
+    env = os.environ.copy()
+    for name in GIT_ENV_REDIRECTS:
+        env.pop(name, None)
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["GIT_PAGER"] = "cat"
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    # same as 'git -c core.fsmonitor=false' (git-2.31), after any such
+    # settings the caller made
+    try:
+        count = int(env.get("GIT_CONFIG_COUNT", "0"))
+    except ValueError:
+        count = 0
+    env["GIT_CONFIG_COUNT"] = str(count + 1)
+    env["GIT_CONFIG_KEY_%d" % count] = "core.fsmonitor"
+    env["GIT_CONFIG_VALUE_%d" % count] = "false"
+    return env
+
+
+@register_vcs_handler("git", "pieces_from_vcs")
+def git_pieces_from_vcs(tag_prefix, root, verbose, run_command=run_command,
+                        first_parent=False, short_hash_length=None,
+                        deadline=None):
+    """Get version from 'git describe' in the root of the source tree.
+
+    This only gets called if the git-archive 'subst' keywords were *not*
+    expanded, and _version.py hasn't already been rewritten with a short
+    version string, meaning we're inside a checked out source tree.
+
+    If first_parent is True, the closest tag and the distance are computed
+    along the first-parent (mainline) history only, ignoring any side
+    branches that were merged in.
+
+    If short_hash_length is set, the short revision id is always that many
+    characters of the full one, and git is told not to spend time looking
+    for a unique abbreviation.
+
+    If deadline (a time.time() value) is given, any git command still running
+    when it passes is killed, and CommandTimeoutError is raised.
+    """
+    if not os.path.exists(os.path.join(root, ".git")):
+        root = git_root_from_pointer(root, verbose) or root
+    if not os.path.exists(os.path.join(root, ".git")):
+        if verbose:
+            print("no .git in %s" % root)
+        raise NotThisMethod("no .git directory")
+    import re
+
+    GITS = ["git"]
+    if sys.platform == "win32":
+        GITS = ["git.cmd", "git.exe"]
+
+    env = git_readonly_env()
+
+    def run_git(args):
+        if deadline is None:
+            return run_command(GITS, args, cwd=root, env=env)
+        return run_command(GITS, args, cwd=root, env=env,
+                           timeout=deadline - time.time())
+
+    # if there is a tag matching tag_prefix, this yields TAG-NUM-gHEX
+    # if there isn't one, this yields HEX (no NUM)
+    describe_args = ["describe", "--tags", "--always", "--long",
+                     "--match", "%s*" % tag_prefix]
+    if first_parent:
+        # --first-parent was added in git-1.8.4
+        describe_args.append("--first-parent")
+    if short_hash_length:
+        # a full-length hash is unique by definition, so git can skip the
+        # object lookups it would do to disambiguate a shorter one
+        describe_args.append("--abbrev=40")
+    describe_out = run_git(describe_args)
+    # --long was added in git-1.5.5
+    if describe_out is None:
+        raise NotThisMethod("'git describe' failed")
+    describe_out = describe_out.strip()
+    full_out = run_git(["rev-parse", "HEAD"])
+    if full_out is None:
+        raise NotThisMethod("'git rev-parse' failed")
+    full_out = full_out.strip()
+    # 'git describe --dirty' would also tell us this, but it rewrites the
+    # index even with GIT_OPTIONAL_LOCKS=0. Untracked files do not count,
+    # just as they don't for --dirty.
+    status_out = run_git(["status", "--porcelain", "--untracked-files=no"])
+    if status_out is None:
+        raise NotThisMethod("'git status' failed")
+
+    pieces = {}
+    pieces["long"] = full_out
+    # maybe improved later, unless short_hash_length pins it
+    pieces["short"] = full_out[:short_hash_length or 7]
+    pieces["error"] = None
+    pieces["dirty"] = bool(status_out.strip())
+
+    # parse describe_out. It will be like TAG-NUM-gHEX or HEX.
+    # TAG might have hyphens.
+    git_describe = describe_out
+
+    if "-" in git_describe:
+        # TAG-NUM-gHEX
+        mo = re.search(r'^(.+)-(\d+)-g([0-9a-f]+)$', git_describe)
+        if not mo:
+            # unparseable. Maybe git-describe is misbehaving?
+            pieces["error"] = ("unable to parse git-describe output: '%s'"
+                               % describe_out)
+            return pieces
+
+        # tag
+        full_tag = mo.group(1)
+        if not full_tag.startswith(tag_prefix):
+            if verbose:
+                fmt = "tag '%s' doesn't start with prefix '%s'"
+                print(fmt % (full_tag, tag_prefix))
+            pieces["error"] = ("tag '%s' doesn't start with prefix '%s'"
+                               % (full_tag, tag_prefix))
+            return pieces
+        pieces["closest-tag"] = full_tag[len(tag_prefix):]
+
+        # distance: number of commits since tag
+        pieces["distance"] = int(mo.group(2))
+
+        # commit: short hex revision ID
+        if not short_hash_length:
+            pieces["short"] = mo.group(3)
+
+    else:
+        # HEX: no tags
+        pieces["closest-tag"] = None
+        count_args = ["rev-list", "HEAD", "--count"]
+        if first_parent:
+            count_args.append("--first-parent")
+        count_out = run_git(count_args)
+        pieces["distance"] = int(count_out)  # total number of commits
+
+    return pieces
+
+
+def do_vcs_install(manifest_in, versionfile_source, ipy):
+    """Git-specific installation logic for Versioneer.
+
+    For Git, this means creating/changing .gitattributes to mark _version.py
+    for export-time keyword substitution.
+    """
+    GITS = ["git"]
+    if sys.platform == "win32":
+        GITS = ["git.cmd", "git.exe"]
+    files = [manifest_in, versionfile_source]
+    if ipy:
+        files.append(ipy)
+    try:
+        me = __file__
+        if me.endswith(".pyc") or me.endswith(".pyo"):
+            me = os.path.splitext(me)[0] + ".py"
+        versioneer_file = os.path.relpath(me)
+    except NameError:
+        versioneer_file = "versioneer.py"
+    files.append(versioneer_file)
+    present = False
+    try:
+        f = open(".gitattributes", "r")
+        for line in f.readlines():
+            if line.strip().startswith(versionfile_source):
+                if "export-subst" in line.strip().split()[1:]:
+                    present = True
+        f.close()
+    except EnvironmentError:
+        pass
+    if not present:
+        f = open(".gitattributes", "a+")
+        f.write("%s export-subst\n" % versionfile_source)
+        f.close()
+        files.append(".gitattributes")
+    run_command(GITS, ["add", "--"] + files)
+
+
+def git_dirs(root):
+    """Find the git dir of the checkout at root, and the one it shares.
+
+    Returns (gitdir, commondir), or None if root is not a git checkout. A
+    linked worktree (or a submodule) has a .git file naming its own git
+    dir, which may keep its refs and config in the main repository's.
+    """
+    dot_git = os.path.join(root, ".git")
+    if os.path.isdir(dot_git):
+        gitdir = dot_git
+    elif os.path.isfile(dot_git):
+        with open(dot_git, "r") as f:
+            line = f.readline().strip()
+        if not line.startswith("gitdir:"):
+            return None
+        gitdir = os.path.join(root, line[len("gitdir:"):].strip())
+    else:
+        return None
+    commondir = gitdir
+    try:
+        with open(os.path.join(gitdir, "commondir"), "r") as f:
+            commondir = os.path.join(gitdir, f.read().strip())
+    except EnvironmentError:
+        pass
+    return gitdir, commondir
+
+
+@register_vcs_handler("git", "fingerprint_inputs")
+def git_fingerprint_inputs(root):
+    """List the files that decide what 'git describe' reports for root.
+
+    Returns a list of ("read", path) and ("stat", path) pairs: HEAD and the
+    branch it points at are small enough to read, while packed-refs, every
+    loose tag (and the directories holding them, which change when a tag is
+    added or removed), the index, shallow and config only need their stat().
+    A copy of the tree without .git is followed to the checkout its pointer
+    file names, and the pointer file is listed too.
+    """
+    inputs = [("read", os.path.join(root, POINTER_FILE))]
+    dirs = git_dirs(root)
+    if dirs is None:
+        pointed = git_root_from_pointer(root, False)
+        if pointed is not None:
+            dirs = git_dirs(pointed)
+    if dirs is None:
+        return inputs
+    gitdir, commondir = dirs
+    head = os.path.join(gitdir, "HEAD")
+    inputs.append(("read", head))
+    try:
+        with open(head, "r") as f:
+            target = f.read().strip()
+    except EnvironmentError:
+        target = ""
+    if target.startswith("ref:"):
+        inputs.append(("read", os.path.join(commondir,
+                                            target[len("ref:"):].strip())))
+    for name in ["packed-refs", "shallow", "config"]:
+        inputs.append(("stat", os.path.join(commondir, name)))
+    inputs.append(("stat", os.path.join(gitdir, "index")))
+    for dirpath, dirnames, filenames in os.walk(os.path.join(commondir,
+                                                             "refs", "tags")):
+        dirnames.sort()
+        inputs.append(("stat", dirpath))
+        for filename in sorted(filenames):
+            inputs.append(("stat", os.path.join(dirpath, filename)))
+    return inputs
+
+# bump this when the meaning of a cache entry changes
+GIT_CACHE_FORMAT = 1
+
+
+def git_resolve_ref(gitdir, commondir, ref):
+    """Find the commit id a ref (like "HEAD") names, by reading files.
+
+    Returns None if that needs more than loose refs and packed-refs, e.g.
+    in a repository that uses reftable.
+    """
+    for i in range(5):  # symbolic refs pointing at symbolic refs
+        value = None
+        for d in [gitdir, commondir]:
+            try:
+                with open(os.path.join(d, ref), "r") as f:
+                    value = f.read().strip()
+                break
+            except EnvironmentError:
+                pass
+        if value is None:
+            value = git_packed_refs(commondir).get(ref)
+        if not value:
+            return None
+        if not value.startswith("ref:"):
+            return value
+        ref = value[len("ref:"):].strip()
+    return None
+
+
+def git_packed_refs(commondir):
+    """Return {refname: id} from the repository's packed-refs file."""
+    refs = {}
+    try:
+        with open(os.path.join(commondir, "packed-refs"), "r") as f:
+            for line in f:
+                if line.startswith("#") or line.startswith("^"):
+                    continue
+                fields = line.split()
+                if len(fields) == 2:
+                    refs[fields[1]] = fields[0]
+    except EnvironmentError:
+        pass
+    return refs
+
+
+def git_tags_digest(commondir, tag_prefix):
+    """Return a digest of the tags that 'git describe' may consider.
+
+    Only tags starting with tag_prefix count. Loose tags win over packed
+    ones, as they do for git.
+    """
+    import hashlib
+    tags = {}
+    for name, value in git_packed_refs(commondir).items():
+        if name.startswith("refs/tags/"):
+            tags[name] = value
+    tags_dir = os.path.join(commondir, "refs", "tags")
+    for dirpath, dirnames, filenames in os.walk(tags_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            name = "refs/tags/" + os.path.relpath(path, tags_dir).replace(
+                os.sep, "/")
+            try:
+                with open(path, "r") as f:
+                    tags[name] = f.read().strip()
+            except EnvironmentError:
+                pass  # deleted while we looked
+    wanted = sorted((name, value) for name, value in tags.items()
+                    if name.startswith("refs/tags/" + tag_prefix))
+    return hashlib.sha1(repr(wanted).encode("utf-8")).hexdigest()
+
+
+def git_cache_lock(cache_dir):
+    """Take the cache directory's lock, returning an object to unlock().
+
+    This serializes writers and eviction between processes. Readers do not
+    need it, since entries are replaced atomically.
+    """
+    f = open(os.path.join(cache_dir, "lock"), "a+")
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def git_cache_unlock(f):
+    """Release a lock taken by git_cache_lock()."""
+    if sys.platform == "win32":
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    f.close()  # this drops a flock() too
+
+
+def git_cache_evict(cache_dir, cache_size):
+    """Remove the least recently used entries beyond cache_size."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".json"):
+            path = os.path.join(cache_dir, name)
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except EnvironmentError:
+                pass
+    entries.sort()
+    for mtime, path in entries[:max(0, len(entries) - cache_size)]:
+        try:
+            os.unlink(path)
+        except EnvironmentError:
+            pass
+
+
+@register_vcs_handler("git", "pieces_from_cache")
+def git_pieces_from_cache(tag_prefix, root, verbose, cache_dir,
+                          cache_size=1000, run_command=run_command,
+                          first_parent=False, short_hash_length=None,
+                          deadline=None):
+    """Get version pieces, sharing 'git describe' results between checkouts.
+
+    Worktrees and clones of one repository on the same machine all ask git
+    to walk the same history. The tag and distance part of their pieces is
+    kept in cache_dir, keyed by the commit id, a digest of the tags that
+    match tag_prefix, the shallow boundary (the only way two repositories
+    can disagree about the history of a commit) and the settings that
+    change the answer. Finding the key only reads files. A hit then needs
+    just a 'git status' to tell whether this checkout is dirty; a miss runs
+    git_pieces_from_vcs() and stores its result. The least recently used
+    entries beyond cache_size are evicted.
+    """
+    import hashlib
+    import json
+    dirs = git_dirs(root)
+    if dirs is None:
+        root = git_root_from_pointer(root, verbose) or root
+        dirs = git_dirs(root)
+    if dirs is None:
+        if verbose:
+            print("no .git in %s" % root)
+        raise NotThisMethod("no .git directory")
+    gitdir, commondir = dirs
+    full = git_resolve_ref(gitdir, commondir, "HEAD")
+
+    def from_vcs():
+        return git_pieces_from_vcs(tag_prefix, root, verbose,
+                                   run_command=run_command,
+                                   first_parent=first_parent,
+                                   short_hash_length=short_hash_length,
+                                   deadline=deadline)
+    if not full:
+        if verbose:
+            print("unable to read HEAD in %s, not using the cache" % gitdir)
+        return from_vcs()
+
+    try:
+        with open(os.path.join(commondir, "shallow"), "r") as f:
+            shallow = f.read().split()
+    except EnvironmentError:
+        shallow = []
+    key = hashlib.sha1(repr([GIT_CACHE_FORMAT, full,
+                             git_tags_digest(commondir, tag_prefix),
+                             sorted(shallow), tag_prefix, bool(first_parent),
+                             short_hash_length]).encode("utf-8")).hexdigest()
+    entry = os.path.join(cache_dir, key + ".json")
+
+    try:
+        with open(entry, "r") as f:
+            pieces = json.load(f)
+    except (EnvironmentError, ValueError):
+        pieces = None
+    if pieces is not None:
+        GITS = ["git"]
+        if sys.platform == "win32":
+            GITS = ["git.cmd", "git.exe"]
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - time.time()
+        status = run_command(GITS, ["status", "--porcelain",
+                                    "--untracked-files=no"],
+                             cwd=root, env=git_readonly_env(),
+                             timeout=timeout)
+        if status is None:
+            raise NotThisMethod("'git status' failed")
+        pieces["dirty"] = bool(status)
+        pieces["error"] = None
+        try:
+            os.utime(entry, None)  # mark it as recently used
+        except EnvironmentError:
+            pass
+        if verbose:
+            print("found %s in the version cache" % full)
+        return pieces
+
+    pieces = from_vcs()
+    if pieces["error"] is None:
+        cached = dict((k, pieces[k])
+                      for k in ["long", "short", "closest-tag", "distance"])
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            lock = git_cache_lock(cache_dir)
+            try:
+                write_atomically(entry, json.dumps(cached, sort_keys=True))
+                git_cache_evict(cache_dir, cache_size)
+            finally:
+                git_cache_unlock(lock)
+        except EnvironmentError as e:
+            if verbose:
+                print("unable to update the version cache: %s" % e)
+    return pieces
+
+
+def versions_from_parentdir(parentdir_prefix, root, verbose):
+    """Try to determine the version from the parent directory name.
+
+    Source tarballs conventionally unpack into a directory that includes
+    both the project name and a version string.
+    """
+    dirname = os.path.basename(root)
+    if not dirname.startswith(parentdir_prefix):
+        if verbose:
+            print("guessing rootdir is '%s', but '%s' doesn't start with "
+                  "prefix '%s'" % (root, dirname, parentdir_prefix))
+        raise NotThisMethod("rootdir doesn't start with parentdir_prefix")
+    return {"version": dirname[len(parentdir_prefix):],
+            "full-revisionid": None,
+            "dirty": False, "error": None}
+
+# (commit variable, tag variable, tag variable holds a full ref) for each CI
+# system we know about. The tag variable is only set by builds of a tag.
+CI_ENV_VARIABLES = [
+    ("GITHUB_SHA", "GITHUB_REF", True),  # GitHub Actions
+    ("CI_COMMIT_SHA", "CI_COMMIT_TAG", False),  # GitLab CI
+    ("TRAVIS_COMMIT", "TRAVIS_TAG", False),  # Travis CI
+    ("CIRCLE_SHA1", "CIRCLE_TAG", False),  # CircleCI
+    ("BUILD_SOURCEVERSION", "BUILD_SOURCEBRANCH", True),  # Azure Pipelines
+    ("BITBUCKET_COMMIT", "BITBUCKET_TAG", False),  # Bitbucket Pipelines
+    ("APPVEYOR_REPO_COMMIT", "APPVEYOR_REPO_TAG_NAME", False),  # AppVeyor
+    ("GIT_COMMIT", "TAG_NAME", False),  # Jenkins
+    ]
+
+
+def pieces_from_env(tag_prefix, verbose, environ=None,
+                    short_hash_length=None):
+    """Get version pieces from CI environment variables, without the VCS.
+
+    The generic VERSIONEER_FULL_REVISIONID, VERSIONEER_CLOSEST_TAG,
+    VERSIONEER_DISTANCE and VERSIONEER_DIRTY variables win. Otherwise the
+    commit and tag exported by a known CI system are used. A CI system only
+    tells us about a tag when building exactly that tag, so for any other
+    commit we cannot know the distance, and give up.
+    """
+    if environ is None:
+        environ = os.environ
+
+    full = environ.get("VERSIONEER_FULL_REVISIONID")
+    tag = environ.get("VERSIONEER_CLOSEST_TAG")
+    if not full:
+        for commit_var, tag_var, tag_is_ref in CI_ENV_VARIABLES:
+            if environ.get(commit_var):
+                full = environ[commit_var]
+                if not tag:
+                    tag = environ.get(tag_var)
+                    if tag and tag_is_ref:
+                        if tag.startswith("refs/tags/"):
+                            tag = tag[len("refs/tags/"):]
+                        else:
+                            tag = None  # a branch build
+                if verbose:
+                    print("using commit from $%s" % commit_var)
+                break
+    if not full:
+        raise NotThisMethod("no commit id in the environment")
+    full = full.strip()
+
+    if tag:
+        if not tag.startswith(tag_prefix):
+            if verbose:
+                print("tag '%s' doesn't start with prefix '%s'"
+                      % (tag, tag_prefix))
+            raise NotThisMethod("tag doesn't start with tag_prefix")
+        tag = tag[len(tag_prefix):]
+    distance = environ.get("VERSIONEER_DISTANCE")
+    if distance is None:
+        if not tag:
+            raise NotThisMethod("distance from the closest tag is unknown")
+        distance = 0
+    try:
+        distance = int(distance)
+    except ValueError:
+        if verbose:
+            print("bad $VERSIONEER_DISTANCE '%s', it should be a number"
+                  % distance)
+        raise NotThisMethod("VERSIONEER_DISTANCE is not a number")
+
+    pieces = {}
+    pieces["long"] = full
+    pieces["short"] = full[:short_hash_length or 7]
+    pieces["closest-tag"] = tag or None
+    pieces["distance"] = distance
+    pieces["dirty"] = get_boolean(environ.get("VERSIONEER_DIRTY"))
+    pieces["error"] = None
+    return pieces
+
+MANIFEST_ENV = "VERSIONEER_MANIFEST"
+
+# how long write_manifest_entry() waits for another writer's lock, before
+# deciding that it was left behind by a process that died
+MANIFEST_LOCK_TIMEOUT = 30
+
+
+def get_manifest_path(root, cfg):
+    """Locate the version manifest, if one is configured.
+
+    $VERSIONEER_MANIFEST wins over the 'manifest' option in setup.cfg. A
+    relative setup.cfg value is relative to the project root.
+    """
+    path = os.environ.get(MANIFEST_ENV) or cfg.manifest
+    if not path:
+        return None
+    return os.path.join(root, path)
+
+
+def manifest_keys(manifest, root, project_name):
+    """Return the keys under which a project may appear in a manifest."""
+    root = os.path.realpath(root)
+    # resolve the directory, not the file: build sandboxes often provide the
+    # manifest itself as a symlink to somewhere outside the sandbox
+    manifest_dir = os.path.dirname(os.path.abspath(manifest))
+    manifest_dir = os.path.realpath(manifest_dir)
+    keys = [root]
+    try:
+        relative = os.path.relpath(root, manifest_dir)
+        keys.append(relative.replace(os.sep, "/"))
+    except ValueError:
+        pass  # on another drive, so there is no relative path
+    if project_name:
+        keys.append(project_name)
+    return keys
+
+
+def read_manifest(manifest):
+    """Load a version manifest, returning {} if it is missing or broken."""
+    import json
+    try:
+        with open(manifest, "r") as f:
+            entries = json.load(f)
+    except (EnvironmentError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def lock_manifest(manifest):
+    """Take the manifest's lock file, returning its path for unlocking.
+
+    Several projects of one build may record their entries at the same time,
+    and each rewrites the whole manifest, so they take turns.
+    """
+    lock = manifest + ".lock"
+    deadline = time.time() + MANIFEST_LOCK_TIMEOUT
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            if not os.path.exists(lock):
+                raise  # not just someone else's lock
+            if time.time() > deadline:
+                print("removing stale lock %s" % lock)
+                try:
+                    os.unlink(lock)
+                except OSError:
+                    pass
+                deadline = time.time() + MANIFEST_LOCK_TIMEOUT
+            else:
+                time.sleep(0.01)
+            continue
+        os.close(fd)
+        return lock
+
+
+def versions_from_manifest(manifest, root, project_name, verbose):
+    """Look up this project's pre-computed versions in a manifest file.
+
+    The manifest is a JSON object that maps project roots (absolute, or
+    relative to the manifest's directory) or project names to the dicts that
+    get_versions() returned when the manifest was written.
+    """
+    entries = read_manifest(manifest)
+    for key in manifest_keys(manifest, root, project_name):
+        if key in entries:
+            if verbose:
+                print("found '%s' in manifest %s" % (key, manifest))
+            return entries[key]
+    if verbose:
+        print("manifest %s has no entry for %s" % (manifest, root))
+    raise NotThisMethod("project not in version manifest")
+
+
+def write_manifest_entry(manifest, root, project_name, versions):
+    """Record this project's versions in a manifest, keeping other entries.
+
+    Entries are stored under the root relative to the manifest, which stays
+    valid when the whole tree is moved (e.g. into a build sandbox), and under
+    the project name if setup.cfg has one.
+    """
+    import json
+    keys = manifest_keys(manifest, root, project_name)[1:]
+    if not keys:
+        keys = [os.path.realpath(root)]
+    lock = lock_manifest(manifest)
+    try:
+        entries = read_manifest(manifest)
+        for key in keys:
+            entries[key] = versions
+        # other projects in the same build may be reading the manifest
+        write_atomically(manifest,
+                         json.dumps(entries, sort_keys=True, indent=1,
+                                    separators=(",", ": ")) + "\n")
+    finally:
+        os.unlink(lock)
+    print("set %s in %s to '%s'" % (root, manifest, versions["version"]))
+
+SHORT_VERSION_PY = """
+# This file was generated by 'versioneer.py' (0.15+dev) from
+# revision-control system data, or from the parent directory name of an
+# unpacked source archive. Distribution tarballs contain a pre-generated copy
+# of this file.
+
+versions = %s
+
+__version__ = %r
+
+# the version, pre-parsed so that comparing it needs no imports. These are
+# like (1, 2, 'post3', 'dev0', 'gabc') and a tuple that sorts the way PEP 440
+# orders versions, or None if the version isn't PEP 440 (git-describe styles)
+version_tuple = %s
+version_sort_key = %s
+
+
+def get_versions():
+    return dict(versions)
+"""
+
+
+# precompiled, since every setup.py command scans _version.py at least once
+VERSIONS_LITERAL = re.compile(r"^versions = (\{.*\})\s*$")
+# short files written by older versions of versioneer.py hold JSON instead
+VERSION_JSON_START = re.compile(r"version_json = '''\s*$")
+VERSION_JSON_END = re.compile(r"^'''  # END VERSION_JSON")
+KEYWORDS_END = re.compile(r"^\s*keywords = \{")
+
+
+def scan_version_file(filename):
+    """Read a _version.py once, and work out what kind of file it is.
+
+    See scan_version_lines(). A missing or unreadable file scans as empty.
+    """
+    try:
+        f = open(filename)
+    except EnvironmentError:
+        return scan_version_lines([])
+    with f:
+        return scan_version_lines(f)
+
+
+def scan_version_lines(lines):
+    """Classify a _version.py from its lines, reading no more than needed.
+
+    Returns a dict with 'kind' ("keywords" for a long _version.py, whose
+    git-archive keywords may or may not be expanded, "short" for one written
+    by write_to_version_file(), or None), 'lines' (the lines read, which
+    include every keyword assignment), and for a short file either
+    'versions' (the dict literal) or, if it came from an older versioneer,
+    'version_json'. Reading stops as soon as the kind is known: the keywords
+    all come before the end of get_keywords(), and nothing after the
+    versions matters.
+    """
+    scan = {"kind": None, "lines": [], "versions": None,
+            "version_json": None}
+    json_lines = None
+    for line in lines:
+        if json_lines is not None:
+            if VERSION_JSON_END.match(line):
+                scan["kind"] = "short"
+                scan["version_json"] = "".join(json_lines)
+                break
+            json_lines.append(line)
+            continue
+        scan["lines"].append(line)
+        mo = VERSIONS_LITERAL.match(line)
+        if mo:
+            scan["kind"] = "short"
+            scan["versions"] = mo.group(1)
+            break
+        if VERSION_JSON_START.search(line):
+            json_lines = []
+        elif KEYWORDS_END.match(line):
+            scan["kind"] = "keywords"
+            break
+    return scan
+
+
+def versions_from_file(filename):
+    """Try to determine the version from _version.py if present."""
+    return versions_from_scan(scan_version_file(filename))
+
+
+def versions_from_scan(scan):
+    """Parse the versions found by scan_version_lines(), if any.
+
+    The file is never imported or executed: the dict literal is read with
+    ast.literal_eval(), which accepts nothing but plain Python constants.
+    """
+    if scan["versions"] is not None:
+        import ast
+        try:
+            return ast.literal_eval(scan["versions"])
+        except (SyntaxError, ValueError):
+            raise NotThisMethod("unparseable versions in _version.py")
+    if scan["version_json"] is not None:
+        import json
+        return json.loads(scan["version_json"])
+    raise NotThisMethod("no versions in _version.py")
+
+
+def write_to_version_file(filename, versions):
+    """Write the given version number to the given _version.py file.
+
+    If the file already says exactly that, it is left alone, so that its
+    mtime only changes when the version does and no-op rebuilds stay no-op.
+    """
+    # sorted, so that the same versions always give the same file
+    literal = "{%s}" % ", ".join(["%r: %r" % (key, versions[key])
+                                  for key in sorted(versions)])
+    version = versions["version"]
+    contents = SHORT_VERSION_PY % (literal, version,
+                                   repr(version_tuple(version)),
+                                   repr(version_sort_key(version)))
+    try:
+        with open(filename, "r") as f:
+            unchanged = (f.read() == contents)
+    except EnvironmentError:
+        unchanged = False
+    if unchanged:
+        print("%s is already set to '%s'" % (filename, versions["version"]))
+        return
+
+    write_atomically(filename, contents)
+    print("set %s to '%s'" % (filename, versions["version"]))
+
+
+def write_atomically(filename, contents):
+    """Replace a file so that readers only ever see it whole.
+
+    The contents go to a temporary file next to the target, which is then
+    renamed over it, keeping the old file's permissions. Parallel builds of
+    one tree can therefore never catch the file missing or half-written.
+    Renaming also replaces a hardlink rather than writing through it, which
+    matters in sdist release trees, whose files may be hardlinks to the
+    originals in the source tree.
+    """
+    import tempfile
+    dirname, basename = os.path.split(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(dir=dirname, prefix=".%s." % basename,
+                               suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(contents)
+        try:
+            mode = os.stat(filename).st_mode & 0o7777
+        except OSError:
+            mode = 0o644  # mkstemp() makes it 0600
+        os.chmod(tmp, mode)
+        if hasattr(os, "replace"):
+            os.replace(tmp, filename)
+        else:
+            # python2: os.rename() cannot replace an existing file on windows
+            if sys.platform == "win32" and os.path.exists(filename):
+                os.unlink(filename)
+            os.rename(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+# _version.py files of at most this size are kept in memory while streaming
+# through a tarball, in case setup.cfg turns out to point at one of them
+ARCHIVE_BUFFER_LIMIT = 1024 * 1024
+
+
+def read_archive_members(path, verbose):
+    """Find and read setup.cfg and the versionfile inside an archive.
+
+    Returns (root, cfg, versionfile_text_or_None), where root is the
+    directory inside the archive that holds setup.cfg ("" if none), and cfg
+    is the VersioneerConfig parsed from it. Anything that is not a
+    readable tarball or zipfile raises NotThisMethod.
+    The project's setup.cfg is the one nearest the top that has a
+    [versioneer] section, so one in a subdirectory does not get in the way.
+    Nothing is unpacked to disk. Zipfiles are read through their index.
+    Tarballs (possibly compressed) are read as a stream: files named
+    _version.py are kept until setup.cfg has told us which one we want,
+    and if it was some other file that has already gone by, the archive is
+    streamed a second time to fetch it.
+    """
+    import tarfile
+    import zipfile
+    try:
+        if zipfile.is_zipfile(path):
+            return read_zipfile_members(path)
+        return read_tarball_members(path, verbose)
+    except (tarfile.TarError, zipfile.BadZipfile, EOFError) as e:
+        raise NotThisMethod("unable to read %s: %s" % (path, e))
+
+
+def read_zipfile_members(path):
+    """Like read_archive_members(), for a zipfile."""
+    import zipfile
+    z = zipfile.ZipFile(path)
+    try:
+        names = z.namelist()
+        root, cfg = find_archive_config(
+            dict((n, z.read(n)) for n in names
+                 if archive_depth(n) <= 1
+                 and n.rsplit("/", 1)[-1] == "setup.cfg"))
+        if cfg is None:
+            raise NotThisMethod("no setup.cfg in %s" % path)
+        versionfile = archive_join(root, cfg.versionfile_source)
+        contents = None
+        if versionfile in names:
+            contents = z.read(versionfile)
+    finally:
+        z.close()
+    return root, cfg, decode_member(contents)
+
+
+def read_tarball_members(path, verbose):
+    """Like read_archive_members(), for a (compressed) tarball."""
+    import tarfile
+    cfgs = {}
+    buffered = {}
+    versionfile = None
+    t = tarfile.open(path, "r|*")
+    try:
+        for member in t:
+            if not member.isfile():
+                continue
+            name = member.name
+            if name.startswith("./"):
+                name = name[2:]
+            basename = name.rsplit("/", 1)[-1]
+            if basename == "setup.cfg" and archive_depth(name) <= 1:
+                cfgs[name] = t.extractfile(member).read()
+                # 'git archive' without --prefix lists lib/setup.cfg before
+                # ./setup.cfg, so only a top-level one settles the question
+                # before the stream ends
+                if archive_depth(name) == 0:
+                    root, cfg = find_archive_config(cfgs)
+                    if root == "":
+                        versionfile = cfg.versionfile_source
+            elif (basename == "_version.py" and
+                  member.size <= ARCHIVE_BUFFER_LIMIT):
+                buffered[name] = t.extractfile(member).read()
+            # once a top-level setup.cfg and the file it names have gone
+            # by, we are done with the stream
+            if versionfile in buffered:
+                break
+    finally:
+        t.close()
+    if versionfile is None:
+        root, cfg = find_archive_config(cfgs)
+        if cfg is None:
+            raise NotThisMethod("no setup.cfg in %s" % path)
+        versionfile = archive_join(root, cfg.versionfile_source)
+    if versionfile not in buffered:
+        if verbose:
+            print("%s was not buffered, reading %s again"
+                  % (versionfile, path))
+        t = tarfile.open(path, "r|*")
+        try:
+            for member in t:
+                name = member.name
+                if name.startswith("./"):
+                    name = name[2:]
+                if name == versionfile and member.isfile():
+                    buffered[versionfile] = t.extractfile(member).read()
+                    break
+        finally:
+            t.close()
+    return root, cfg, decode_member(buffered.get(versionfile))
+
+
+def archive_depth(name):
+    """Count the directories above an archive member name."""
+    return name.strip("/").count("/")
+
+
+def archive_join(root, name):
+    """Join archive member names with '/', whatever the local os.sep is."""
+    if not root:
+        return name
+    return root + "/" + name
+
+
+def find_archive_config(setup_cfgs):
+    """Pick the project's config from {name: contents} of setup.cfg files.
+
+    The shallowest one with a [versioneer] section wins. Returns (root,
+    cfg), where root is the directory that holds it, or (None, None).
+    """
+    configparser = get_configparser()
+    for depth, name in sorted((archive_depth(n), n) for n in setup_cfgs):
+        try:
+            cfg = config_from_bytes(setup_cfgs[name])
+        except (configparser.NoSectionError,
+                configparser.MissingSectionHeaderError):
+            continue
+        return (name.rsplit("/", 1)[0] if "/" in name else ""), cfg
+    return None, None
+
+
+def decode_member(contents):
+    """Turn the bytes of an archive member into text."""
+    if contents is None:
+        return None
+    return contents.decode("utf-8", "replace")
+
+
+def config_from_bytes(contents):
+    """Parse Versioneer config from the bytes of a setup.cfg."""
+    import io
+    return get_config_from_file(io.StringIO(decode_member(contents)))
+
+
+def versions_from_archive(path, verbose=False):
+    """Get the version of the project in an sdist or git-archive tarball.
+
+    This reads setup.cfg and the versionfile straight out of the tarball or
+    zipfile, without unpacking it. It understands both a short _version.py
+    (as written by 'setup.py sdist') and a long one with expanded keywords
+    (as written by 'git archive'). If neither gives an answer, the name of
+    the archive's top-level directory is tried against parentdir_prefix.
+    """
+    root, cfg, contents = read_archive_members(path, verbose)
+    handlers = HANDLERS.get(cfg.VCS, {})
+
+    if contents is not None:
+        scan = scan_version_lines(contents.splitlines(True))
+        keywords_f = handlers.get("keywords_from_lines")
+        from_keywords_f = handlers.get("keywords")
+        if keywords_f and from_keywords_f and scan["kind"] != "short":
+            try:
+                keywords = keywords_f(scan["lines"])
+                ver = from_keywords_f(keywords, cfg.tag_prefix, verbose,
+                                      style=cfg.style,
+                                      short_hash_length=cfg.short_hash_length)
+                if verbose:
+                    print("got version from expanded keyword %s" % ver)
+                return ver
+            except NotThisMethod:
+                pass
+
+        try:
+            ver = versions_from_scan(scan)
+            if verbose:
+                print("got version from file %s" % ver)
+            return ver
+        except NotThisMethod:
+            pass
+
+    try:
+        if cfg.parentdir_prefix and root:
+            ver = versions_from_parentdir(cfg.parentdir_prefix, root, verbose)
+            if verbose:
+                print("got version from parentdir %s" % ver)
+            return ver
+    except NotThisMethod:
+        pass
+
+    return {"version": "0+unknown", "full-revisionid": None,
+            "dirty": None, "error": "unable to compute version"}
+
+
+def plus_or_dot(pieces):
+    """Return a + if we don't already have one, else return a ."""
+    if "+" in pieces.get("closest-tag", ""):
+        return "."
+    return "+"
+
+
+def render_pep440(pieces):
+    """Build up version string, with post-release "local version identifier".
+
+    Our goal: TAG[+DISTANCE.gHEX[.dirty]] . Note that if you
+    get a tagged build and then dirty it, you'll get TAG+0.gHEX.dirty
+
+    Exceptions:
+    1: no tags. git_describe was just HEX. 0+untagged.DISTANCE.gHEX[.dirty]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += plus_or_dot(pieces)
+            rendered += "%d.g%s" % (pieces["distance"], pieces["short"])
+            if pieces["dirty"]:
+                rendered += ".dirty"
+    else:
+        # exception #1
+        rendered = "0+untagged.%d.g%s" % (pieces["distance"],
+                                          pieces["short"])
+        if pieces["dirty"]:
+            rendered += ".dirty"
+    return rendered
+
+
+def render_pep440_pre(pieces):
+    """TAG[.post.devDISTANCE] -- No -dirty.
+
+    Exceptions:
+    1: no tags. 0.post.devDISTANCE
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"]:
+            rendered += ".post.dev%d" % pieces["distance"]
+    else:
+        # exception #1
+        rendered = "0.post.dev%d" % pieces["distance"]
+    return rendered
+
+
+def render_pep440_post(pieces):
+    """TAG[.postDISTANCE[.dev0]+gHEX] .
+
+    The ".dev0" means dirty. Note that .dev0 sorts backwards
+    (a dirty tree will appear "older" than the corresponding clean one),
+    but you shouldn't be releasing software with -dirty anyways.
+
+    Exceptions:
+    1: no tags. 0.postDISTANCE[.dev0]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += ".post%d" % pieces["distance"]
+            if pieces["dirty"]:
+                rendered += ".dev0"
+            rendered += plus_or_dot(pieces)
+            rendered += "g%s" % pieces["short"]
+    else:
+        # exception #1
+        rendered = "0.post%d" % pieces["distance"]
+        if pieces["dirty"]:
+            rendered += ".dev0"
+        rendered += "+g%s" % pieces["short"]
+    return rendered
+
+
+def render_pep440_old(pieces):
+    """TAG[.postDISTANCE[.dev0]] .
+
+    The ".dev0" means dirty.
+
+    Eexceptions:
+    1: no tags. 0.postDISTANCE[.dev0]
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"] or pieces["dirty"]:
+            rendered += ".post%d" % pieces["distance"]
+            if pieces["dirty"]:
+                rendered += ".dev0"
+    else:
+        # exception #1
+        rendered = "0.post%d" % pieces["distance"]
+        if pieces["dirty"]:
+            rendered += ".dev0"
+    return rendered
+
+
+def render_git_describe(pieces):
+    """TAG[-DISTANCE-gHEX][-dirty].
+
+    Like 'git describe --tags --dirty --always'.
+
+    Exceptions:
+    1: no tags. HEX[-dirty]  (note: no 'g' prefix)
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        if pieces["distance"]:
+            rendered += "-%d-g%s" % (pieces["distance"], pieces["short"])
+    else:
+        # exception #1
+        rendered = pieces["short"]
+    if pieces["dirty"]:
+        rendered += "-dirty"
+    return rendered
+
+
+def render_git_describe_long(pieces):
+    """TAG-DISTANCE-gHEX[-dirty].
+
+    Like 'git describe --tags --dirty --always -long'.
+    The distance/hash is unconditional.
+
+    Exceptions:
+    1: no tags. HEX[-dirty]  (note: no 'g' prefix)
+    """
+    if pieces["closest-tag"]:
+        rendered = pieces["closest-tag"]
+        rendered += "-%d-g%s" % (pieces["distance"], pieces["short"])
+    else:
+        # exception #1
+        rendered = pieces["short"]
+    if pieces["dirty"]:
+        rendered += "-dirty"
+    return rendered
+
+
+def render(pieces, style):
+    """Render the given version pieces into the requested style."""
+    if pieces["error"]:
+        return {"version": "unknown",
+                "full-revisionid": pieces.get("long"),
+                "dirty": None,
+                "error": pieces["error"]}
+
+    if not style or style == "default":
+        style = "pep440"  # the default
+
+    # each style is tested separately, so that 'versioneer.py setup' can
+    # leave out the ones a project doesn't use
+    rendered = None
+    if style == "pep440":
+        rendered = render_pep440(pieces)
+    if style == "pep440-pre":
+        rendered = render_pep440_pre(pieces)
+    if style == "pep440-post":
+        rendered = render_pep440_post(pieces)
+    if style == "pep440-old":
+        rendered = render_pep440_old(pieces)
+    if style == "git-describe":
+        rendered = render_git_describe(pieces)
+    if style == "git-describe-long":
+        rendered = render_git_describe_long(pieces)
+    if rendered is None:
+        raise ValueError("unknown style '%s'" % style)
+
+    return {"version": rendered, "full-revisionid": pieces["long"],
+            "dirty": pieces["dirty"], "error": None}
+
+
+# the normalized PEP 440 versions that the pep440* styles produce. The
+# git-describe styles, and tags that are not PEP 440 versions, won't match.
+PEP440_VERSION_RE = re.compile(r"""^(?:(?P<epoch>\d+)!)?
+    (?P<release>\d+(?:\.\d+)*)
+    (?:(?P<pre_l>a|b|rc)(?P<pre_n>\d+))?
+    (?:\.post(?P<post>\d*))?
+    (?:\.dev(?P<dev>\d*))?
+    (?:\+(?P<local>[a-z0-9]+(?:\.[a-z0-9]+)*))?$""", re.I | re.X)
+
+
+def version_tuple(version):
+    """Split a rendered version string into a tuple, or return None.
+
+    The release numbers become ints, and any pre-, post-, dev-release or
+    local part becomes one string each, so "1.2.post3.dev0+gabc" gives
+    (1, 2, "post3", "dev0", "gabc"). This makes 'version_tuple[:2] >=
+    (1, 2)' checks cheap. For full PEP 440 ordering, use
+    version_sort_key().
+    """
+    mo = PEP440_VERSION_RE.match(version)
+    if not mo:
+        return None
+    parts = [int(n) for n in mo.group("release").split(".")]
+    if mo.group("pre_l"):
+        parts.append(mo.group("pre_l").lower() + mo.group("pre_n"))
+    if mo.group("post") is not None:
+        parts.append("post" + (mo.group("post") or "0"))
+    if mo.group("dev") is not None:
+        parts.append("dev" + (mo.group("dev") or "0"))
+    if mo.group("local"):
+        parts.append(mo.group("local"))
+    return tuple(parts)
+
+
+def version_sort_key(version):
+    """Return a tuple that sorts like the PEP 440 version, or None.
+
+    Keys compare with plain tuple comparison, and follow the same rules as
+    'packaging.version.Version': dev releases sort before pre-releases,
+    which sort before the release, which sorts before its post-releases,
+    and a local version sorts after the same version without one.
+    """
+    mo = PEP440_VERSION_RE.match(version)
+    if not mo:
+        return None
+    epoch = int(mo.group("epoch") or 0)
+    release = [int(n) for n in mo.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()  # 1.0 == 1.0.0
+    pre_l, post, dev = mo.group("pre_l"), mo.group("post"), mo.group("dev")
+    # (rank, number): a dev release of the release itself comes first, then
+    # alpha, beta and release candidates, then the release itself
+    if pre_l:
+        pre = (["a", "b", "rc"].index(pre_l.lower()) + 1,
+               int(mo.group("pre_n")))
+    elif post is None and dev is not None:
+        pre = (0, 0)
+    else:
+        pre = (4, 0)
+    post = -1 if post is None else int(post or 0)
+    dev = (1, 0) if dev is None else (0, int(dev or 0))
+    # numeric local segments sort after alphanumeric ones
+    local = []
+    if mo.group("local"):
+        for segment in mo.group("local").lower().split("."):
+            if segment.isdigit():
+                local.append((1, int(segment), ""))
+            else:
+                local.append((0, 0, segment))
+    return (epoch, tuple(release), pre, post, dev, tuple(local))
+
+
+class VersioneerBadRootError(Exception):
+
+    """The project root directory is unknown or missing key files."""
+
+
+# the most recent version computed from the VCS for each project root, used
+# as a fallback if a later VCS query runs past the configured timeout
+LAST_VCS_VERSIONS = {}
+
+# a directory of 'git describe' results to share between checkouts, which
+# wins over [versioneer]cache_dir=
+CACHE_DIR_ENV = "VERSIONEER_CACHE_DIR"
+
+
+def get_versions(verbose=False, use_manifest=True):
+    """Get the project version from whatever source is available.
+
+    Returns dict with two keys: 'version' and 'full'.
+
+    If a version manifest is configured and lists this project, its entry
+    is returned without looking anywhere else, unless use_manifest=False.
+    """
+    root = get_root()
+    other = get_versioneer_for_root(root)
+    if other is not None:
+        if use_manifest:
+            return other.get_versions(verbose)
+        return other.get_versions(verbose, use_manifest=False)
+    cfg = get_config_from_root(root)
+
+    assert cfg.VCS is not None, "please set [versioneer]VCS= in setup.cfg"
+    handlers = HANDLERS.get(cfg.VCS)
+    assert handlers, "unrecognized VCS '%s'" % cfg.VCS
+    verbose = verbose or cfg.verbose
+    assert cfg.versionfile_source is not None, \
+        "please set versioneer.versionfile_source"
+    assert cfg.tag_prefix is not None, "please set versioneer.tag_prefix"
+
+    versionfile_abs = os.path.join(root, cfg.versionfile_source)
+
+    # the whole lookup below must finish within cfg.timeout seconds. Only the
+    # VCS step runs external commands, so that is where the deadline bites.
+    deadline = None
+    if cfg.timeout is not None:
+        deadline = time.time() + cfg.timeout
+    timeout_error = None
+
+    manifest = get_manifest_path(root, cfg) if use_manifest else None
+    if manifest:
+        try:
+            ver = versions_from_manifest(manifest, root, cfg.project_name,
+                                         verbose)
+            if verbose:
+                print("got version from manifest %s" % ver)
+            return ver
+        except NotThisMethod:
+            pass
+
+    # extract version from the first strategy that works, in the order given
+    # by [versioneer]strategies=. By default that is _version.py (keywords
+    # expanded by 'git archive', then the short file written by 'setup.py
+    # sdist'), CI environment variables (if enabled), VCS command (e.g. 'git
+    # describe'), parentdir. This is meant to work for developers using a
+    # source checkout, for users of a tarball created by 'setup.py sdist', for
+    # CI jobs, and for users of a tarball/zipball created by 'git archive' or
+    # github's download-from-tag feature or the equivalent in other VCSes.
+
+    scan = None
+    for strategy in cfg.strategies:
+        if strategy in ("keywords", "file") and scan is None:
+            # both of these look at _version.py, so read it once
+            scan = scan_version_file(versionfile_abs)
+
+        if strategy == "keywords":
+            keywords_f = handlers.get("keywords_from_lines")
+            from_keywords_f = handlers.get("keywords")
+            if keywords_f and from_keywords_f and scan["kind"] != "short":
+                try:
+                    keywords = keywords_f(scan["lines"])
+                    ver = from_keywords_f(
+                        keywords, cfg.tag_prefix, verbose, style=cfg.style,
+                        short_hash_length=cfg.short_hash_length)
+                    if verbose:
+                        print("got version from expanded keyword %s" % ver)
+                    return ver
+                except NotThisMethod:
+                    pass
+
+        elif strategy == "file":
+            try:
+                ver = versions_from_scan(scan)
+                if verbose:
+                    print("got version from file %s %s"
+                          % (versionfile_abs, ver))
+                return ver
+            except NotThisMethod:
+                pass
+
+        elif strategy == "env":
+            try:
+                pieces = pieces_from_env(
+                    cfg.tag_prefix, verbose,
+                    short_hash_length=cfg.short_hash_length)
+                ver = render(pieces, cfg.style)
+                if verbose:
+                    print("got version from environment %s" % ver)
+                return ver
+            except NotThisMethod:
+                pass
+
+        elif strategy == "vcs":
+            from_vcs_f = handlers.get("pieces_from_vcs")
+            if not from_vcs_f:
+                continue
+            cache_dir = os.environ.get(CACHE_DIR_ENV) or cfg.cache_dir
+            from_cache_f = handlers.get("pieces_from_cache")
+            try:
+                if cache_dir and from_cache_f:
+                    pieces = from_cache_f(
+                        cfg.tag_prefix, root, verbose,
+                        os.path.expanduser(cache_dir), cfg.cache_size,
+                        first_parent=cfg.first_parent,
+                        short_hash_length=cfg.short_hash_length,
+                        deadline=deadline)
+                else:
+                    pieces = from_vcs_f(
+                        cfg.tag_prefix, root, verbose,
+                        first_parent=cfg.first_parent,
+                        short_hash_length=cfg.short_hash_length,
+                        deadline=deadline)
+                ver = render(pieces, cfg.style)
+                if verbose:
+                    print("got version from VCS %s" % ver)
+                LAST_VCS_VERSIONS[root] = ver
+                return ver
+            except NotThisMethod:
+                pass
+            except CommandTimeoutError as e:
+                timeout_error = ("VCS lookup exceeded the %ss timeout: %s"
+                                 % (cfg.timeout, e))
+                if verbose:
+                    print(timeout_error)
+                if root in LAST_VCS_VERSIONS:
+                    ver = dict(LAST_VCS_VERSIONS[root])
+                    ver["error"] = timeout_error
+                    if verbose:
+                        print("using previously computed version %s" % ver)
+                    return ver
+
+        elif strategy == "parentdir":
+            try:
+                if cfg.parentdir_prefix:
+                    ver = versions_from_parentdir(cfg.parentdir_prefix, root,
+                                                  verbose)
+                    if verbose:
+                        print("got version from parentdir %s" % ver)
+                    if timeout_error:
+                        ver["error"] = timeout_error
+                    return ver
+            except NotThisMethod:
+                pass
+
+    if verbose:
+        print("unable to compute version")
+
+    return {"version": "0+unknown", "full-revisionid": None,
+            "dirty": None,
+            "error": timeout_error or "unable to compute version"}
+
+
+def get_version():
+    """Get the short version string for this project."""
+    return get_versions()["version"]
+
+
+def version_inputs(root, cfg):
+    """List the files that get_versions() looks at, as (how, path) pairs.
+
+    'how' is "read" for files whose contents matter and "stat" for those
+    where a change of mtime or size is enough to notice.
+    """
+    inputs = [("read", os.path.join(root, "setup.cfg"))]
+    if cfg.versionfile_source:
+        inputs.append(("stat", os.path.join(root, cfg.versionfile_source)))
+    manifest = get_manifest_path(root, cfg)
+    if manifest:
+        inputs.append(("stat", manifest))
+    if "vcs" in cfg.strategies:
+        inputs_f = HANDLERS.get(cfg.VCS, {}).get("fingerprint_inputs")
+        if inputs_f:
+            inputs.extend(inputs_f(root))
+    return inputs
+
+
+def version_fingerprint(root):
+    """Return a digest of everything that can change the project's version.
+
+    This covers setup.cfg, _version.py, the manifest, the project directory
+    name, the CI environment variables (if the 'env' strategy is enabled)
+    and the VCS state that get_versions() would look at: for git that is
+    HEAD, the current branch, the tags, packed-refs, the index and config.
+    It only reads and stat()s files, and never runs the VCS, so a build
+    system can compute it cheaply and only call get_versions() (or
+    setup.py) when it changes.
+
+    Edits to tracked files only show up once git has refreshed its index
+    (which e.g. running 'git status' or 'git diff' yourself will do, but
+    Versioneer's own read-only queries do not), so a tree that has just
+    become dirty may keep its old fingerprint until then.
+    """
+    import hashlib
+    root = os.path.realpath(root)
+    cfg = get_config_from_root(root)
+    inputs = version_inputs(root, cfg)
+
+    h = hashlib.sha1()
+
+    def add(*values):
+        h.update(repr(values).encode("utf-8"))
+    add("root", root)
+    if "env" in cfg.strategies:
+        names = ["VERSIONEER_FULL_REVISIONID", "VERSIONEER_CLOSEST_TAG",
+                 "VERSIONEER_DISTANCE", "VERSIONEER_DIRTY"]
+        for commit_var, tag_var, tag_is_ref in CI_ENV_VARIABLES:
+            names.extend([commit_var, tag_var])
+        for name in names:
+            add("env", name, os.environ.get(name))
+    for how, path in inputs:
+        try:
+            if how == "read":
+                with open(path, "rb") as f:
+                    add(how, path, f.read())
+            else:
+                st = os.stat(path)
+                add(how, path, st.st_mtime, st.st_size, st.st_ino)
+        except EnvironmentError:
+            add(how, path, None)
+    return h.hexdigest()
+
+
+def depfile_escape(path):
+    """Quote a path for a Make (or Ninja) depfile."""
+    return path.replace(" ", "\\ ").replace("#", "\\#").replace("$", "$$")
+
+
+def write_depfile(filename, target, root):
+    """Write a depfile saying that target depends on the version inputs.
+
+    Only inputs that exist are listed, each with an empty rule of its own
+    (like 'gcc -MP'), so that make does not fail once git removes one, e.g.
+    a loose ref after 'git pack-refs'.
+    """
+    root = os.path.realpath(root)
+    cfg = get_config_from_root(root)
+    paths = []
+    for how, path in version_inputs(root, cfg):
+        if os.path.exists(path) and path not in paths:
+            paths.append(path)
+    lines = ["%s:%s" % (depfile_escape(target), " \\" if paths else "")]
+    for i, path in enumerate(paths):
+        last = (i == len(paths) - 1)
+        lines.append("  %s%s" % (depfile_escape(path), "" if last else " \\"))
+    for path in paths:
+        lines.append("")
+        lines.append("%s:" % depfile_escape(path))
+    write_atomically(filename, "\n".join(lines) + "\n")
+
+
+def copy_to_overlay(overlay, root, versionfile_source):
+    """Copy the package holding versionfile_source into the overlay dir.
+
+    The whole top-level package is copied, since that is what the module
+    finder will pick up once the overlay is first on the search path.
+    Returns the path of the copied versionfile.
+    """
+    import shutil
+    source = os.path.join(root, versionfile_source)
+    top = os.path.dirname(source)
+    if not os.path.exists(os.path.join(top, "__init__.py")):
+        # _version.py is a top-level module, not part of a package
+        shutil.copy(source, overlay)
+        return os.path.join(overlay, os.path.basename(source))
+    while os.path.exists(os.path.join(os.path.dirname(top), "__init__.py")):
+        top = os.path.dirname(top)
+    copy = os.path.join(overlay, os.path.basename(top))
+    shutil.copytree(top, copy,
+                    ignore=shutil.ignore_patterns("*.pyc", "__pycache__"))
+    return os.path.join(copy, os.path.relpath(source, top))
+
+
+def get_cmdclass():
+    """Get the custom setuptools/distutils subclasses used by Versioneer."""
+    # this fixes the "python setup.py develop" case (also 'install' and
+    # 'easy_install .'), in which subdependencies of the main project are
+    # built (using setup.py bdist_egg) in the same python process, and a
+    # dependency's setup.py may get the main project's versioneer.
+    try:
+        other = get_versioneer_for_root(get_root())
+    except VersioneerBadRootError:
+        other = None  # get_versions() will complain later, if it is used
+    if other is not None:
+        return other.get_cmdclass()
+
+    cmds = {}
+
+    # we add "version" to both distutils and setuptools
+    from distutils.core import Command
+
+    class cmd_version(Command):
+        description = "report generated version string"
+        user_options = [("depfile=", None,
+                         "also write a make/ninja depfile of the files the "
+                         "version depends on"),
+                        ("depfile-target=", None,
+                         "the target named in the depfile "
+                         "[the depfile name without its extension]")]
+        boolean_options = []
+
+        def initialize_options(self):
+            self.depfile = None
+            self.depfile_target = None
+
+        def finalize_options(self):
+            if self.depfile and self.depfile_target is None:
+                self.depfile_target = os.path.splitext(self.depfile)[0]
+
+        def run(self):
+            vers = get_versions(verbose=True)
+            print("Version: %s" % vers["version"])
+            print(" full-revisionid: %s" % vers.get("full-revisionid"))
+            print(" dirty: %s" % vers.get("dirty"))
+            if vers["error"]:
+                print(" error: %s" % vers["error"])
+            if self.depfile:
+                write_depfile(self.depfile, self.depfile_target, get_root())
+    cmds["version"] = cmd_version
+
+    # we override "build_py" in both distutils and setuptools
+    #
+    # most invocation pathways end up running build_py:
+    #  distutils/build -> build_py
+    #  distutils/install -> distutils/build ->..
+    #  setuptools/bdist_wheel -> distutils/install ->..
+    #  setuptools/bdist_egg -> distutils/install_lib -> build_py
+    #  setuptools/install -> bdist_egg ->..
+    #  setuptools/develop -> ?
+
+    # we override different "build_py" commands for both environments
+    if "setuptools" in sys.modules:
+        from setuptools.command.build_py import build_py as _build_py
+    else:
+        from distutils.command.build_py import build_py as _build_py
+
+    class cmd_build_py(_build_py):
+        def run(self):
+            root = get_root()
+            cfg = get_config_from_root(root)
+            versions = get_versions()
+            _build_py.run(self)
+            # now locate _version.py in the new build/ directory and replace
+            # it with an updated value
+            if cfg.versionfile_build:
+                target_versionfile = os.path.join(self.build_lib,
+                                                  cfg.versionfile_build)
+                print("UPDATING %s" % target_versionfile)
+                write_to_version_file(target_versionfile, versions)
+    cmds["build_py"] = cmd_build_py
+
+    if "cx_Freeze" in sys.modules:  # cx_freeze enabled?
+        from cx_Freeze.dist import build_exe as _build_exe
+
+        class cmd_build_exe(_build_exe):
+            def run(self):
+                import shutil
+                import tempfile
+                root = get_root()
+                cfg = get_config_from_root(root)
+                versions = get_versions()
+                # freeze a copy of the package, with a short _version.py,
+                # that sits ahead of the source tree on the module search
+                # path. The source tree itself is never modified, so its
+                # bytecode stays valid and parallel freezes cannot collide.
+                overlay = tempfile.mkdtemp(prefix="versioneer-build_exe-")
+                try:
+                    target_versionfile = copy_to_overlay(
+                        overlay, root, cfg.versionfile_source)
+                    print("UPDATING %s" % target_versionfile)
+                    write_to_version_file(target_versionfile, versions)
+                    self.path = [overlay] + list(self.path or sys.path)
+                    _build_exe.run(self)
+                finally:
+                    shutil.rmtree(overlay)
+        cmds["build_exe"] = cmd_build_exe
+        del cmds["build_py"]
+
+    # we override different "sdist" commands for both environments
+    if "setuptools" in sys.modules:
+        from setuptools.command.sdist import sdist as _sdist
+    else:
+        from distutils.command.sdist import sdist as _sdist
+
+    class cmd_sdist(_sdist):
+        def run(self):
+            versions = get_versions()
+            self._versioneer_generated_versions = versions
+            # unless we update this, the command will keep using the old
+            # version
+            self.distribution.metadata.version = versions["version"]
+            return _sdist.run(self)
+
+        def make_release_tree(self, base_dir, files):
+            root = get_root()
+            cfg = get_config_from_root(root)
+            _sdist.make_release_tree(self, base_dir, files)
+            # now locate _version.py in the new base_dir directory
+            # (remembering that it may be a hardlink) and replace it with an
+            # updated value
+            target_versionfile = os.path.join(base_dir, cfg.versionfile_source)
+            print("UPDATING %s" % target_versionfile)
+            write_to_version_file(target_versionfile,
+                                  self._versioneer_generated_versions)
+    cmds["sdist"] = cmd_sdist
+
+    return cmds
+
+
+CONFIG_ERROR = """
+setup.cfg is missing the necessary Versioneer configuration. You need
+a section like:
+
+ [versioneer]
+ VCS = git
+ style = pep440
+ versionfile_source = src/myproject/_version.py
+ versionfile_build = myproject/_version.py
+ tag_prefix =
+ parentdir_prefix = myproject-
+
+You will also need to edit your setup.py to use the results:
+
+ import versioneer
+ setup(version=versioneer.get_version(),
+       cmdclass=versioneer.get_cmdclass(), ...)
+
+Please read the docstring in ./versioneer.py for configuration instructions,
+edit setup.cfg, and re-run the installer or 'python versioneer.py setup'.
+"""
+
+SAMPLE_CONFIG = """
+# See the docstring in versioneer.py for instructions. Note that you must
+# re-run 'versioneer.py setup' after changing this section, and commit the
+# resulting files.
+
+[versioneer]
+#VCS = git
+#style = pep440
+#versionfile_source =
+#versionfile_build =
+#tag_prefix =
+#parentdir_prefix =
+
+"""
+
+INIT_PY_SNIPPET = """
+from ._version import get_versions
+__version__ = get_versions()['version']
+del get_versions
+"""
+
+
+def get_long_version_py(vcs):
+    """Return the _version.py template for the given VCS."""
+    if vcs not in LONG_VERSION_PY and vcs in LONG_VERSION_PY_COMPRESSED:
+        import base64
+        import zlib
+        compressed = base64.b64decode(LONG_VERSION_PY_COMPRESSED[vcs])
+        LONG_VERSION_PY[vcs] = zlib.decompress(compressed).decode("utf-8")
+    return LONG_VERSION_PY[vcs]
+
+
+def trim_sections(text, keep):
+    """Drop the sections of a template that keep(kind, names) turns down.
+
+    A section starts with a '# --BEGIN KIND [NAME...]' line and ends with
+    a '# --END KIND' line, and sections may be nested. The marker lines
+    themselves are always removed.
+    """
+    lines = []
+    kept = []  # one entry for each section we are in
+    for line in text.split("\n"):
+        marker = line.strip()
+        if marker.startswith("# --BEGIN "):
+            words = marker.split()[2:]
+            kept.append(keep(words[0], words[1:]))
+        elif marker.startswith("# --END "):
+            kept.pop()
+        elif all(kept):
+            lines.append(line)
+    # dropped sections leave the blank lines around them behind: allow two
+    # between top-level definitions, and one inside an indented block
+    text = re.sub(r"\n{4,}", "\n\n\n", "\n".join(lines))
+    return re.sub(r"\n{3,}(?=[ \t])", "\n\n", text)
+
+
+def trim_long_version_py(text, cfg):
+    """Cut a _version.py template down to the style and strategies in cfg.
+
+    Renderers for other styles, and the code behind strategies that are
+    not enabled (e.g. all of the git subprocess handling, for a project
+    that only uses keywords and parentdir), are left out of the file.
+    """
+    style = cfg.style
+    if not style or style == "default":
+        style = "pep440"
+
+    def keep(kind, names):
+        if kind == "STYLE":
+            return style in names
+        if kind == "STRATEGY":
+            return any(name in cfg.strategies for name in names)
+        return True
+    return trim_sections(text, keep)
+
+
+def do_setup():
+    """Main VCS-independent setup function for installing Versioneer."""
+    configparser = get_configparser()
+    root = get_root()
+    try:
+        cfg = get_config_from_root(root)
+    except (EnvironmentError, configparser.Error) as e:
+        if isinstance(e, (EnvironmentError, configparser.NoSectionError)):
+            print("Adding sample versioneer config to setup.cfg",
+                  file=sys.stderr)
+            with open(os.path.join(root, "setup.cfg"), "a") as f:
+                f.write(SAMPLE_CONFIG)
+        elif not isinstance(e, configparser.NoOptionError):
+            print("Error in setup.cfg: %s" % e, file=sys.stderr)
+        print(CONFIG_ERROR, file=sys.stderr)
+        return 1
+
+    print(" creating %s" % cfg.versionfile_source)
+    with open(cfg.versionfile_source, "w") as f:
+        LONG = trim_long_version_py(get_long_version_py(cfg.VCS), cfg)
+        f.write(LONG % {"DOLLAR": "$",
+                        "STYLE": cfg.style,
+                        "TAG_PREFIX": cfg.tag_prefix,
+                        "DESCRIBE": "%%(describe:tags=true,match=%s*)"
+                                    % cfg.tag_prefix,
+                        "PARENTDIR_PREFIX": cfg.parentdir_prefix,
+                        "VERSIONFILE_SOURCE": cfg.versionfile_source,
+                        "FIRST_PARENT": cfg.first_parent,
+                        "SHORT_HASH_LENGTH": cfg.short_hash_length,
+                        "STRATEGIES": cfg.strategies,
+                        })
+
+    ipy = os.path.join(os.path.dirname(cfg.versionfile_source),
+                       "__init__.py")
+    if os.path.exists(ipy):
+        try:
+            with open(ipy, "r") as f:
+                old = f.read()
+        except EnvironmentError:
+            old = ""
+        if INIT_PY_SNIPPET not in old:
+            print(" appending to %s" % ipy)
+            with open(ipy, "a") as f:
+                f.write(INIT_PY_SNIPPET)
+        else:
+            print(" %s unmodified" % ipy)
+    else:
+        print(" %s doesn't exist, ok" % ipy)
+        ipy = None
+
+    # Make sure both the top-level "versioneer.py" and versionfile_source
+    # (PKG/_version.py, used by runtime code) are in MANIFEST.in, so
+    # they'll be copied into source distributions. Pip won't be able to
+    # install the package without this.
+    manifest_in = os.path.join(root, "MANIFEST.in")
+    simple_includes = set()
+    try:
+        with open(manifest_in, "r") as f:
+            for line in f:
+                if line.startswith("include "):
+                    for include in line.split()[1:]:
+                        simple_includes.add(include)
+    except EnvironmentError:
+        pass
+    # That doesn't cover everything MANIFEST.in can do
+    # (http://docs.python.org/2/distutils/sourcedist.html#commands), so
+    # it might give some false negatives. Appending redundant 'include'
+    # lines is safe, though.
+    if "versioneer.py" not in simple_includes:
+        print(" appending 'versioneer.py' to MANIFEST.in")
+        with open(manifest_in, "a") as f:
+            f.write("include versioneer.py\n")
+    else:
+        print(" 'versioneer.py' already in MANIFEST.in")
+    if cfg.versionfile_source not in simple_includes:
+        print(" appending versionfile_source ('%s') to MANIFEST.in" %
+              cfg.versionfile_source)
+        with open(manifest_in, "a") as f:
+            f.write("include %s\n" % cfg.versionfile_source)
+    else:
+        print(" versionfile_source already in MANIFEST.in")
+
+    # Make VCS-specific changes. For git, this means creating/changing
+    # .gitattributes to mark _version.py for export-time keyword
+    # substitution.
+    do_vcs_install(manifest_in, cfg.versionfile_source, ipy)
+    return 0
+
+
+def scan_setup_py():
+    """Validate the contents of setup.py against Versioneer's expectations."""
+    found = set()
+    setters = False
+    errors = 0
+    with open("setup.py", "r") as f:
+        for line in f.readlines():
+            if "import versioneer" in line:
+                found.add("import")
+            if "versioneer.get_cmdclass()" in line:
+                found.add("cmdclass")
+            if "versioneer.get_version()" in line:
+                found.add("get_version")
+            if "versioneer.VCS" in line:
+                setters = True
+            if "versioneer.versionfile_source" in line:
+                setters = True
+    if len(found) != 3:
+        print("")
+        print("Your setup.py appears to be missing some important items")
+        print("(but I might be wrong). Please make sure it has something")
+        print("roughly like the following:")
+        print("")
+        print(" import versioneer")
+        print(" setup( version=versioneer.get_version(),")
+        print("        cmdclass=versioneer.get_cmdclass(),  ...)")
+        print("")
+        errors += 1
+    if setters:
+        print("You should remove lines like 'versioneer.VCS = ' and")
+        print("'versioneer.versionfile_source = ' . This configuration")
+        print("now lives in setup.cfg, and should be removed from setup.py")
+        print("")
+        errors += 1
+    return errors
+
+
+def do_manifest(args):
+    """Add this project's current versions to a version manifest."""
+    root = get_root()
+    cfg = get_config_from_root(root)
+    if args:
+        manifest = os.path.abspath(args[0])
+    else:
+        manifest = get_manifest_path(root, cfg)
+    if not manifest:
+        print("usage: versioneer.py manifest [MANIFEST]", file=sys.stderr)
+        print("(or set $VERSIONEER_MANIFEST, or 'manifest =' in setup.cfg)",
+              file=sys.stderr)
+        return 1
+    versions = get_versions(use_manifest=False)
+    write_manifest_entry(manifest, root, cfg.project_name, versions)
+    return 0
+
+
+def do_archive(paths):
+    """Print the version of each sdist or git-archive, one JSON per line."""
+    if not paths:
+        print("usage: versioneer.py archive ARCHIVE...", file=sys.stderr)
+        return 1
+    import json
+    configparser = get_configparser()
+    errors = 0
+    for path in paths:
+        try:
+            versions = versions_from_archive(path)
+        except (NotThisMethod, EnvironmentError,
+                configparser.Error) as e:
+            print("%s: %s" % (path, e), file=sys.stderr)
+            errors += 1
+            continue
+        versions["archive"] = path
+        print(json.dumps(versions, sort_keys=True))
+    return errors
+
+
+def do_version(args):
+    """Print the version, without importing setuptools or distutils."""
+    usage = "usage: versioneer.py version [--json | --field NAME]"
+    if args and args[0].startswith("--field="):
+        args = ["--field", args[0][len("--field="):]]
+    if args not in ([], ["--json"]) and not (len(args) == 2
+                                             and args[0] == "--field"):
+        print(usage, file=sys.stderr)
+        return 1
+    versions = get_versions()
+    if not args:
+        print(versions["version"])
+    elif args[0] == "--json":
+        import json
+        print(json.dumps(versions, sort_keys=True))
+    else:
+        if args[1] not in versions:
+            print("unknown field '%s', try one of: %s"
+                  % (args[1], ", ".join(sorted(versions))), file=sys.stderr)
+            return 1
+        value = versions[args[1]]
+        print("" if value is None else value)
+    return 0
+
+
+def do_pointer(copies):
+    """Write a pointer file naming this checkout, see git_root_from_pointer().
+
+    It goes into the project root (so copies of the tree take it along), or
+    into each of the given copies instead.
+    """
+    import json
+    root = get_root()
+    if not os.path.exists(os.path.join(root, ".git")):
+        print("%s has no .git to point at" % root, file=sys.stderr)
+        return 1
+    contents = json.dumps({"root": root}, sort_keys=True) + "\n"
+    for copy in copies or [root]:
+        pointer = os.path.join(copy, POINTER_FILE)
+        write_atomically(pointer, contents)
+        print(" wrote %s" % pointer)
+    return 0
+
+
+def do_fingerprint(roots):
+    """Print the version fingerprint of each project root (default: ours)."""
+    configparser = get_configparser()
+    errors = 0
+    for root in roots or [get_root()]:
+        try:
+            print(version_fingerprint(root))
+        except (EnvironmentError, configparser.Error) as e:
+            print("%s: %s" % (root, e), file=sys.stderr)
+            errors += 1
+    return errors
+
+if __name__ == "__main__":
+    cmd = sys.argv[1]
+    if cmd == "setup":
+        errors = do_setup()
+        errors += scan_setup_py()
+        if errors:
+            sys.exit(1)
+    elif cmd == "manifest":
+        if do_manifest(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "archive":
+        if do_archive(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "version":
+        if do_version(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "pointer":
+        if do_pointer(sys.argv[2:]):
+            sys.exit(1)
+    elif cmd == "fingerprint":
+        if do_fingerprint(sys.argv[2:]):
+            sys.exit(1)